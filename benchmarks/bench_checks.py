@@ -0,0 +1,263 @@
+"""Benchmark the pattern matching and sdist/VCS comparison hot paths.
+
+Synthetic file listings shaped like a copier-templated project are checked
+against the copier-derived pattern sets (``cpp``, ``js``, ``rust``) and
+against hatch sdist configurations using ``only-include``, ``packages``,
+``include``/``exclude`` and ``force-include``.  Each case reports
+operations per second (one operation is one call of the function; for
+``matches_pattern`` one file against one pattern) and the peak memory
+allocated during one call.
+
+Baselines are machine-specific and meant for local before/after
+comparisons, so none is shipped.  To damp noise from CPU frequency
+scaling and load, each case's speed is stored and compared relative to
+a fixed calibration workload timed in the same run.
+
+Usage::
+
+    python benchmarks/bench_checks.py --sizes 1k,10k,100k
+    python benchmarks/bench_checks.py --sizes 1m --only sdist_vs_vcs
+    python benchmarks/bench_checks.py --save baseline.json
+    python benchmarks/bench_checks.py --compare baseline.json --max-slowdown 1.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from check_dist._core import (
+    PathIndex,
+    _sdist_expected_files,
+    _sdist_vcs_findings,
+    check_absent,
+    check_present,
+    copier_defaults,
+    matches_pattern,
+)
+
+MODULE = "proj"
+EXTENSIONS = ("cpp", "js", "rust")
+# matches_pattern is timed over at most this many files per pattern.
+MATCH_SAMPLE = 2_000
+
+# Files every template project has, whatever its size.
+_FIXED_FILES = [
+    ".copier-answers.yaml",
+    ".gitattributes",
+    ".github/workflows/build.yaml",
+    ".gitignore",
+    "Cargo.lock",
+    "Cargo.toml",
+    "LICENSE",
+    "Makefile",
+    "README.md",
+    "cpp/CMakeLists.txt",
+    "js/package.json",
+    "pyproject.toml",
+    "rust/Cargo.toml",
+    f"{MODULE}/__init__.py",
+]
+# (share of the listing, path template) for the generated files.
+_TREES = [
+    (50, MODULE + "/sub{a}/mod{i}.py"),
+    (15, MODULE + "/tests/sub{a}/test_{i}.py"),
+    (10, "docs/src/section{a}/page{i}.md"),
+    (10, "rust/src/sub{a}/m{i}.rs"),
+    (5, "js/src/sub{a}/c{i}.ts"),
+    (5, "cpp/src/sub{a}/f{i}.cpp"),
+    (5, "examples/ex{a}/ex{i}.py"),
+]
+
+HATCH_CONFIGS: dict[str, dict] = {
+    "only-include": {"targets": {"sdist": {"only-include": [MODULE, "rust", "pyproject.toml", "Cargo.toml"]}}},
+    "packages": {"targets": {"sdist": {"packages": [MODULE]}}},
+    "include-exclude": {"targets": {"sdist": {"include": [f"/{MODULE}", "/rust/**/*.rs", "*.toml"], "exclude": [f"/{MODULE}/tests", "*.md"]}}},
+    "force-include": {"targets": {"sdist": {"packages": [MODULE], "force-include": {"rust/src": f"{MODULE}/rust", "LICENSE": "LICENSE"}}}},
+}
+
+
+def parse_size(text: str) -> int:
+    """Parse ``1000``, ``10k`` or ``1m``."""
+    text = text.strip().lower()
+    scale = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    return int(float(text[:-1] if scale > 1 else text) * scale)
+
+
+def make_files(count: int) -> list[str]:
+    """Return *count* sorted paths shaped like a template project's git listing."""
+    files = list(_FIXED_FILES)
+    i = 0
+    while len(files) < count:
+        for share, template in _TREES:
+            files.extend(template.format(a=(i + k) % 97, i=i + k) for k in range(share))
+            i += share
+    return sorted(files[:count])
+
+
+def best_time(fn: Callable[[], object], repeat: int, min_time: float) -> float:
+    """Return the best of at least *repeat* timed calls, calling for *min_time* seconds at least."""
+    best = float("inf")
+    spent = 0.0
+    runs = 0
+    while runs < repeat or spent < min_time:
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        runs += 1
+    return best
+
+
+def calibration_speed(repeat: int, min_time: float) -> float:
+    """Return calls per second of a fixed pure-Python workload.
+
+    The workload (sorting, splitting and regex-matching a path listing)
+    exercises the interpreter the way the benchmarked checks do, so the
+    ratio of a case's speed to this one carries over between runs.
+    """
+    import re
+
+    files = make_files(10_000)[::-1]
+    pattern = re.compile(r"(?:^|/)sub\d+/[^/]*\.py$")
+
+    def workload():
+        for f in sorted(files):
+            if pattern.search(f):
+                f.split("/")
+
+    return 1 / best_time(workload, repeat, min_time)
+
+
+def peak_memory(fn: Callable[[], object]) -> int:
+    """Return the peak bytes allocated by one call of *fn*."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def cases(size: int) -> list[tuple[str, int, Callable[[], object]]]:
+    """Return ``(name, operations per call, fn)`` for every benchmark at *size* files."""
+    files = make_files(size)
+    index = PathIndex(files)
+    result: list[tuple[str, int, Callable[[], object]]] = []
+    for extension in EXTENSIONS:
+        config = copier_defaults({"add_extension": extension, "project_name": MODULE})
+        present, absent = config["sdist"]["present"], config["sdist"]["absent"]
+        sample = files[:MATCH_SAMPLE]
+
+        def match(sample=sample, patterns=present + absent):
+            for pattern in patterns:
+                for f in sample:
+                    matches_pattern(f, pattern)
+
+        result.append((f"matches_pattern[{extension}]", len(sample) * len(present + absent), match))
+        result.append((f"check_present[{extension}]", 1, lambda present=present: check_present(files, present, "sdist", index=index)))
+        result.append(
+            (
+                f"check_absent[{extension}]",
+                1,
+                lambda absent=absent, present=present: check_absent(files, absent, "sdist", present_patterns=present, index=index),
+            )
+        )
+    for layout, hatch_config in HATCH_CONFIGS.items():
+        sdist_files = sorted(_sdist_expected_files(files, hatch_config, presorted=True))
+        result.append((f"sdist_expected_files[{layout}]", 1, lambda h=hatch_config: _sdist_expected_files(files, h, presorted=True)))
+        result.append(
+            (
+                f"sdist_vs_vcs[{layout}]",
+                1,
+                lambda h=hatch_config, s=sdist_files: _sdist_vcs_findings(s, files, h, presorted=True),
+            )
+        )
+        # An sdist without its tests: every test file is "missing" until the
+        # absent patterns filter it out.
+        without_tests = [f for f in sdist_files if "/tests/" not in f]
+        result.append(
+            (
+                f"sdist_vs_vcs_absent[{layout}]",
+                1,
+                lambda h=hatch_config, s=without_tests: _sdist_vcs_findings(s, files, h, presorted=True),
+            )
+        )
+    return result
+
+
+def format_size(size: int) -> str:
+    if size >= 1_000_000 and size % 1_000_000 == 0:
+        return f"{size // 1_000_000}m"
+    if size >= 1_000 and size % 1_000 == 0:
+        return f"{size // 1_000}k"
+    return str(size)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1k,10k,100k", help="Comma-separated listing sizes, e.g. 1k,10k,100k,1m (default: 1k,10k,100k)")
+    parser.add_argument("--only", default=None, help="Run only cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=3, help="Minimum timed calls per case; the best is reported (default: 3)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds spent timing each case (default: 0.2)")
+    parser.add_argument("--save", metavar="FILE", help="Write the results to FILE as a baseline for later runs on this machine")
+    parser.add_argument("--compare", metavar="FILE", help="Compare against a baseline written by --save")
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=None,
+        help="With --compare, exit with status 1 if any case is this many times slower than the baseline",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+
+    calibration = calibration_speed(args.repeat, args.min_time)
+    results: dict[str, dict[str, float]] = {}
+    regressions = []
+    print(f"{'case':<44} {'ops/sec':>14} {'peak KiB':>10} {'vs baseline':>12}")
+    for size in (parse_size(s) for s in args.sizes.split(",")):
+        for name, ops, fn in cases(size):
+            case = f"{name} {format_size(size)}"
+            if args.only and args.only not in case:
+                continue
+            ops_per_sec = ops / best_time(fn, args.repeat, args.min_time)
+            peak = peak_memory(fn)
+            relative = ops_per_sec / calibration
+            results[case] = {"ops_per_sec": ops_per_sec, "relative_speed": relative, "peak_bytes": peak}
+            ratio = ""
+            if case in baseline:
+                slowdown = baseline[case]["relative_speed"] / relative
+                ratio = f"{1 / slowdown:11.2f}x"
+                if args.max_slowdown is not None and slowdown > args.max_slowdown:
+                    regressions.append(f"{case}: {slowdown:.2f}x slower")
+            print(f"{case:<44} {ops_per_sec:>14,.1f} {peak / 1024:>10,.0f} {ratio:>12}", flush=True)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(
+                {"python": sys.version, "platform": platform.platform(), "calibration_per_sec": calibration, "results": results},
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+            f.write("\n")
+    if regressions:
+        print("\nSlower than the baseline allows:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
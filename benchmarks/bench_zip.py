@@ -0,0 +1,62 @@
+"""Benchmark the mmap central-directory reader against ``zipfile``.
+
+Usage::
+
+    python benchmarks/bench_zip.py --entries 100000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+import zipfile
+
+from check_dist._zip import read_central_directory
+
+
+def make_wheel(path: str, entries: int) -> None:
+    """Write a wheel-shaped archive with *entries* tiny members."""
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zf:
+        for i in range(entries):
+            zf.writestr(f"pkg/sub{i % 100}/mod{i}.py", b"")
+        zf.writestr("pkg-1.0.dist-info/RECORD", b"")
+
+
+def with_zipfile(path: str) -> list[tuple[str, int, int]]:
+    with zipfile.ZipFile(path) as zf:
+        return [(i.filename, i.file_size, i.CRC) for i in zf.infolist()]
+
+
+def best_of(fn, path: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=100_000, help="Number of archive members (default: 100000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per reader; the best is reported (default: 5)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="check-dist-bench-") as tmpdir:
+        path = os.path.join(tmpdir, "pkg-1.0-py3-none-any.whl")
+        make_wheel(path, args.entries)
+        assert read_central_directory(path) == with_zipfile(path)
+
+        ours = best_of(read_central_directory, path, args.repeat)
+        theirs = best_of(with_zipfile, path, args.repeat)
+
+    print(f"entries:                {args.entries + 1}")
+    print(f"zipfile.ZipFile:        {theirs * 1000:8.1f} ms")
+    print(f"read_central_directory: {ours * 1000:8.1f} ms")
+    print(f"speedup:                {theirs / ours:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,24 @@
 __version__ = "0.1.3"
 
-from ._core import (  # noqa: F401
+from ._batch import check_dist_many
+from ._core import (
     CheckDistError,
+    CheckDistResult,
+    PathIndex,
+    PatternSet,
+    ProjectContext,
     check_absent,
     check_dist,
     check_present,
     check_sdist_vs_vcs,
     check_wrong_platform_extensions,
     copier_defaults,
+    find_all_dist_files,
     find_dist_files,
+    get_untracked_files,
     get_vcs_files,
+    get_vcs_revision,
+    iter_sdist_files,
     list_sdist_files,
     list_wheel_files,
     load_config,
@@ -17,4 +26,10 @@ from ._core import (  # noqa: F401
     load_hatch_config,
     matches_pattern,
     translate_extension,
+    wheel_platform,
 )
+from ._events import Event
+from ._findings import CheckResult, Finding, write_json
+from ._frontend import BuildHookError, EnvPool, build_dists_in_process
+from ._record import check_wheel_record
+from ._watch import Watcher
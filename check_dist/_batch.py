@@ -0,0 +1,126 @@
+"""Checking many source directories of one repository in a process pool."""
+
+from __future__ import annotations
+
+import bisect
+import os
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from ._core import CheckDistError, check_dist, get_vcs_files
+
+# Exit status of one project, mirroring the CLI exit codes.
+PASSED, FAILED, ERRORED = 0, 1, 2
+
+BatchResult = tuple[str, int, list[str]]
+
+
+def _repo_root(path: str) -> str | None:
+    """Return the nearest ancestor of *path* (inclusive) holding ``.git``."""
+    path = os.path.realpath(path)
+    while True:
+        if os.path.exists(os.path.join(path, ".git")):
+            return path
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def _subtree(files: list[str], prefix: str) -> list[str]:
+    """Return the entries of sorted *files* below *prefix*, relative to it."""
+    if not prefix:
+        return list(files)
+    # "0" sorts right after "/", so [prefix/, prefix0) is the subtree.
+    lo = bisect.bisect_left(files, prefix + "/")
+    hi = bisect.bisect_left(files, prefix + "0", lo)
+    start = len(prefix) + 1
+    return [f[start:] for f in files[lo:hi]]
+
+
+def _shared_vcs_listings(source_dirs: Sequence[str]) -> list[list[str] | None]:
+    """Return each directory's VCS listing, running git once per repository.
+
+    ``None`` marks directories outside a repository or whose repository
+    could not be listed; :func:`check_dist` then reports the problem.
+    """
+    roots = [_repo_root(d) for d in source_dirs]
+    listings: dict[str, list[str] | None] = {}
+    for root in roots:
+        if root is not None and root not in listings:
+            try:
+                listings[root] = get_vcs_files(root)
+            except CheckDistError:
+                listings[root] = None
+    result: list[list[str] | None] = []
+    for source_dir, root in zip(source_dirs, roots):
+        files = listings.get(root) if root is not None else None
+        if files is None:
+            result.append(None)
+            continue
+        prefix = os.path.relpath(os.path.realpath(source_dir), root).replace(os.sep, "/")
+        result.append(_subtree(files, "" if prefix == "." else prefix))
+    return result
+
+
+def _errored(source_dir: str, exc: BaseException) -> BatchResult:
+    detail = str(exc) if isinstance(exc, CheckDistError) else f"{type(exc).__name__}: {exc}"
+    return source_dir, ERRORED, [f"Error: {detail}"]
+
+
+def _check_one(source_dir: str, vcs_files: list[str] | None, options: dict[str, Any]) -> BatchResult:
+    try:
+        success, messages = check_dist(source_dir, vcs_files=vcs_files, **options)
+    except Exception as exc:  # noqa: BLE001
+        # One broken project must not cost the results of the others.
+        return _errored(source_dir, exc)
+    return source_dir, PASSED if success else FAILED, messages
+
+
+def check_dist_many(source_dirs: Iterable[str], *, jobs: int | None = None, **options: Any) -> list[BatchResult]:
+    """Run :func:`check_dist` over many source directories.
+
+    The directories are checked in a pool of *jobs* worker processes
+    (default: CPU count; ``1`` checks them serially in this process).
+    ``git ls-files`` runs once per repository root and each project gets
+    its slice of that listing.  *options* are passed to
+    :func:`check_dist` and must be picklable.
+
+    Returns ``(source_dir, status, messages)`` per directory, in input
+    order, where *status* is :data:`PASSED`, :data:`FAILED` or
+    :data:`ERRORED`.  A project is errored when checking it raised, or
+    its worker failed (e.g. crashed or could not receive *options*); the
+    error is then the only entry of *messages*, and the other projects'
+    results are unaffected.
+    """
+    source_dirs = list(source_dirs)
+    listings = _shared_vcs_listings(source_dirs)
+    workers = min(jobs or os.cpu_count() or 1, max(len(source_dirs), 1))
+    if workers == 1:
+        return [_check_one(d, files, options) for d, files in zip(source_dirs, listings)]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_check_one, d, files, options) for d, files in zip(source_dirs, listings)]
+        results = []
+        for source_dir, future in zip(source_dirs, futures):
+            try:
+                results.append(future.result())
+            except Exception as exc:  # noqa: BLE001
+                results.append(_errored(source_dir, exc))
+        return results
+
+
+def format_batch_report(results: list[BatchResult]) -> list[str]:
+    """Return the aggregated report lines for :func:`check_dist_many` results."""
+    lines: list[str] = []
+    for source_dir, _, messages in results:
+        lines.append(f"==> {source_dir}")
+        lines.extend(messages)
+        lines.append("")
+    labels = {PASSED: "PASS", FAILED: "FAIL", ERRORED: "ERROR"}
+    counts = [sum(1 for _, status, _ in results if status == s) for s in (PASSED, FAILED, ERRORED)]
+    lines.append(f"{len(results)} project(s): {counts[0]} passed, {counts[1]} failed, {counts[2]} error(s)")
+    for source_dir, status, _ in results:
+        lines.append(f"  {labels[status]:<5} {source_dir}")
+    return lines
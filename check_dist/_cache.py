@@ -0,0 +1,169 @@
+"""On-disk cache of built distributions keyed on packaging inputs."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ._core import ProjectContext
+
+# Total size of cached builds before least-recently-used entries are evicted.
+_DEFAULT_MAX_BYTES = 2 * 1024**3
+_CHUNK_SIZE = 1 << 20
+
+
+def cache_root() -> Path:
+    """Return the check-dist cache directory.
+
+    ``$CHECK_DIST_CACHE_DIR`` wins, then ``$XDG_CACHE_HOME/check-dist``,
+    then ``~/.cache/check-dist``.
+    """
+    explicit = os.environ.get("CHECK_DIST_CACHE_DIR")
+    if explicit:
+        return Path(explicit)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "check-dist"
+
+
+def _max_bytes() -> int:
+    value = os.environ.get("CHECK_DIST_CACHE_MAX_SIZE")
+    return int(value) if value else _DEFAULT_MAX_BYTES
+
+
+def _hash_file(digest, path: str) -> None:
+    if os.path.islink(path):
+        digest.update(b"L" + os.readlink(path).encode())
+        return
+    if not os.path.isfile(path):
+        # Tracked but deleted (or a submodule directory): record absence.
+        digest.update(b"-")
+        return
+    digest.update(b"F")
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            digest.update(chunk)
+
+
+def build_cache_key(
+    source_dir: str,
+    vcs_files: list[str],
+    *,
+    untracked_files: list[str] | None = None,
+    revision: str = "",
+    no_isolation: bool = False,
+) -> str:
+    """Return the cache key for building *source_dir*.
+
+    The key covers the interpreter, the isolation mode, ``pyproject.toml``
+    and its ``build-system.requires``, the VCS *revision* (see
+    :func:`check_dist._core.get_vcs_revision`; projects may derive their
+    version from it), and the path and contents of every *vcs_files*
+    entry and of every *untracked_files* entry (untracked files git does
+    not ignore, which backends such as hatchling pack as well; see
+    :func:`check_dist._core.get_untracked_files`).
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{sys.implementation.cache_tag}\0{sys.version}\0{platform.platform()}\0{sys.executable}\0".encode())
+    digest.update(b"no-isolation\0" if no_isolation else b"isolation\0")
+
+    pyproject = os.path.join(source_dir, "pyproject.toml")
+    requires: list[str] = []
+    if os.path.isfile(pyproject):
+        with open(pyproject, "rb") as f:
+            data = f.read()
+        digest.update(data)
+        requires = ProjectContext.load(pyproject).build_requires
+    digest.update(("\0".join(sorted(requires)) + "\0").encode())
+    digest.update(f"revision\0{revision}\0".encode())
+
+    for name in vcs_files:
+        digest.update(name.encode() + b"\0")
+        _hash_file(digest, os.path.join(source_dir, name))
+        digest.update(b"\0")
+    digest.update(b"untracked\0")
+    for name in untracked_files or ():
+        digest.update(name.encode() + b"\0")
+        _hash_file(digest, os.path.join(source_dir, name))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _dir_size(path: Path) -> int:
+    return sum(entry.stat().st_size for entry in path.iterdir() if entry.is_file())
+
+
+class BuildCache:
+    """Directory of built sdist/wheel pairs with LRU eviction by total size.
+
+    Each entry is ``<root>/<key>/``; its mtime records the last use.
+    Entries are published with an atomic rename, so concurrent runs never
+    observe a partially written entry.
+    """
+
+    def __init__(self, root: str | Path | None = None, *, max_bytes: int | None = None) -> None:
+        self.root = Path(root) if root is not None else cache_root() / "builds"
+        self.max_bytes = _max_bytes() if max_bytes is None else max_bytes
+
+    def get(self, key: str) -> str | None:
+        """Return the directory holding the cached dists for *key*, if any."""
+        entry = self.root / key
+        if not entry.is_dir():
+            return None
+        try:
+            os.utime(entry)
+        except OSError:
+            return None
+        return str(entry)
+
+    def put(self, key: str, dist_dir: str) -> str | None:
+        """Copy the ``.tar.gz``/``.zip``/``.whl`` files of *dist_dir* into the cache."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        entry = self.root / key
+        staging = Path(tempfile.mkdtemp(prefix=f".{key[:12]}-", dir=self.root))
+        try:
+            for name in os.listdir(dist_dir):
+                if name.endswith((".tar.gz", ".zip", ".whl")):
+                    shutil.copy2(os.path.join(dist_dir, name), staging / name)
+            os.replace(staging, entry)
+        except OSError:
+            # Another run published the same key first, or the disk is full.
+            shutil.rmtree(staging, ignore_errors=True)
+            return self.get(key)
+        self.evict()
+        return str(entry)
+
+    def evict(self) -> None:
+        """Remove least-recently-used entries until under ``max_bytes``.
+
+        Staging directories left behind by interrupted runs are removed
+        once they are an hour old.
+        """
+        if not self.root.is_dir():
+            return
+        stale = time.time() - 3600
+        entries = []
+        for entry in self.root.iterdir():
+            try:
+                if not entry.is_dir():
+                    continue
+                mtime = entry.stat().st_mtime
+                if entry.name.startswith("."):
+                    if mtime < stale:
+                        shutil.rmtree(entry, ignore_errors=True)
+                    continue
+                entries.append((mtime, _dir_size(entry), entry))
+            except OSError:
+                continue
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
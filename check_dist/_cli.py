@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import sys
+from functools import partial
 
 from ._core import CheckDistError, check_dist
 
@@ -15,9 +16,21 @@ def main(argv: list[str] | None = None) -> None:
     )
     parser.add_argument(
         "source_dir",
-        nargs="?",
-        default=".",
-        help="Source directory (default: current directory)",
+        nargs="*",
+        default=["."],
+        help="Source directory (default: current directory); several with --batch",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Check every given source directory in a process pool and print an aggregated report",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for --batch (default: CPU count)",
     )
     parser.add_argument(
         "--no-isolation",
@@ -41,23 +54,137 @@ def main(argv: list[str] | None = None) -> None:
         action="store_true",
         help="Force a fresh build even when pre-built dists exist in dist/ or wheelhouse/",
     )
+    parser.add_argument(
+        "--parallel-build",
+        action="store_true",
+        help="Build the sdist and wheel concurrently instead of trying a combined build first",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Call the PEP 517 build hooks directly instead of spawning 'python -m build' (needs check-dist[fast])",
+    )
+    parser.add_argument(
+        "--reuse-env",
+        action="store_true",
+        help="Reuse a pooled build environment keyed on build-system.requires (implies --in-process)",
+    )
+    parser.add_argument(
+        "--find-links",
+        metavar="DIR",
+        action="append",
+        default=None,
+        help="Install build requirements offline from this wheel directory or URL; repeatable (implies --in-process)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-check whenever the configuration, source files or dist/ change",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print the wall and CPU time spent in each phase of the run",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "json"),
+        default="text",
+        help="Print the report as text, or as one JSON document of the structured check results (default: text)",
+    )
+    parser.add_argument(
+        "--max-paths",
+        metavar="N",
+        type=int,
+        default=20,
+        help="List at most N paths per error in the text report; 0 lists all (default: 20)",
+    )
+    parser.add_argument(
+        "--platform",
+        choices=("linux", "darwin", "win32"),
+        default=None,
+        help="Check every distribution for this platform's extensions (default: each wheel's platform tag, else the current platform)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always build and re-read everything, bypassing the on-disk caches",
+    )
     args = parser.parse_args(argv)
+    if len(args.source_dir) > 1 and not args.batch:
+        parser.error("multiple source directories require --batch")
+    if args.timings and (args.batch or args.watch):
+        parser.error("--timings cannot be combined with --batch or --watch")
+    if args.max_paths < 0:
+        parser.error("--max-paths must not be negative")
+    if args.format == "json" and (args.batch or args.watch):
+        parser.error("--format json cannot be combined with --batch or --watch")
+    options = {
+        "no_isolation": args.no_isolation,
+        "verbose": args.verbose,
+        "pre_built": args.pre_built,
+        "rebuild": args.rebuild,
+        "use_cache": not args.no_cache,
+        "parallel_build": args.parallel_build,
+        "in_process_build": args.in_process,
+        "reuse_build_env": args.reuse_env,
+        "find_links": args.find_links,
+        "max_paths": args.max_paths or None,
+        "platform": args.platform,
+    }
+
+    if args.watch:
+        _watch(args, options)
+
+    if args.batch:
+        from ._batch import check_dist_many, format_batch_report
+
+        results = check_dist_many(args.source_dir, jobs=args.jobs, **options)
+        for msg in format_batch_report(results):
+            print(msg)
+        sys.exit(max((status for _, status, _ in results), default=0))
 
     try:
-        success, messages = check_dist(
-            source_dir=args.source_dir,
-            no_isolation=args.no_isolation,
-            verbose=args.verbose,
-            pre_built=args.pre_built,
-            rebuild=args.rebuild,
+        result = check_dist(
+            source_dir=args.source_dir[0],
+            on_build_output=(lambda line: print(line, end="", file=sys.stderr)) if args.verbose else None,
+            # The text report is printed as it is produced; JSON has no use for it.
+            on_message=partial(print, flush=True) if args.format == "text" else (lambda _msg: None),
+            **options,
         )
-        for msg in messages:
-            print(msg)
-        sys.exit(0 if success else 1)
+        if args.format == "json":
+            from ._findings import write_json
+
+            write_json(result.success, result.results, sys.stdout, timings=result.timings if args.timings else None)
+        else:
+            if args.timings:
+                for line in result.timings.format():
+                    print(line)
+        sys.exit(0 if result.success else 1)
     except CheckDistError as exc:
         print(f"Error: {exc}", file=sys.stderr)
         sys.exit(2)
 
 
+def _watch(args: argparse.Namespace, options: dict) -> None:
+    import time
+
+    from ._watch import Watcher
+
+    def report(success: bool, messages: list[str]) -> None:
+        print(f"\n── {time.strftime('%H:%M:%S')} " + "─" * 40)
+        for msg in messages:
+            print(msg, flush=True)
+
+    del options["use_cache"]
+    watcher = Watcher(args.source_dir[0], **options)
+    try:
+        watcher.run(report)
+    except KeyboardInterrupt:
+        sys.exit(0)
+    finally:
+        watcher.close()
+
+
 if __name__ == "__main__":
     main()
@@ -2,22 +2,27 @@
 
 from __future__ import annotations
 
+import bisect
 import fnmatch
 import os
 import re
-import subprocess
 import sys
-import tarfile
-import tempfile
-import zipfile
+import time
+from collections.abc import Callable, Iterator
+from functools import cached_property, partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import yaml
+from ._events import FINDING, LISTED, Event, _serialized
+from ._findings import ABSENT, DISTRIBUTIONS, MISSING, PLATFORM_EXTENSION, PRESENT, RECORD, UNTRACKED, CheckResult, Finding, iter_findings
+from ._timings import Timings
 
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
+if TYPE_CHECKING:
+    import subprocess
+
+# Modules only some code paths need (yaml, tarfile, subprocess, the
+# executors, ...) are imported where they are used, to keep importing
+# check_dist, and so ``check-dist --help``, fast.
 
 
 class CheckDistError(Exception):
@@ -42,96 +47,218 @@ _PLATFORM_EXTENSION_MAP: dict[str, dict[str, str]] = {
 }
 
 
-def _get_platform_key() -> str:
-    if sys.platform == "win32":
+# Other platforms' extensions, per platform, for one ``str.endswith`` call.
+_WRONG_PLATFORM_EXTENSIONS: dict[str, tuple[str, ...]] = {key: tuple(mapping) for key, mapping in _PLATFORM_EXTENSION_MAP.items()}
+
+# Wheel platform tag prefixes and the platform whose conventions they follow.
+_WHEEL_TAG_PLATFORMS = (
+    ("win", "win32"),
+    ("macosx_", "darwin"),
+    ("manylinux", "linux"),
+    ("musllinux_", "linux"),
+    ("linux_", "linux"),
+)
+
+
+def _get_platform_key(platform: str | None = None) -> str:
+    """Return the :data:`_PLATFORM_EXTENSION_MAP` key for *platform* (default: ``sys.platform``)."""
+    platform = sys.platform if platform is None else platform
+    if platform == "win32":
         return "win32"
-    elif sys.platform == "darwin":
+    elif platform == "darwin":
         return "darwin"
     return "linux"
 
 
-def translate_extension(pattern: str) -> str:
-    """Translate file extensions to the current platform's convention.
+def wheel_platform(filename: str) -> str | None:
+    """Return the platform a wheel was built for, from its file name's platform tag.
 
-    For example, if a user specifies ``*.so`` on Windows, this returns ``*.pyd``.
+    ``win32``, ``darwin`` or ``linux`` (the values ``sys.platform`` takes
+    there) for ``win_*``, ``macosx_*`` and ``manylinux*``/``musllinux_*``/
+    ``linux_*`` tags; ``None`` for pure-Python (``any``) wheels, unknown
+    tags and names that are not wheel file names.
     """
-    mapping = _PLATFORM_EXTENSION_MAP.get(_get_platform_key(), {})
+    name = os.path.basename(filename)
+    if not name.endswith(".whl"):
+        return None
+    parts = name[:-4].split("-")
+    if len(parts) not in (5, 6):
+        return None
+    platforms = {key for tag in parts[-1].split(".") for prefix, key in _WHEEL_TAG_PLATFORMS if tag.startswith(prefix)}
+    return platforms.pop() if len(platforms) == 1 else None
+
+
+def translate_extension(pattern: str, platform: str | None = None) -> str:
+    """Translate file extensions to *platform*'s convention (default: the current platform).
+
+    For example, with ``*.so`` on Windows (or for ``platform="win32"``),
+    this returns ``*.pyd``.
+    """
+    mapping = _PLATFORM_EXTENSION_MAP[_get_platform_key(platform)]
     for src_ext, dst_ext in mapping.items():
         if pattern.endswith(src_ext):
             return pattern[: -len(src_ext)] + dst_ext
     return pattern
 
 
-def _wrong_platform_extensions() -> list[str]:
-    """Return extensions that should NOT appear on the current platform."""
-    mapping = _PLATFORM_EXTENSION_MAP.get(_get_platform_key(), {})
-    return list(mapping.keys())
+def _wrong_platform_extensions(platform: str | None = None) -> list[str]:
+    """Return extensions that should NOT appear on *platform* (default: the current platform)."""
+    return list(_WRONG_PLATFORM_EXTENSIONS[_get_platform_key(platform)])
 
 
-def load_config(pyproject_path: str | Path = "pyproject.toml", *, source_dir: str | Path | None = None) -> dict:
-    """Load ``[tool.check-dist]`` configuration from *pyproject.toml*.
+def _load_toml(path: str | Path) -> dict:
+    """Parse the TOML file at *path*."""
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
 
-    If no ``[tool.check-dist]`` section exists and *source_dir* contains a
-    ``.copier-answers.yaml`` with an ``add_extension`` key, sensible
-    defaults are derived from the copier template answers.
-    """
-    path = Path(pyproject_path)
-    empty = {
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+# ── Project files ─────────────────────────────────────────────────────
+
+# A file modified this recently may be rewritten within the same mtime tick
+# without changing size, so its parse is not cached (git's "racy" rule).
+_RACY_NS = 2 * 10**9
+_PROJECT_CACHE_SIZE = 256
+_project_cache: dict[tuple[str, str], tuple[tuple, ProjectContext]] = {}
+
+
+def _empty_config() -> dict:
+    return {
         "sdist": {"present": [], "absent": []},
         "wheel": {"present": [], "absent": []},
     }
-    if not path.exists():
-        # No pyproject.toml at all — try copier defaults
-        if source_dir is not None:
-            copier_cfg = load_copier_config(source_dir)
-            defaults = copier_defaults(copier_cfg)
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class ProjectContext:
+    """The project files of one source directory, each parsed at most once.
+
+    Holds ``pyproject.toml`` (``None`` if missing) and
+    ``.copier-answers.yaml`` from *source_dir* (default: the directory of
+    *pyproject_path*), each parsed on first use, and derives the check-dist, hatch and
+    build-system configuration from them.  :meth:`load` reuses contexts
+    while both files keep their mtime and size.  Contexts are shared, so
+    treat everything they return as read-only.
+    """
+
+    def __init__(self, pyproject_path: str | Path = "pyproject.toml", *, source_dir: str | Path | None = None) -> None:
+        self.pyproject_path = Path(pyproject_path)
+        self.source_dir = Path(source_dir) if source_dir is not None else self.pyproject_path.parent
+
+    @cached_property
+    def pyproject(self) -> dict | None:
+        """The parsed ``pyproject.toml``, or ``None`` if it does not exist."""
+        return _load_toml(self.pyproject_path) if self.pyproject_path.exists() else None
+
+    @classmethod
+    def load(cls, pyproject_path: str | Path = "pyproject.toml", *, source_dir: str | Path | None = None) -> ProjectContext:
+        """Return the context for *pyproject_path*, re-parsing only if a file changed."""
+        path = Path(pyproject_path)
+        source = Path(source_dir) if source_dir is not None else path.parent
+        key = (os.path.realpath(path), os.path.realpath(source))
+        stamps = (_file_stamp(path), _file_stamp(source / ".copier-answers.yaml"))
+        cached = _project_cache.get(key)
+        if cached is not None and cached[0] == stamps:
+            return cached[1]
+        context = cls(path, source_dir=source)
+        now = time.time_ns()
+        if all(stamp is None or now - stamp[0] > _RACY_NS for stamp in stamps):
+            if len(_project_cache) >= _PROJECT_CACHE_SIZE:
+                _project_cache.pop(next(iter(_project_cache)))
+            _project_cache[key] = (stamps, context)
+        return context
+
+    @cached_property
+    def copier_answers(self) -> dict:
+        """The answers in ``.copier-answers.yaml``, or ``{}``."""
+        path = self.source_dir / ".copier-answers.yaml"
+        if not path.exists():
+            return {}
+        import yaml
+
+        with open(path) as f:
+            return yaml.safe_load(f) or {}
+
+    @property
+    def tool(self) -> dict:
+        """The ``[tool]`` table."""
+        return (self.pyproject or {}).get("tool", {})
+
+    @property
+    def hatch_config(self) -> dict:
+        """The ``[tool.hatch.build]`` table."""
+        return self.tool.get("hatch", {}).get("build", {})
+
+    @property
+    def build_system(self) -> dict:
+        """The ``[build-system]`` table."""
+        return (self.pyproject or {}).get("build-system", {})
+
+    @property
+    def build_requires(self) -> list[str]:
+        """``build-system.requires`` as written (no PEP 517 defaults applied)."""
+        return self.build_system.get("requires", [])
+
+    @property
+    def config(self) -> dict:
+        """The check-dist configuration, built afresh on each access.
+
+        ``[tool.check-dist]`` with the top-level patterns merged into each
+        target, or, without that section, defaults derived from the copier
+        answers (see :func:`copier_defaults`), or empty pattern lists.
+        """
+        cd = self.tool.get("check-dist", {})
+        if not cd:
+            defaults = copier_defaults(self.copier_answers, hatch_config=self.hatch_config)
             if defaults is not None:
                 return defaults
-        return empty
+            return _empty_config()
 
-    with open(path, "rb") as f:
-        config = tomllib.load(f)
-
-    cd = config.get("tool", {}).get("check-dist", {})
-
-    # If there's no [tool.check-dist] section at all, try copier defaults
-    if not cd:
-        if source_dir is None:
-            source_dir = path.parent
-        copier_cfg = load_copier_config(source_dir)
-        hatch_cfg = config.get("tool", {}).get("hatch", {}).get("build", {})
-        defaults = copier_defaults(copier_cfg, hatch_config=hatch_cfg)
-        if defaults is not None:
-            return defaults
-        return empty
-
-    base_present = cd.get("present", [])
-    base_absent = cd.get("absent", [])
-    sdist_cfg = cd.get("sdist", {})
-    wheel_cfg = cd.get("wheel", {})
+        base_present = cd.get("present", [])
+        base_absent = cd.get("absent", [])
+        sdist_cfg = cd.get("sdist", {})
+        wheel_cfg = cd.get("wheel", {})
 
-    return {
-        "sdist": {
-            "present": [*base_present, *sdist_cfg.get("present", [])],
-            "absent": [*base_absent, *sdist_cfg.get("absent", [])],
-        },
-        "wheel": {
-            "present": [*base_present, *wheel_cfg.get("present", [])],
-            "absent": [*base_absent, *wheel_cfg.get("absent", [])],
-        },
-    }
+        return {
+            "sdist": {
+                "present": [*base_present, *sdist_cfg.get("present", [])],
+                "absent": [*base_absent, *sdist_cfg.get("absent", [])],
+            },
+            "wheel": {
+                "present": [*base_present, *wheel_cfg.get("present", [])],
+                "absent": [*base_absent, *wheel_cfg.get("absent", [])],
+            },
+        }
 
 
-def load_hatch_config(pyproject_path: str | Path = "pyproject.toml") -> dict:
-    """Load ``[tool.hatch.build]`` configuration from *pyproject.toml*."""
-    path = Path(pyproject_path)
-    if not path.exists():
-        return {}
+def load_config(pyproject_path: str | Path = "pyproject.toml", *, source_dir: str | Path | None = None) -> dict:
+    """Load ``[tool.check-dist]`` configuration from *pyproject.toml*.
 
-    with open(path, "rb") as f:
-        config = tomllib.load(f)
+    If no ``[tool.check-dist]`` section exists and *source_dir* contains a
+    ``.copier-answers.yaml`` with an ``add_extension`` key, sensible
+    defaults are derived from the copier template answers.  Without
+    *pyproject.toml*, copier defaults are only used if *source_dir* is
+    given.  See :attr:`ProjectContext.config`.
+    """
+    if source_dir is None and not Path(pyproject_path).exists():
+        return _empty_config()
+    return ProjectContext.load(pyproject_path, source_dir=source_dir).config
 
-    return config.get("tool", {}).get("hatch", {}).get("build", {})
+
+def load_hatch_config(pyproject_path: str | Path = "pyproject.toml") -> dict:
+    """Load ``[tool.hatch.build]`` configuration from *pyproject.toml*."""
+    return ProjectContext.load(pyproject_path).hatch_config
 
 
 # ── Copier template defaults ─────────────────────────────────────────
@@ -202,11 +329,7 @@ _COMMON_WHEEL_ABSENT = [
 
 def load_copier_config(source_dir: str | Path) -> dict:
     """Load ``.copier-answers.yaml`` from *source_dir*, if it exists."""
-    path = Path(source_dir) / ".copier-answers.yaml"
-    if not path.exists():
-        return {}
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
+    return ProjectContext.load(Path(source_dir) / "pyproject.toml", source_dir=source_dir).copier_answers
 
 
 def _module_name_from_project(project_name: str) -> str:
@@ -304,45 +427,86 @@ def _filter_extras_by_hatch(extras: list[str], hatch_config: dict) -> list[str]:
 # ── Building ──────────────────────────────────────────────────────────
 
 
-def build_dists(source_dir: str, output_dir: str, *, no_isolation: bool = False) -> list[str]:
+def _build_command(targets: tuple[str, ...], source_dir: str, output_dir: str, *, no_isolation: bool) -> list[str]:
+    cmd = [sys.executable, "-m", "build", *targets, "--outdir", output_dir]
+    if no_isolation:
+        cmd.append("--no-isolation")
+    cmd.append(source_dir)
+    return cmd
+
+
+# Backends that write build state into the source tree (setuptools:
+# ``*.egg-info`` and ``build/``), so two builds of one tree cannot overlap.
+_IN_TREE_BACKENDS = ("setuptools.",)
+
+
+def _builds_in_tree(source_dir: str) -> bool:
+    """Return whether the build backend of *source_dir* writes into the tree.
+
+    Projects without ``build-system.build-backend`` get the legacy
+    setuptools backend, and unreadable ``pyproject.toml`` files are
+    assumed to.
+    """
+    try:
+        build_system = ProjectContext.load(os.path.join(source_dir, "pyproject.toml")).build_system
+    except (OSError, ValueError):  # ValueError covers TOMLDecodeError
+        return True
+    backend = build_system.get("build-backend")
+    return backend is None or backend.startswith(_IN_TREE_BACKENDS)
+
+
+def build_dists(source_dir: str, output_dir: str, *, no_isolation: bool = False, parallel: bool = False) -> list[str]:
     """Build sdist and wheel into *output_dir*.
 
+    By default a combined ``--sdist --wheel`` build is tried first and, if
+    it fails, both targets are retried individually and concurrently.
+    With *parallel*, the combined attempt is skipped and the two targets
+    are built concurrently straight away.
+
+    Concurrent builds share the source tree, which is only safe for
+    backends that leave it alone.  setuptools (including the legacy
+    default for projects without ``build-system.build-backend``) writes
+    ``*.egg-info`` and ``build/`` into it, so for setuptools the
+    individual builds always run one after the other.
+
     Returns a list of warnings (e.g. when only one dist type could be built).
     """
-    warnings: list[str] = []
-    cmd_base = [sys.executable, "-m", "build", "--outdir", output_dir]
-    if no_isolation:
-        cmd_base.append("--no-isolation")
-    cmd_base.append(source_dir)
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor
 
-    # Try building both together first (fastest path)
-    cmd = [sys.executable, "-m", "build", "--sdist", "--wheel", "--outdir", output_dir]
-    if no_isolation:
-        cmd.insert(-1, "--no-isolation")
-    cmd.append(source_dir)
+    warnings: list[str] = []
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode == 0:
-        return warnings
+    def run(*targets: str) -> subprocess.CompletedProcess:
+        return subprocess.run(_build_command(targets, source_dir, output_dir, no_isolation=no_isolation), capture_output=True, text=True, check=False)
+
+    combined = None
+    if not parallel:
+        # Try building both together first (fastest path)
+        combined = run("--sdist", "--wheel")
+        if combined.returncode == 0:
+            return warnings
+
+    # Build each target individually so that a wheel-only failure (e.g.
+    # missing native toolchain) doesn't block sdist checks.  The builds
+    # are independent subprocesses, so run them side by side unless the
+    # backend writes into the shared source tree.
+    if _builds_in_tree(source_dir):
+        results = [run("--sdist"), run("--wheel")]
+    else:
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="check-dist-build") as pool:
+            results = list(pool.map(run, ("--sdist", "--wheel")))
 
-    # Combined build failed – try each target individually so that a
-    # wheel-only failure (e.g. missing native toolchain) doesn't block
-    # sdist checks.
     built_any = False
-    for target in ("--sdist", "--wheel"):
-        cmd = [sys.executable, "-m", "build", target, "--outdir", output_dir]
-        if no_isolation:
-            cmd.insert(-1, "--no-isolation")
-        cmd.append(source_dir)
-        r = subprocess.run(cmd, capture_output=True, text=True)
+    for kind, r in zip(("sdist", "wheel"), results):
         if r.returncode == 0:
             built_any = True
         else:
-            kind = "sdist" if target == "--sdist" else "wheel"
             warnings.append(f"Warning: {kind} build failed:\n{r.stderr.strip()}")
 
     if not built_any:
-        raise CheckDistError(f"Build failed:\n{result.stdout}\n{result.stderr}")
+        if combined is not None:
+            raise CheckDistError(f"Build failed:\n{combined.stdout}\n{combined.stderr}")
+        raise CheckDistError("Build failed:\n" + "\n".join(f"{r.stdout}\n{r.stderr}" for r in results))
 
     return warnings
 
@@ -381,43 +545,100 @@ def _find_pre_built(source_dir: str) -> str | None:
 # ── Listing files ─────────────────────────────────────────────────────
 
 
-def list_sdist_files(sdist_path: str) -> list[str]:
-    """List files inside an sdist, stripping the top-level directory."""
-    files: list[str] = []
+def _strip_top_level(name: str) -> str:
+    """Strip the leading ``<name>-<version>/`` directory from an sdist member."""
+    head, sep, rest = name.partition("/")
+    return rest if sep else head
+
+
+def iter_sdist_files(sdist_path: str) -> Iterator[tuple[str, int]]:
+    """Yield ``(name, size)`` for each file inside an sdist, in archive order.
+
+    Names have the top-level directory stripped.  ``.tar.gz`` archives are
+    read as a stream: only member headers are decoded, payloads are skipped
+    over as the stream advances, and no ``TarInfo`` is retained once it has
+    been yielded, so peak memory does not depend on the archive size.
+    """
     if sdist_path.endswith(".tar.gz"):
-        with tarfile.open(sdist_path) as tf:
-            for member in tf.getmembers():
+        import tarfile
+
+        with tarfile.open(sdist_path, mode="r|gz") as tf:
+            while (member := tf.next()) is not None:
+                # TarFile records every member it reads; drop them as we go.
+                tf.members.clear()
                 if member.isfile():
-                    parts = member.name.split("/", 1)
-                    files.append(parts[1] if len(parts) > 1 else parts[0])
+                    yield _strip_top_level(member.name), member.size
     elif sdist_path.endswith(".zip"):
-        with zipfile.ZipFile(sdist_path) as zf:
-            for name in zf.namelist():
-                if not name.endswith("/"):
-                    parts = name.split("/", 1)
-                    files.append(parts[1] if len(parts) > 1 else parts[0])
+        from ._zip import read_central_directory
+
+        for name, size, _ in read_central_directory(sdist_path):
+            if not name.endswith("/"):
+                yield _strip_top_level(name), size
     else:
         raise CheckDistError(f"Unknown sdist format: {sdist_path}")
-    return sorted(files)
+
+
+def list_sdist_files(sdist_path: str) -> list[str]:
+    """List files inside an sdist, stripping the top-level directory."""
+    return sorted(name for name, _ in iter_sdist_files(sdist_path))
 
 
 def list_wheel_files(wheel_path: str) -> list[str]:
     """List files inside a wheel."""
-    with zipfile.ZipFile(wheel_path) as zf:
-        return sorted(name for name in zf.namelist() if not name.endswith("/"))
+    from ._zip import read_central_directory
+
+    return sorted(name for name, _, _ in read_central_directory(wheel_path) if not name.endswith("/"))
 
 
 # ── VCS integration ───────────────────────────────────────────────────
 
 
-def get_vcs_files(source_dir: str) -> list[str]:
-    """Return files tracked by git in *source_dir*."""
+def get_vcs_files(source_dir: str, pathspecs: list[str] | None = None) -> list[str]:
+    """Return files tracked by git in *source_dir*.
+
+    With *pathspecs* (literal paths relative to *source_dir*), only files
+    equal to or below one of them are listed; git filters the index, so
+    scoped subprojects of large repositories stay cheap to list.
+    """
+    if pathspecs is not None and not pathspecs:
+        return []  # git would treat an empty pathspec list as "everything"
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--recurse-submodules", "--", *(pathspecs or [])],
+            capture_output=True,
+            text=True,
+            cwd=source_dir,
+            env={**os.environ, "GIT_LITERAL_PATHSPECS": "1"},
+            check=False,
+        )
+    except FileNotFoundError:
+        raise CheckDistError("git not found – only git is currently supported for VCS tracking")
+    if result.returncode != 0:
+        raise CheckDistError(f"git ls-files failed:\n{result.stderr}")
+    return sorted(f for f in result.stdout.split("\0") if f)
+
+
+def get_untracked_files(source_dir: str, pathspecs: list[str] | None = None) -> list[str]:
+    """Return the untracked files of *source_dir* that git does not ignore.
+
+    Build backends such as hatchling pack these into the sdist as well,
+    so they are part of what a build depends on.  *pathspecs* limits the
+    listing as for :func:`get_vcs_files`.
+    """
+    import subprocess
+
+    if pathspecs is not None and not pathspecs:
+        return []
     try:
         result = subprocess.run(
-            ["git", "ls-files", "-z", "--recurse-submodules"],
+            ["git", "ls-files", "-z", "--others", "--exclude-standard", "--", *(pathspecs or [])],
             capture_output=True,
             text=True,
             cwd=source_dir,
+            env={**os.environ, "GIT_LITERAL_PATHSPECS": "1"},
+            check=False,
         )
     except FileNotFoundError:
         raise CheckDistError("git not found – only git is currently supported for VCS tracking")
@@ -426,19 +647,143 @@ def get_vcs_files(source_dir: str) -> list[str]:
     return sorted(f for f in result.stdout.split("\0") if f)
 
 
+def get_vcs_revision(source_dir: str) -> str:
+    """Return what identifies the checked-out commit of *source_dir* and its tags.
+
+    This is ``git describe --tags --long --always --abbrev=40``: the full
+    ``HEAD`` hash, preceded by the nearest tag and the distance to it when
+    there is one, which is what VCS-derived versions (hatch-vcs,
+    setuptools-scm) are computed from.  Returns ``""`` outside a git
+    repository or without commits.
+    """
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ["git", "describe", "--tags", "--long", "--always", "--abbrev=40"],
+            capture_output=True,
+            text=True,
+            cwd=source_dir,
+            check=False,
+        )
+    except FileNotFoundError:
+        return ""
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
+# ── Path index ────────────────────────────────────────────────────────
+
+# Literal (non-glob) lookups through a PathIndex are exact; they agree
+# with matches_pattern only where fnmatch does not fold case/separators.
+_PATH_LOOKUPS_EXACT = os.path.normcase("A/b") == "A/b"
+
+
+class PathIndex:
+    """Directory-tree index over a file listing.
+
+    Built once from the output of :func:`list_sdist_files`,
+    :func:`list_wheel_files` or :func:`get_vcs_files`.  Every directory
+    node records the contiguous range its descendants occupy in the sorted
+    listing, so "does anything live under X" is an O(depth) lookup and
+    "list everything under X" costs O(depth + output).
+    """
+
+    __slots__ = ("_basenames", "_fileset", "_root", "files")
+
+    def __init__(self, files: list[str]) -> None:
+        self.files = sorted(files)
+        self._fileset = set(self.files)
+        self._basenames: dict[str, list[int]] | None = None
+        # A node is ``[children, lo, hi]``; ``files[lo:hi]`` are the files
+        # strictly below the directory it represents.
+        self._root: list = [{}, 0, len(self.files)]
+        for i, f in enumerate(self.files):
+            node = self._root
+            for part in f.split("/")[:-1]:
+                child = node[0].get(part)
+                if child is None:
+                    child = node[0][part] = [{}, i, i + 1]
+                else:
+                    child[2] = i + 1
+                node = child
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._fileset
+
+    def _node(self, path: str) -> list | None:
+        node = self._root
+        for part in path.split("/"):
+            node = node[0].get(part)
+            if node is None:
+                return None
+        return node
+
+    def is_dir(self, path: str) -> bool:
+        """Return True if any file lives below directory *path*."""
+        return self._node(path) is not None
+
+    def has_path(self, path: str) -> bool:
+        """Return True if *path* is a file or a non-empty directory."""
+        return path in self._fileset or self._node(path) is not None
+
+    def under(self, path: str) -> list[str]:
+        """Return *path* itself (if it is a file) and every file below it."""
+        node = self._node(path)
+        below = self.files[node[1] : node[2]] if node is not None else []
+        return [path, *below] if path in self._fileset else below
+
+    def _named(self, name: str) -> list[int]:
+        """Return the positions of the files whose basename is *name*."""
+        if self._basenames is None:
+            basenames: dict[str, list[int]] = {}
+            for i, f in enumerate(self.files):
+                basenames.setdefault(f.rpartition("/")[2], []).append(i)
+            self._basenames = basenames
+        return self._basenames.get(name, [])
+
+    def with_basename(self, name: str) -> list[str]:
+        """Return every file whose basename is *name*, in sorted order."""
+        return [self.files[i] for i in self._named(name)]
+
+    def _literal_ranges(self, name: str) -> list[tuple[int, int]]:
+        """Return the ``(lo, hi)`` ranges of :attr:`files` a bare-name pattern matches."""
+        ranges = [(i, i + 1) for i in self._named(name)]
+        if name in self._fileset:
+            i = bisect.bisect_left(self.files, name)
+            ranges.append((i, i + 1))
+        node = self._node(name)
+        if node is not None:
+            ranges.append((node[1], node[2]))
+        return ranges
+
+    def _literal_positions(self, name: str) -> list[int]:
+        ranges = self._literal_ranges(name)
+        if len(ranges) == 1:
+            return list(range(*ranges[0]))
+        return sorted({i for lo, hi in ranges for i in range(lo, hi)})
+
+    def matching_literal(self, name: str) -> list[str]:
+        """Return the files a bare-name pattern matches (see :func:`matches_pattern`)."""
+        return [self.files[i] for i in self._literal_positions(name)]
+
+
 # ── Pattern matching ──────────────────────────────────────────────────
 
 
-def matches_pattern(filepath: str, pattern: str) -> bool:
+def matches_pattern(filepath: str, pattern: str, *, platform: str | None = None) -> bool:
     """Check whether *filepath* matches *pattern*.
 
     * A bare name like ``check_dist`` matches any file whose path starts
       with ``check_dist/``.
     * Glob wildcards (``*``, ``?``, ``[…]``) are matched against both the
       full path and the basename.
-    * Extensions are translated to the current platform before matching.
+    * Extensions are translated to *platform* (default: the current
+      platform) before matching.
     """
-    translated = translate_extension(pattern)
+    translated = translate_extension(pattern, platform)
     is_glob = any(c in translated for c in "*?[")
 
     if not is_glob:
@@ -458,77 +803,268 @@ def matches_pattern(filepath: str, pattern: str) -> bool:
 
 
 def _matches_hatch_pattern(filepath: str, pattern: str) -> bool:
-    """Match a file path against a hatch include/exclude pattern.
+    """Match a file path against one hatch include/exclude pattern.
 
-    Hatch patterns may start with ``/`` (root-relative). Bare names match
-    as either an exact file, a directory prefix, or any path component.
+    Hatch patterns are gitignore patterns (see :mod:`._wildmatch`): they
+    may start with ``/`` (root-relative), bare names match at any depth,
+    and a match on a directory covers everything below it.
     """
-    pat = pattern.lstrip("/")
-    if filepath == pat:
-        return True
-    if filepath.startswith(pat.rstrip("/") + "/"):
-        return True
-    # Match as intermediate directory component (e.g. "target" in "rust/target/debug/foo")
-    component = pat.rstrip("/") + "/"
-    if "/" + component in "/" + filepath + "/":
-        return True
-    if fnmatch.fnmatch(filepath, pat):
-        return True
-    if fnmatch.fnmatch(os.path.basename(filepath), pat):
-        return True
-    return False
+    from ._wildmatch import WildMatchSpec
+
+    return WildMatchSpec([pattern]).match(filepath)
+
+
+class PatternSet:
+    """A set of ``present``/``absent`` patterns compiled for bulk matching.
+
+    Every pattern is translated with :func:`translate_extension` and
+    compiled once.  All patterns are additionally merged into a single
+    combined regex per match target (full path and basename), so a file
+    that matches none of them is rejected with two regex calls no matter
+    how many patterns the set holds.  Matching semantics are identical to
+    :func:`matches_pattern`.
+    """
+
+    __slots__ = ("_any_base", "_any_full", "_base", "_full", "patterns", "platform", "translated")
+
+    def __init__(self, patterns: list[str], *, platform: str | None = None) -> None:
+        self.patterns = list(patterns)
+        self.platform = platform
+        self.translated = [translate_extension(p, platform) for p in self.patterns]
+        full_sources: list[str] = []
+        base_sources: list[str] = []
+        for translated in self.translated:
+            key = os.path.normcase(translated)
+            glob = fnmatch.translate(key)
+            base_sources.append(glob)
+            if any(c in translated for c in "*?["):
+                full_sources.append(glob)
+            else:
+                # Exact and basename matches are covered by ``glob``; a bare
+                # name additionally matches everything below it.
+                full_sources.append(f"{glob}|(?s:{re.escape(os.path.normcase(translated + '/'))}.*)\\Z")
+        self._full = [re.compile(src) for src in full_sources]
+        self._base = [re.compile(src) for src in base_sources]
+        self._any_full = re.compile("|".join(f"(?:{src})" for src in full_sources)) if full_sources else None
+        self._any_base = re.compile("|".join(f"(?:{src})" for src in base_sources)) if base_sources else None
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def match_any(self, filepath: str) -> bool:
+        """Return True if *filepath* matches at least one pattern."""
+        if self._any_full is None:
+            return False
+        key = os.path.normcase(filepath)
+        return self._any_full.match(key) is not None or self._any_base.match(os.path.basename(key)) is not None
+
+    def match_indices(self, filepath: str, candidates: list[int] | None = None) -> list[int]:
+        """Return the indices of the patterns matching *filepath*.
+
+        When *candidates* is given only those pattern indices are tested.
+        """
+        if self._any_full is None:
+            return []
+        key = os.path.normcase(filepath)
+        base = os.path.basename(key)
+        if self._any_full.match(key) is None and self._any_base.match(base) is None:
+            return []
+        indices = range(len(self.patterns)) if candidates is None else candidates
+        return [i for i in indices if self._full[i].match(key) is not None or self._base[i].match(base) is not None]
+
+    def _split_literals(self, index: PathIndex | None) -> tuple[list[int], list[int]]:
+        """Split pattern indices into ``(literal, glob)``.
+
+        Literal (bare-name) patterns are only split out when *index* can
+        answer them; otherwise every pattern is treated as a glob.
+        """
+        everything = list(range(len(self.patterns)))
+        if index is None or not _PATH_LOOKUPS_EXACT:
+            return [], everything
+        literal = [i for i in everything if not any(c in self.translated[i] for c in "*?[")]
+        return literal, [i for i in everything if i not in literal]
+
+    def unmatched(self, files: list[str], *, index: PathIndex | None = None) -> list[int]:
+        """Return the indices of patterns that match none of *files*.
+
+        When *index* (a :class:`PathIndex` over *files*) is given, bare-name
+        patterns are resolved with O(depth) lookups instead of a scan.
+        """
+        literal, remaining = self._split_literals(index)
+        missing = [i for i in literal if not (index.has_path(self.translated[i]) or index.with_basename(self.translated[i]))]
+        for f in files:
+            if not remaining:
+                break
+            found = self.match_indices(f, remaining)
+            if found:
+                remaining = [i for i in remaining if i not in found]
+        return sorted(missing + remaining)
+
+    def classify(self, files: list[str], *, exclude: PatternSet | None = None, index: PathIndex | None = None) -> list[list[str]]:
+        """Return, per pattern, the files in *files* that it matches.
+
+        Files matching any pattern of *exclude* are left out of every
+        bucket.  Each file is classified in a single pass; with *index*,
+        bare-name patterns are answered from the index instead, and
+        whether a file matches *exclude* is decided once for all patterns
+        (see :class:`_Coverage`), with buckets in the index's sorted order.
+        """
+        literal, globs = self._split_literals(index)
+        buckets: list[list[str]] = [[] for _ in self.patterns]
+        if exclude and index is not None:
+            positions = {i: index._literal_positions(self.translated[i]) for i in literal}
+            covered = _Coverage(exclude, index)
+            for i in literal:
+                buckets[i] = [index.files[pos] for pos in positions[i] if not covered(pos)]
+            if globs:
+                for pos, f in enumerate(index.files):
+                    indices = self.match_indices(f, globs if literal else None)
+                    if not indices or covered(pos):
+                        continue
+                    for i in indices:
+                        buckets[i].append(f)
+            return buckets
+        for i in literal:
+            buckets[i] = [f for f in index.matching_literal(self.translated[i]) if not (exclude and exclude.match_any(f))]
+        if globs:
+            for f in files:
+                indices = self.match_indices(f, globs if literal else None)
+                if not indices or (exclude and exclude.match_any(f)):
+                    continue
+                for i in indices:
+                    buckets[i].append(f)
+        return buckets
+
+
+class _Coverage:
+    """Whether each file of a :class:`PathIndex` matches a :class:`PatternSet`.
+
+    Called with a file's position in the index.  Bare-name patterns mark
+    the directory ranges they cover up front; other files are tested
+    against their basename and the glob patterns the first time they are
+    asked about, and the answer is kept, so each file is matched at most
+    once however many patterns ask about it.
+    """
+
+    __slots__ = ("_globs", "_mask", "_names", "index")
+
+    _UNKNOWN, _COVERED, _CLEAR = 0, 1, 2
+
+    def __init__(self, patterns: PatternSet, index: PathIndex) -> None:
+        self.index = index
+        self._mask = bytearray(len(index))
+        literal, globs = patterns._split_literals(index)
+        self._names = frozenset(patterns.translated[i] for i in literal)
+        for name in self._names:
+            # Directory ranges are cheap to mark; so are basename matches
+            # once the index has built its basename map anyway.
+            if index._basenames is not None:
+                ranges = index._literal_ranges(name)
+            else:
+                node = index._node(name)
+                ranges = [(node[1], node[2])] if node is not None else []
+            for lo, hi in ranges:
+                self._mask[lo:hi] = bytes((self._COVERED,)) * (hi - lo)
+        self._globs = PatternSet([patterns.patterns[i] for i in globs], platform=patterns.platform) if literal else patterns
+
+    def __call__(self, pos: int) -> bool:
+        state = self._mask[pos]
+        if state == self._UNKNOWN:
+            f = self.index.files[pos]
+            # A bare name also matches the file itself and any file of that basename.
+            hit = f in self._names or f.rpartition("/")[2] in self._names or self._globs.match_any(f)
+            state = self._mask[pos] = self._COVERED if hit else self._CLEAR
+        return state == self._COVERED
 
 
 # ── Checking helpers ──────────────────────────────────────────────────
 
 
-def check_present(files: list[str], patterns: list[str], dist_type: str) -> list[str]:
-    """Return error strings for any *patterns* not found in *files*."""
-    errors: list[str] = []
-    for pattern in patterns:
-        translated = translate_extension(pattern)
-        if not any(matches_pattern(f, pattern) for f in files):
-            msg = f"{dist_type}: required pattern '{pattern}' not found"
-            if translated != pattern:
-                msg += f" (translated to '{translated}' for {sys.platform})"
-            errors.append(msg)
-    return errors
+def check_present(files: list[str], patterns: list[str], dist_type: str, *, index: PathIndex | None = None, platform: str | None = None) -> list[str]:
+    """Return error strings for any *patterns* not found in *files*.
+
+    *index* is an optional :class:`PathIndex` over *files*, reused across
+    checks to answer bare-name patterns without scanning.  Extensions in
+    *patterns* are translated for *platform* (see :func:`translate_extension`).
+    """
+    return [str(f) for f in _present_findings(files, patterns, dist_type, index=index, platform=platform)]
+
+
+def _present_findings(
+    files: list[str], patterns: list[str], dist_type: str, *, index: PathIndex | None = None, platform: str | None = None
+) -> list[Finding]:
+    findings: list[Finding] = []
+    pattern_set = PatternSet(patterns, platform=platform)
+    platform = sys.platform if platform is None else platform
+    for i in pattern_set.unmatched(files, index=index):
+        pattern, translated = pattern_set.patterns[i], pattern_set.translated[i]
+        findings.append(Finding(PRESENT, dist_type, pattern=pattern, translated=translated if translated != pattern else None, platform=platform))
+    return findings
 
 
-def check_absent(files: list[str], patterns: list[str], dist_type: str, *, present_patterns: list[str] | None = None) -> list[str]:
+def check_absent(
+    files: list[str],
+    patterns: list[str],
+    dist_type: str,
+    *,
+    present_patterns: list[str] | None = None,
+    index: PathIndex | None = None,
+    platform: str | None = None,
+) -> list[str]:
     """Return error strings for any *patterns* found in *files*.
 
     When *present_patterns* is given, files nested inside a directory
     that matches a present pattern are not flagged.  This avoids false
     positives like ``lerna/tests/fake_package/pyproject.toml`` being
     flagged as unwanted when ``lerna`` is a required present pattern.
+
+    *index* is an optional :class:`PathIndex` over *files*.  Extensions in
+    both pattern lists are translated for *platform* (see
+    :func:`translate_extension`).
     """
-    errors: list[str] = []
-    for pattern in patterns:
-        translated = translate_extension(pattern)
-        matching = [f for f in files if matches_pattern(f, pattern)]
-        if matching and present_patterns:
-            matching = [f for f in matching if not any(matches_pattern(f, pp) for pp in present_patterns)]
+    return [str(f) for f in _absent_findings(files, patterns, dist_type, present_patterns=present_patterns, index=index, platform=platform)]
+
+
+def _absent_findings(
+    files: list[str],
+    patterns: list[str],
+    dist_type: str,
+    *,
+    present_patterns: list[str] | None = None,
+    index: PathIndex | None = None,
+    platform: str | None = None,
+) -> list[Finding]:
+    findings: list[Finding] = []
+    pattern_set = PatternSet(patterns, platform=platform)
+    buckets = pattern_set.classify(files, exclude=PatternSet(present_patterns or [], platform=platform), index=index)
+    platform = sys.platform if platform is None else platform
+    for pattern, translated, matching in zip(pattern_set.patterns, pattern_set.translated, buckets):
         if matching:
-            msg = f"{dist_type}: unwanted pattern '{pattern}' matched: {', '.join(matching)}"
-            if translated != pattern:
-                msg += f" (translated to '{translated}' for {sys.platform})"
-            errors.append(msg)
-    return errors
+            translated = translated if translated != pattern else None
+            findings.append(Finding(ABSENT, dist_type, pattern=pattern, paths=matching, translated=translated, platform=platform))
+    return findings
+
 
+def check_wrong_platform_extensions(files: list[str], dist_type: str, *, platform: str | None = None) -> list[str]:
+    """Flag files that use an extension from a platform other than *platform* (default: the current one)."""
+    return [str(f) for f in _platform_findings(files, dist_type, platform=platform)]
 
-def check_wrong_platform_extensions(files: list[str], dist_type: str) -> list[str]:
-    """Flag files that use an extension from another platform."""
-    wrong_exts = _wrong_platform_extensions()
-    errors: list[str] = []
+
+def _platform_findings(files: list[str], dist_type: str, *, platform: str | None = None) -> list[Finding]:
+    wrong_exts = _WRONG_PLATFORM_EXTENSIONS[_get_platform_key(platform)]
+    target = sys.platform if platform is None else platform
+    findings: list[Finding] = []
     for f in files:
+        if not f.endswith(wrong_exts):
+            continue
         for ext in wrong_exts:
             if f.endswith(ext):
-                correct = translate_extension(f)
-                errors.append(
-                    f"{dist_type}: '{f}' uses extension '{ext}' which is incorrect for {sys.platform} (expected '{os.path.splitext(correct)[1]}')"
-                )
-    return errors
+                expected = os.path.splitext(translate_extension(f, platform))[1]
+                findings.append(Finding(PLATFORM_EXTENSION, dist_type, pattern=ext, paths=(f,), detail=expected, platform=target))
+    return findings
 
 
 # Patterns for top-level files hatch automatically includes in sdists.
@@ -549,7 +1085,23 @@ def _is_hatch_auto_included(filename: str) -> bool:
     return any(fnmatch.fnmatch(filename, pat) for pat in _HATCH_AUTO_INCLUDE_PATTERNS)
 
 
-def _sdist_expected_files(vcs_files: list[str], hatch_config: dict) -> set[str]:
+def _sorted_under(files: list[str], path: str) -> list[str]:
+    """Return *path* itself (if listed) and every file below it, from sorted *files*.
+
+    Everything below ``path/`` is one contiguous range of the listing
+    (``"0"`` sorts right after ``"/"``), found by binary search.
+    """
+    lo = bisect.bisect_left(files, path + "/")
+    below = files[lo : bisect.bisect_left(files, path + "0", lo)]
+    return [path, *below] if _sorted_contains(files, path) else below
+
+
+def _sorted_contains(files: list[str], path: str) -> bool:
+    i = bisect.bisect_left(files, path)
+    return i < len(files) and files[i] == path
+
+
+def _sdist_expected_files(vcs_files: list[str], hatch_config: dict, *, index: PathIndex | None = None, presorted: bool = False) -> set[str]:
     """Derive the set of VCS files we expect to see in the sdist,
     taking ``[tool.hatch.build.targets.sdist]`` into account.
 
@@ -563,7 +1115,18 @@ def _sdist_expected_files(vcs_files: list[str], hatch_config: dict) -> set[str]:
     5. ``force-include`` entries are always present regardless of other
        settings.  Hatch also auto-force-includes ``pyproject.toml``,
        ``.gitignore``, README, and LICENSE files.
+
+    Path expansion for ``only-include``/``packages`` and ``force-include``
+    takes each path's range of the sorted listing by binary search, so it
+    costs O(paths × log(files) + output).  The listing is *vcs_files*
+    when *presorted* (as :func:`get_vcs_files` returns it), the files of
+    *index* (a :class:`PathIndex` over *vcs_files*) if given, and a sorted
+    copy of *vcs_files* otherwise.  ``include`` and ``exclude`` are
+    gitignore patterns, each list compiled into one matcher (as hatchling
+    does with ``pathspec``) so every file is matched once per list.
     """
+    from ._wildmatch import WildMatchSpec
+
     sdist_cfg = hatch_config.get("targets", {}).get("sdist", {})
     only_include = sdist_cfg.get("only-include")
     packages = sdist_cfg.get("packages")
@@ -581,34 +1144,37 @@ def _sdist_expected_files(vcs_files: list[str], hatch_config: dict) -> set[str]:
     # When truthy, only those directory roots are walked.
     scan_paths = only_include if only_include is not None else packages
 
+    if index is not None:
+        listing = index.files
+    elif presorted or (scan_paths is None and not force_include):
+        listing = vcs_files
+    else:
+        listing = sorted(vcs_files)
+
     expected = set()
     if scan_paths is not None:
-        for f in vcs_files:
-            if any(f == p or f.startswith(p.rstrip("/") + "/") for p in scan_paths):
-                expected.add(f)
+        for p in scan_paths:
+            expected.update(_sorted_under(listing, p.rstrip("/")))
     elif includes:
         # No only-include or packages: full tree walk, but include
         # patterns act as a filter.
-        for f in vcs_files:
-            if any(_matches_hatch_pattern(f, inc) for inc in includes):
-                expected.add(f)
+        include_spec = WildMatchSpec(includes)
+        expected = {f for f in vcs_files if include_spec.match(f)}
     else:
         # No restrictions — everything in VCS is expected.
         expected = set(vcs_files)
 
     # Step 2: Apply excludes (never affects force-include).
     if excludes:
-        expected = {f for f in expected if not any(_matches_hatch_pattern(f, exc) for exc in excludes)}
+        exclude_spec = WildMatchSpec(excludes)
+        expected = {f for f in expected if not exclude_spec.match(f)}
 
     # Step 3: Add force-include destinations.
     # force-include is {source: dest} — we care about the dest paths
     # since those are what appear in the archive.
     for dest in force_include.values():
-        dest = dest.strip("/")
-        # If the dest matches a VCS file, add it.
-        for f in vcs_files:
-            if f == dest or f.startswith(dest.rstrip("/") + "/"):
-                expected.add(f)
+        # If the dest matches a VCS file (or directory), add it.
+        expected.update(_sorted_under(listing, dest.strip("/")))
 
     return expected
 
@@ -616,16 +1182,97 @@ def _sdist_expected_files(vcs_files: list[str], hatch_config: dict) -> set[str]:
 _GENERATED_SDIST_FILES = {"PKG-INFO"}
 
 
+def _vcs_pathspecs(hatch_config: dict, sdist_files: list[str]) -> list[str] | None:
+    """Return the paths the VCS listing for :func:`check_sdist_vs_vcs` can be limited to.
+
+    :func:`_sdist_expected_files` only looks below ``only-include`` (or
+    ``packages``) and ``force-include`` destinations, and the untracked
+    file check only looks up the sdist's own files, which all live below
+    the sdist's top-level entries (this covers hatch's auto-included
+    top-level files).  Listing just those paths therefore gives the same
+    result as listing everything.  Returns ``None`` when the whole tree
+    is needed.
+    """
+    sdist_cfg = hatch_config.get("targets", {}).get("sdist", {})
+    only_include = sdist_cfg.get("only-include")
+    scan_paths = only_include if only_include is not None else sdist_cfg.get("packages")
+    if scan_paths is None:
+        return None
+    force_include = sdist_cfg.get("force-include") or hatch_config.get("force-include", {})
+    paths = {p.rstrip("/") for p in scan_paths}
+    paths.update(dest.strip("/") for dest in force_include.values())
+    paths.update(f.partition("/")[0] for f in sdist_files)
+    if any(not p or p == "." or p.startswith(("/", "../")) or p == ".." for p in paths):
+        return None
+    return sorted(paths)
+
+
+def _build_pathspecs(source_dir: str, hatch_config: dict) -> list[str] | None:
+    """Return the paths a hatch build of *source_dir* can read, or ``None`` for all.
+
+    Like :func:`_vcs_pathspecs`, but known before building: the
+    ``only-include`` (or ``packages``) paths, the ``force-include``
+    sources and every top-level file (``pyproject.toml``, readme,
+    license, build hooks).  Used to scope the build cache key.
+    """
+    sdist_cfg = hatch_config.get("targets", {}).get("sdist", {})
+    only_include = sdist_cfg.get("only-include")
+    scan_paths = only_include if only_include is not None else sdist_cfg.get("packages")
+    if scan_paths is None:
+        return None
+    force_include = sdist_cfg.get("force-include") or hatch_config.get("force-include", {})
+    paths = {p.rstrip("/") for p in scan_paths}
+    paths.update(source.rstrip("/") for source in force_include)
+    if any(not p or p == "." or p.startswith(("/", "../")) or p == ".." for p in paths):
+        return None
+    paths.update(entry.name for entry in os.scandir(source_dir) if entry.is_file())
+    return sorted(paths)
+
+
+def _filter_pathspecs(files: list[str], pathspecs: list[str] | None) -> list[str]:
+    """Return the entries of *files* equal to or below one of *pathspecs*."""
+    if pathspecs is None:
+        return files
+    exact = set(pathspecs)
+    below = tuple(p + "/" for p in exact)
+    return [f for f in files if f in exact or f.startswith(below)]
+
+
 def check_sdist_vs_vcs(
     sdist_files: list[str],
     vcs_files: list[str],
     hatch_config: dict,
     sdist_absent: list[str] | None = None,
+    *,
+    vcs_index: PathIndex | None = None,
+    dist_type: str = "sdist",
 ) -> list[str]:
-    """Compare sdist contents against VCS-tracked files."""
-    errors: list[str] = []
-    expected = _sdist_expected_files(vcs_files, hatch_config)
-    vcs_set = set(vcs_files)
+    """Compare sdist contents against VCS-tracked files.
+
+    *vcs_index* is an optional :class:`PathIndex` over *vcs_files*.
+    *dist_type* labels the sdist in error messages.
+    """
+    findings = _sdist_vcs_findings(sdist_files, vcs_files, hatch_config, sdist_absent, vcs_index=vcs_index, dist_type=dist_type)
+    return [str(f) for f in findings]
+
+
+def _sdist_vcs_findings(
+    sdist_files: list[str],
+    vcs_files: list[str],
+    hatch_config: dict,
+    sdist_absent: list[str] | None = None,
+    *,
+    vcs_index: PathIndex | None = None,
+    dist_type: str = "sdist",
+    presorted: bool = False,
+) -> list[Finding]:
+    """Return the findings of :func:`check_sdist_vs_vcs`.
+
+    With *presorted* (sorted *vcs_files*), VCS membership is looked up by
+    binary search instead of hashing the whole listing.
+    """
+    findings: list[Finding] = []
+    expected = _sdist_expected_files(vcs_files, hatch_config, index=vcs_index, presorted=presorted)
 
     # Clean sdist set: remove generated metadata
     sdist_set = {f for f in sdist_files if f not in _GENERATED_SDIST_FILES and ".egg-info/" not in f and not f.endswith(".egg-info")}
@@ -635,9 +1282,13 @@ def check_sdist_vs_vcs(
 
     # "Extra" = files in sdist that are neither VCS-tracked nor
     # generated artifacts.  This catches truly stray files.
-    extra = sorted(sdist_set - vcs_set)
+    if presorted:
+        extra = [f for f in sorted(sdist_set) if not _sorted_contains(vcs_files, f)]
+    else:
+        extra = sorted(sdist_set - set(vcs_files))
     if artifacts:
-        extra = [f for f in extra if not any(matches_pattern(f, art) for art in artifacts)]
+        artifact_set = PatternSet(artifacts)
+        extra = [f for f in extra if not artifact_set.match_any(f)]
 
     # "Missing" = VCS source files (under packages / includes) that
     # are absent from the sdist.
@@ -651,18 +1302,395 @@ def check_sdist_vs_vcs(
     all_absent = list(_COMMON_SDIST_ABSENT)
     if sdist_absent:
         all_absent.extend(sdist_absent)
-    missing = [f for f in missing if not any(matches_pattern(f, pat) for pat in all_absent)]
+    absent_set = PatternSet(all_absent)
+    missing = [f for f in missing if not absent_set.match_any(f)]
 
     if extra:
-        errors.append("\nsdist contains files not tracked by VCS:\n\t" + "\n\t".join(extra))
+        findings.append(Finding(UNTRACKED, dist_type, paths=extra))
     if missing:
-        errors.append("\nVCS-tracked files missing from sdist: \n\t" + "\n\t".join(missing))
-    return errors
+        findings.append(Finding(MISSING, dist_type, paths=missing))
+    return findings
+
+
+# ── Checking artifacts ────────────────────────────────────────────────
+
+
+def find_all_dist_files(output_dir: str) -> tuple[list[str], list[str]]:
+    """Return ``(sdist_paths, wheel_paths)`` of every distribution in *output_dir*, sorted.
+
+    Unlike :func:`find_dist_files`, a directory holding many wheels (e.g.
+    a cibuildwheel ``wheelhouse/``) yields all of them.
+    """
+    if not os.path.isdir(output_dir):
+        return [], []
+    names = sorted(os.listdir(output_dir))
+    sdists = [os.path.join(output_dir, n) for n in names if n.endswith((".tar.gz", ".zip"))]
+    wheels = [os.path.join(output_dir, n) for n in names if n.endswith(".whl")]
+    return sdists, wheels
+
+
+def _group_identical(paths: list[str], listings: list[list[str]], keys: list[object] | None = None) -> list[tuple[list[str], list[str]]]:
+    """Group *paths* whose file listings (and *keys*, if given) are identical, keeping first-seen order."""
+    groups: dict[tuple, tuple[list[str], list[str]]] = {}
+    for path, files, key in zip(paths, listings, keys if keys is not None else [None] * len(paths)):
+        groups.setdefault((key, tuple(files)), ([], files))[0].append(path)
+    return list(groups.values())
+
+
+def _label(kind: str, path: str, kind_paths: list[str]) -> str:
+    return kind if len(kind_paths) == 1 else f"{kind} {os.path.basename(path)}"
+
+
+def _check_sdist_files(
+    sdist_files: list[str],
+    label: str,
+    config: dict,
+    hatch_config: dict,
+    vcs_files: list[str] | None,
+    *,
+    timings: Timings,
+    platform: str | None = None,
+) -> list[CheckResult]:
+    results: list[CheckResult] = []
+    if vcs_files is not None:
+        with timings.phase(f"check_sdist_vs_vcs ({label})"):
+            findings = _sdist_vcs_findings(
+                sdist_files, vcs_files, hatch_config, sdist_absent=config["sdist"]["absent"], dist_type=label, presorted=True
+            )
+        results.extend(CheckResult(check, label, [f for f in findings if f.check == check]) for check in (UNTRACKED, MISSING))
+    results.extend(_check_listing(sdist_files, label, config["sdist"], timings=timings, platform=platform))
+    return results
+
+
+def _check_wheel_files(wheel_files: list[str], label: str, config: dict, *, timings: Timings, platform: str | None = None) -> list[CheckResult]:
+    return _check_listing(wheel_files, label, config["wheel"], timings=timings, platform=platform)
+
+
+def _check_listing(files: list[str], label: str, patterns: dict, *, timings: Timings, platform: str | None = None) -> list[CheckResult]:
+    """Run the pattern and platform checks shared by sdists and wheels, for *platform*."""
+    index = PathIndex(files)
+    with timings.phase(f"check_present ({label})"):
+        present = CheckResult(PRESENT, label, _present_findings(files, patterns["present"], label, index=index, platform=platform))
+    with timings.phase(f"check_absent ({label})"):
+        absent = CheckResult(
+            ABSENT,
+            label,
+            _absent_findings(files, patterns["absent"], label, present_patterns=patterns["present"], index=index, platform=platform),
+        )
+    with timings.phase(f"check_wrong_platform_extensions ({label})"):
+        extensions = CheckResult(PLATFORM_EXTENSION, label, _platform_findings(files, label, platform=platform))
+    return [present, absent, extensions]
+
+
+def _check_record(wheel_path: str, label: str, *, jobs: int | None) -> list[CheckResult]:
+    from ._record import _record_findings
+
+    return [CheckResult(RECORD, label, _record_findings(wheel_path, jobs=jobs, dist_type=label))]
+
+
+def _memoized(memo: dict | None, name: str, path: str, extra: tuple, compute: Callable[[], list]) -> list:
+    """Return ``compute()``, reused from *memo* while the file at *path* is unchanged.
+
+    The key is ``(name, path, size, mtime, inode, *extra)``; *memo* only
+    needs ``get`` and item assignment.
+    """
+    if memo is None:
+        return compute()
+    st = os.stat(path)
+    key = (name, path, st.st_size, st.st_mtime_ns, st.st_ino, *extra)
+    value = memo.get(key)
+    if value is None:
+        value = memo[key] = compute()
+    return value
+
+
+def _memoized_vcs_files(source_dir: str, pathspecs: list[str] | None, memo: dict | None) -> list[str]:
+    """Return :func:`get_vcs_files`, reused from *memo* while the git index is unchanged."""
+    from ._gitindex import listing_index_path
+
+    compute = partial(get_vcs_files, source_dir, pathspecs)
+    index = listing_index_path(source_dir) if memo is not None else None
+    if index is None:
+        return compute()
+    return _memoized(memo, "vcs", index, (source_dir, None if pathspecs is None else tuple(pathspecs)), compute)
+
+
+def _digest(*parts: object) -> str:
+    """Return a short stable digest of JSON-serializable *parts*."""
+    import hashlib
+    import json
+
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def _check_artifacts(
+    sdist_paths: list[str],
+    wheel_paths: list[str],
+    config: dict,
+    hatch_config: dict,
+    vcs_files: list[str] | None,
+    *,
+    source_dir: str | None = None,
+    verbose: bool = False,
+    memo: dict | None = None,
+    timings: Timings | None = None,
+    platform: str | None = None,
+    on_message: Callable[[str], None] | None = None,
+    on_event: Callable[[Event], None] | None = None,
+) -> tuple[list[str], list[CheckResult]]:
+    """Check every sdist and wheel concurrently; return ``(messages, results)``.
+
+    *memo*, if given, keeps archive listings, RECORD results and check
+    results across calls, keyed by each artifact's path, size, mtime and
+    inode (and, for checks, by the configuration and VCS listing), so
+    unchanged artifacts are neither read nor checked again.  The VCS
+    listing is kept the same way, keyed by the git index file.
+
+    Without *vcs_files*, the VCS listing of *source_dir* is taken once the
+    sdists are listed, limited to the paths they can contain (see
+    :func:`_vcs_pathspecs`).
+
+    Artifacts are listed and checked on a thread pool.  Artifacts of one
+    kind with identical file listings are checked once, and their findings
+    are reported under the first of them.  With a single artifact of a
+    kind, messages use the plain ``sdist``/``wheel`` label; otherwise each
+    is labelled with its file name.  Every wheel's RECORD is verified.
+
+    Extension patterns and the wrong-extension check follow *platform*
+    for every artifact when given.  Otherwise each wheel is checked for
+    the platform of its file name's tag (see :func:`wheel_platform`), so
+    one run can check a whole cross-platform wheelhouse, and sdists and
+    pure-Python wheels for the current platform.
+
+    Listings, the VCS listing and each check are recorded in *timings*
+    (results reused from *memo* are not).
+
+    With *on_message*, messages are passed to it as each artifact's
+    results come in, in the order they would be returned, instead of
+    being returned.  *on_event* is called on this thread with a
+    ``listed`` :class:`check_dist._events.Event` per archive once listed
+    and a ``finding`` event per finding.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = sdist_paths + wheel_paths
+    if not paths:
+        return [], []
+    timings = timings if timings is not None else Timings(on_event)
+    messages: list[str] = []
+    emit = messages.append if on_message is None else on_message
+    results: list[CheckResult] = []
+    workers = min(len(paths), os.cpu_count() or 1)
+    # With many wheels, parallelism comes from checking them side by side.
+    record_jobs = 1 if len(wheel_paths) > 1 else None
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="check-dist-artifact") as pool:
+        wheel_listing_futures = [
+            pool.submit(_memoized, memo, "list", path, (), timings.timed(f"list {os.path.basename(path)}", partial(list_wheel_files, path)))
+            for path in wheel_paths
+        ]
+        sdist_listing_futures = [
+            pool.submit(_memoized, memo, "list", path, (), timings.timed(f"list {os.path.basename(path)}", partial(list_sdist_files, path)))
+            for path in sdist_paths
+        ]
+        sdist_listings = [future.result() for future in sdist_listing_futures]
+        if on_event is not None:
+            for path, files in zip(sdist_paths, sdist_listings):
+                on_event(Event(LISTED, os.path.basename(path), files))
+        vcs_error = None
+        config_digest = vcs_digest = None
+        if vcs_files is None and sdist_listings and source_dir is not None:
+            pathspecs = _vcs_pathspecs(hatch_config, [f for files in sdist_listings for f in files])
+            try:
+                with timings.phase("vcs listing"):
+                    vcs_files = _memoized_vcs_files(source_dir, pathspecs, memo)
+            except CheckDistError as exc:
+                vcs_error = exc
+        wheel_listings = [future.result() for future in wheel_listing_futures]
+        if on_event is not None:
+            for path, files in zip(wheel_paths, wheel_listings):
+                on_event(Event(LISTED, os.path.basename(path), files))
+        if memo is not None:
+            # Check results also depend on the platform (extension checks).
+            config_digest = _digest(config, hatch_config, sys.platform if platform is None else platform)
+            vcs_digest = _digest(vcs_files)
+        record_futures = []
+        for path in wheel_paths:
+            label = _label("wheel", path, wheel_paths)
+            compute = timings.timed(f"check_wheel_record ({label})", partial(_check_record, path, label, jobs=record_jobs))
+            record_futures.append(pool.submit(_memoized, memo, "record", path, (label,), compute))
+
+        wheel_platforms = [platform if platform is not None else wheel_platform(path) for path in wheel_paths]
+        sections = []
+        for kind, kind_paths, listings, targets in (
+            ("sdist", sdist_paths, sdist_listings, [platform] * len(sdist_paths)),
+            ("wheel", wheel_paths, wheel_listings, wheel_platforms),
+        ):
+            for group_paths, files in _group_identical(kind_paths, listings, targets):
+                label = _label(kind, group_paths[0], kind_paths)
+                target = targets[kind_paths.index(group_paths[0])]
+                if kind == "sdist":
+                    compute = partial(_check_sdist_files, files, label, config, hatch_config, vcs_files, timings=timings, platform=target)
+                    extra = (label, config_digest, vcs_digest)
+                else:
+                    compute = partial(_check_wheel_files, files, label, config, timings=timings, platform=target)
+                    extra = (label, config_digest, target)
+                future = pool.submit(_memoized, memo, f"{kind}-checks", group_paths[0], extra, compute)
+                sections.append((kind, group_paths, files, future))
+
+        for kind, group_paths, files, future in sections:
+            first = os.path.basename(group_paths[0])
+            emit(f"\n{kind} ({first}) – {len(files)} file(s):")
+            for other in group_paths[1:]:
+                emit(f"\n{kind} ({os.path.basename(other)}) – same files as {first}")
+            if kind == "sdist" and vcs_error is not None:
+                emit(f"  Warning: could not compare against VCS: {vcs_error}")
+            if verbose:
+                for f in files:
+                    emit(f"  {f}")
+            _collect(results, future.result(), on_event)
+        for future in record_futures:
+            _collect(results, future.result(), on_event)
+    return messages, results
+
+
+def _collect(results: list[CheckResult], new: list[CheckResult], on_event: Callable[[Event], None] | None) -> None:
+    """Add *new* to *results*, passing each of their findings to *on_event*."""
+    results.extend(new)
+    if on_event is not None:
+        for finding in iter_findings(new):
+            on_event(Event(FINDING, finding.dist_type, finding))
+
+
+def _build(
+    source_dir: str,
+    output_dir: str,
+    *,
+    no_isolation: bool = False,
+    parallel_build: bool = False,
+    in_process_build: bool = False,
+    reuse_build_env: bool = False,
+    find_links: list[str] | None = None,
+    on_build_output: Callable[[str], None] | None = None,
+) -> list[str]:
+    """Build the sdist and wheel with the frontend selected by the options of :func:`check_dist`."""
+    if in_process_build or reuse_build_env or find_links:
+        from ._frontend import build_dists_in_process
+
+        return build_dists_in_process(
+            source_dir,
+            output_dir,
+            no_isolation=no_isolation,
+            on_output=on_build_output,
+            reuse_env=reuse_build_env,
+            find_links=find_links or (),
+        )
+    return build_dists(source_dir, output_dir, no_isolation=no_isolation, parallel=parallel_build)
+
+
+def _evaluate(
+    source_dir: str,
+    config: dict,
+    hatch_config: dict,
+    sdist_paths: list[str],
+    wheel_paths: list[str],
+    *,
+    pre_built: bool,
+    vcs_files: list[str] | None,
+    verbose: bool = False,
+    memo: dict | None = None,
+    timings: Timings | None = None,
+    max_paths: int | None = None,
+    platform: str | None = None,
+    on_message: Callable[[str], None] | None = None,
+    on_event: Callable[[Event], None] | None = None,
+) -> tuple[bool, list[str], list[CheckResult]]:
+    """Run every check on already built distributions; returns ``(success, messages, results)``.
+
+    Error messages list at most *max_paths* paths per finding (all by
+    default).  *platform*, *on_message* and *on_event* are as for
+    :func:`_check_artifacts`.
+    """
+    messages: list[str] = []
+    emit = messages.append if on_message is None else on_message
+    missing: list[Finding] = []
+    if not sdist_paths and not wheel_paths:
+        missing.append(Finding(DISTRIBUTIONS, None, detail="No distributions found after build"))
+    elif pre_built:
+        if not sdist_paths:
+            missing.append(Finding(DISTRIBUTIONS, None, detail="No sdist found in pre-built directory"))
+        if not wheel_paths:
+            missing.append(Finding(DISTRIBUTIONS, None, detail="No wheel found in pre-built directory"))
+    results: list[CheckResult] = []
+    _collect(results, [CheckResult(DISTRIBUTIONS, None, missing)], on_event)
+
+    _, artifact_results = _check_artifacts(
+        sdist_paths,
+        wheel_paths,
+        config,
+        hatch_config,
+        vcs_files,
+        source_dir=source_dir,
+        verbose=verbose,
+        memo=memo,
+        timings=timings,
+        platform=platform,
+        on_message=emit,
+        on_event=on_event,
+    )
+    results.extend(artifact_results)
+
+    findings = list(iter_findings(results))
+    if findings:
+        emit(f"\n{len(findings)} error(s) found:")
+        for finding in findings:
+            emit(f"  ERROR: {finding.format(max_paths)}")
+        return False, messages, results
+
+    emit("\nAll checks passed!")
+    return True, messages, results
 
 
 # ── Main entry point ──────────────────────────────────────────────────
 
 
+class CheckDistResult(tuple):
+    """Outcome of :func:`check_dist`: the pair ``(success, messages)``.
+
+    Like :func:`os.stat` results, it unpacks as that pair but carries more
+    attributes: :attr:`timings` holds the wall and CPU time of each phase
+    of the run (see :class:`check_dist._timings.Timings`), and
+    :attr:`results` the outcome of each check as a
+    :class:`check_dist._findings.CheckResult`, whose findings keep pattern
+    and paths apart for reporting other than *messages* (see
+    :func:`check_dist._findings.write_json`).
+    """
+
+    timings: Timings
+    results: list[CheckResult]
+
+    def __new__(cls, success: bool, messages: list[str], timings: Timings | None = None, results: list[CheckResult] | None = None):
+        result = super().__new__(cls, (success, messages))
+        result.timings = timings if timings is not None else Timings()
+        result.results = results if results is not None else []
+        return result
+
+    def __reduce__(self) -> tuple:
+        return CheckDistResult, (self[0], self[1], self.timings, self.results)
+
+    @property
+    def success(self) -> bool:
+        return self[0]
+
+    @property
+    def messages(self) -> list[str]:
+        return self[1]
+
+    @property
+    def findings(self) -> list[Finding]:
+        """Every finding of :attr:`results`, in order; empty on success."""
+        return list(iter_findings(self.results))
+
+
 def check_dist(
     source_dir: str = ".",
     *,
@@ -670,7 +1698,18 @@ def check_dist(
     verbose: bool = False,
     pre_built: str | None = None,
     rebuild: bool = False,
-) -> tuple[bool, list[str]]:
+    use_cache: bool = True,
+    parallel_build: bool = False,
+    in_process_build: bool = False,
+    reuse_build_env: bool = False,
+    find_links: list[str] | None = None,
+    on_build_output: Callable[[str], None] | None = None,
+    vcs_files: list[str] | None = None,
+    max_paths: int | None = None,
+    platform: str | None = None,
+    on_message: Callable[[str], None] | None = None,
+    on_event: Callable[[Event], None] | None = None,
+) -> CheckDistResult:
     """Run all distribution checks.
 
     Parameters
@@ -688,94 +1727,182 @@ def check_dist(
     rebuild:
         Force a fresh build even when pre-built distributions exist in
         ``dist/`` or ``wheelhouse/``.
-
-    Returns ``(success, messages)``.
+    use_cache:
+        Reuse distributions from the on-disk build cache when no
+        packaging-relevant input changed since they were built, and store
+        fresh builds there (see :class:`check_dist._cache.BuildCache`).
+        Also keep archive listings, the VCS listing and check results
+        between runs, so unchanged inputs are neither re-read nor
+        re-checked (see :class:`check_dist._state.CheckState`).
+    parallel_build:
+        Build the sdist and wheel concurrently instead of trying a combined
+        build first (see :func:`build_dists`).
+    in_process_build:
+        Drive the PEP 517 hooks directly from one prepared environment
+        instead of spawning ``python -m build`` (see
+        :func:`check_dist._frontend.build_dists_in_process`).
+    reuse_build_env:
+        Take the isolated build environment from the persistent pool
+        shared across runs and projects (see
+        :class:`check_dist._frontend.EnvPool`).  Implies *in_process_build*.
+    find_links:
+        Install build requirements offline from these wheel directories
+        or URLs only.  Implies *in_process_build*.
+    on_build_output:
+        Called with each line of backend output during an in-process build.
+    vcs_files:
+        Sorted VCS-tracked files relative to *source_dir*, if already known
+        (see :func:`check_dist._batch.check_dist_many`); otherwise
+        :func:`get_vcs_files` is called.
+    max_paths:
+        List at most this many paths per error in *messages* (default:
+        all); :attr:`CheckDistResult.results` always holds every path.
+    platform:
+        Check every distribution as built for this platform (a
+        ``sys.platform`` value: ``linux``, ``darwin`` or ``win32``).  By
+        default each wheel is checked for the platform of its file name's
+        tag (see :func:`wheel_platform`), and sdists and pure-Python
+        wheels for the current platform.
+    on_message:
+        Called with each message as soon as it is produced, instead of
+        collecting the messages in :attr:`CheckDistResult.messages`
+        (which is then empty), so a caller can print a long run as it
+        goes without holding every line.
+    on_event:
+        Called with a :class:`check_dist._events.Event` as the run
+        progresses: ``phase-start`` and ``phase-end`` around each timed
+        phase (see :class:`check_dist._timings.Timings`), ``listed`` with
+        the files of each archive and ``finding`` for each finding.
+        Calls never overlap, but may come from worker threads.
+
+    Returns a :class:`CheckDistResult`, which unpacks as
+    ``(success, messages)`` and records the time spent in each phase and
+    the structured result of each check.
     """
     messages: list[str] = []
-    errors: list[str] = []
+    emit = messages.append if on_message is None else on_message
+    if on_event is not None:
+        on_event = _serialized(on_event)
+    timings = Timings(on_event)
     source_dir = os.path.abspath(source_dir)
 
-    pyproject_path = os.path.join(source_dir, "pyproject.toml")
-    config = load_config(pyproject_path, source_dir=source_dir)
-    hatch_config = load_hatch_config(pyproject_path)
-
-    if pre_built is not None:
-        dist_dir = os.path.abspath(pre_built)
-        messages.append(f"Using pre-built distributions from {dist_dir}")
-        sdist_path, wheel_path = find_dist_files(dist_dir)
-    elif not rebuild:
-        # Auto-detect pre-built dists in dist/ or wheelhouse/
-        detected = _find_pre_built(source_dir)
-        if detected is not None:
-            dist_dir = detected
-            messages.append(f"Using pre-built distributions from {dist_dir}")
-            sdist_path, wheel_path = find_dist_files(dist_dir)
-            pre_built = dist_dir  # so downstream logic treats it as pre-built
+    with timings.phase("config"):
+        project = ProjectContext.load(os.path.join(source_dir, "pyproject.toml"), source_dir=source_dir)
+        config = project.config
+        hatch_config = project.hatch_config
+
+    with timings.phase("discover"):
+        if pre_built is not None:
+            dist_dir = os.path.abspath(pre_built)
+            emit(f"Using pre-built distributions from {dist_dir}")
+            sdist_paths, wheel_paths = find_all_dist_files(dist_dir)
+        elif not rebuild:
+            # Auto-detect pre-built dists in dist/ or wheelhouse/
+            detected = _find_pre_built(source_dir)
+            if detected is not None:
+                dist_dir = detected
+                emit(f"Using pre-built distributions from {dist_dir}")
+                sdist_paths, wheel_paths = find_all_dist_files(dist_dir)
+                pre_built = dist_dir  # so downstream logic treats it as pre-built
+            else:
+                pre_built = None  # fall through to build
         else:
-            pre_built = None  # fall through to build
-    else:
-        pre_built = None  # --rebuild: ignore any existing dists
+            pre_built = None  # --rebuild: ignore any existing dists
 
-    if pre_built is None:
-        tmpdir_ctx = tempfile.TemporaryDirectory(prefix="check-dist-")
-        tmpdir = tmpdir_ctx.__enter__()
-        try:
-            messages.append("Building distributions...")
-            build_warnings = build_dists(source_dir, tmpdir, no_isolation=no_isolation)
-            for w in build_warnings:
-                messages.append(f"  {w}")
-            sdist_path, wheel_path = find_dist_files(tmpdir)
-        except Exception:
-            tmpdir_ctx.__exit__(None, None, None)
-            raise
-
-    try:
-        if not sdist_path and not wheel_path:
-            errors.append("No distributions found after build")
-        elif pre_built is not None:
-            if not sdist_path:
-                errors.append("No sdist found in pre-built directory")
-            if not wheel_path:
-                errors.append("No wheel found in pre-built directory")
-
-        # ── sdist checks ─────────────────────────────────────────
-        if sdist_path:
-            sdist_files = list_sdist_files(sdist_path)
-            messages.append(f"\nsdist ({os.path.basename(sdist_path)}) – {len(sdist_files)} file(s):")
-            if verbose:
-                for f in sdist_files:
-                    messages.append(f"  {f}")
+    state = None
+    if use_cache:
+        from ._state import CheckState
 
-            try:
-                vcs_files = get_vcs_files(source_dir)
-                errors.extend(check_sdist_vs_vcs(sdist_files, vcs_files, hatch_config, sdist_absent=config["sdist"]["absent"]))
-            except CheckDistError as exc:
-                messages.append(f"  Warning: could not compare against VCS: {exc}")
+        state = CheckState(source_dir)
 
-            errors.extend(check_present(sdist_files, config["sdist"]["present"], "sdist"))
-            errors.extend(check_absent(sdist_files, config["sdist"]["absent"], "sdist", present_patterns=config["sdist"]["present"]))
-            errors.extend(check_wrong_platform_extensions(sdist_files, "sdist"))
+    tmpdir_ctx = None
+    if pre_built is None:
+        cache = cache_key = cached = None
+        if use_cache:
+            from ._cache import BuildCache, build_cache_key
 
-        # ── wheel checks ─────────────────────────────────────────
-        if wheel_path:
-            wheel_files = list_wheel_files(wheel_path)
-            messages.append(f"\nwheel ({os.path.basename(wheel_path)}) – {len(wheel_files)} file(s):")
-            if verbose:
-                for f in wheel_files:
-                    messages.append(f"  {f}")
+            # Only the files the build can read go into the key, so a
+            # scoped subproject does not hash its whole repository.
+            key_pathspecs = _build_pathspecs(source_dir, hatch_config)
+            try:
+                with timings.phase("vcs listing"):
+                    if vcs_files is not None:
+                        key_files = _filter_pathspecs(vcs_files, key_pathspecs)
+                    else:
+                        key_files = _memoized_vcs_files(source_dir, key_pathspecs, state.memo)
+                with timings.phase("untracked listing"):
+                    untracked_files = get_untracked_files(source_dir, key_pathspecs)
+            except CheckDistError:
+                pass  # no VCS listing, no cache key; reported below
+            else:
+                with timings.phase("build cache lookup"):
+                    cache = BuildCache()
+                    cache_key = build_cache_key(
+                        source_dir,
+                        key_files,
+                        untracked_files=untracked_files,
+                        revision=get_vcs_revision(source_dir),
+                        no_isolation=no_isolation,
+                    )
+                    cached = cache.get(cache_key)
+
+        if cached is not None:
+            emit(f"Using cached distributions from {cached}")
+            sdist_paths, wheel_paths = find_all_dist_files(cached)
+        else:
+            import tempfile
 
-            errors.extend(check_present(wheel_files, config["wheel"]["present"], "wheel"))
-            errors.extend(check_absent(wheel_files, config["wheel"]["absent"], "wheel", present_patterns=config["wheel"]["present"]))
-            errors.extend(check_wrong_platform_extensions(wheel_files, "wheel"))
+            tmpdir_ctx = tempfile.TemporaryDirectory(prefix="check-dist-")
+            tmpdir = tmpdir_ctx.__enter__()
+            try:
+                emit("Building distributions...")
+                with timings.phase("build"):
+                    build_warnings = _build(
+                        source_dir,
+                        tmpdir,
+                        no_isolation=no_isolation,
+                        parallel_build=parallel_build,
+                        in_process_build=in_process_build,
+                        reuse_build_env=reuse_build_env,
+                        find_links=find_links,
+                        on_build_output=on_build_output,
+                    )
+                for w in build_warnings:
+                    emit(f"  {w}")
+                sdist_paths, wheel_paths = find_all_dist_files(tmpdir)
+                # Only complete builds are cached, so a hit never hides a
+                # build failure warning.
+                if cache is not None and not build_warnings and sdist_paths and wheel_paths:
+                    with timings.phase("build cache store"):
+                        cache.put(cache_key, tmpdir)
+            except Exception:
+                tmpdir_ctx.__exit__(None, None, None)
+                raise
+
+    # Fresh builds land in a new temporary directory, so remembering
+    # anything about them would be pointless.
+    memo = state.memo if state is not None and tmpdir_ctx is None else None
+    try:
+        success, _, results = _evaluate(
+            source_dir,
+            config,
+            hatch_config,
+            sdist_paths,
+            wheel_paths,
+            pre_built=pre_built is not None,
+            vcs_files=vcs_files,
+            verbose=verbose,
+            memo=memo,
+            timings=timings,
+            max_paths=max_paths,
+            platform=platform,
+            on_message=emit,
+            on_event=on_event,
+        )
     finally:
-        if pre_built is None:
+        if tmpdir_ctx is not None:
             tmpdir_ctx.__exit__(None, None, None)
-
-    if errors:
-        messages.append(f"\n{len(errors)} error(s) found:")
-        for err in errors:
-            messages.append(f"  ERROR: {err}")
-        return False, messages
-
-    messages.append("\nAll checks passed!")
-    return True, messages
+    if state is not None:
+        state.save()
+    timings.finish()
+    return CheckDistResult(success, messages, timings, results)
@@ -0,0 +1,32 @@
+"""Progress events reported by a check-dist run as they happen."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+# Event kinds.
+PHASE_START = "phase-start"  # name: the phase; data: None
+PHASE_END = "phase-end"  # name: the phase; data: its Phase timing
+LISTED = "listed"  # name: the archive's file name; data: the files it holds
+FINDING = "finding"  # name: the distribution label; data: the Finding
+
+
+class Event(NamedTuple):
+    """One progress event: its *kind*, the *name* it is about and its *data*."""
+
+    kind: str
+    name: str | None
+    data: Any = None
+
+
+def _serialized(callback: Callable[[Event], None]) -> Callable[[Event], None]:
+    """Return *callback* wrapped so calls from several threads never overlap."""
+    lock = threading.Lock()
+
+    def call(event: Event) -> None:
+        with lock:
+            callback(event)
+
+    return call
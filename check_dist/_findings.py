@@ -0,0 +1,193 @@
+"""Structured check results, rendered to text or JSON only when reported."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Sequence
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._timings import Timings
+
+# Check ids.
+PRESENT = "present"  # a required pattern matched nothing
+ABSENT = "absent"  # an unwanted pattern matched files
+PLATFORM_EXTENSION = "platform-extension"  # a file has another platform's extension
+UNTRACKED = "untracked"  # sdist files not tracked by VCS
+MISSING = "missing"  # VCS-tracked files missing from the sdist
+RECORD = "record"  # a wheel's RECORD does not match its contents
+DISTRIBUTIONS = "distributions"  # no sdist or wheel to check
+
+
+class Finding:
+    """One problem found by a check.
+
+    *paths* are the offending files, kept as given: they are only joined
+    into a message by :meth:`format` (or ``str()``), which can truncate
+    them.  *pattern* is the configured pattern (for extension findings,
+    the wrong extension), *translated* its platform-translated form when
+    that differs, and *detail* any remaining free text (the expected
+    extension, the RECORD problem, ...).  *platform* is the platform the
+    distribution was checked for (``sys.platform`` when not given), named
+    in extension findings.
+    """
+
+    __slots__ = ("check", "detail", "dist_type", "paths", "pattern", "platform", "translated")
+
+    def __init__(
+        self,
+        check: str,
+        dist_type: str | None,
+        *,
+        pattern: str | None = None,
+        paths: Sequence[str] = (),
+        translated: str | None = None,
+        detail: str | None = None,
+        platform: str | None = None,
+    ) -> None:
+        self.check = check
+        self.dist_type = dist_type
+        self.pattern = pattern
+        self.paths = paths
+        self.translated = translated
+        self.detail = detail
+        self.platform = platform
+
+    def __repr__(self) -> str:
+        return f"Finding({self.check!r}, {self.dist_type!r}, pattern={self.pattern!r}, paths=<{len(self.paths)} path(s)>)"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Finding):
+            return NotImplemented
+        return self.to_json() == other.to_json()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __str__(self) -> str:
+        return self.format()
+
+    def _paths(self, max_paths: int | None) -> list[str]:
+        if max_paths is None or len(self.paths) <= max_paths:
+            return list(self.paths)
+        return [*self.paths[:max_paths], f"... and {len(self.paths) - max_paths} more"]
+
+    def format(self, max_paths: int | None = None) -> str:
+        """Return the message, listing at most *max_paths* paths (all by default)."""
+        check, dist_type = self.check, self.dist_type
+        platform = self.platform or sys.platform
+        if check == PRESENT:
+            msg = f"{dist_type}: required pattern '{self.pattern}' not found"
+        elif check == ABSENT:
+            msg = f"{dist_type}: unwanted pattern '{self.pattern}' matched: {', '.join(self._paths(max_paths))}"
+        elif check == PLATFORM_EXTENSION:
+            return f"{dist_type}: '{self.paths[0]}' uses extension '{self.pattern}' which is incorrect for {platform} (expected '{self.detail}')"
+        elif check == UNTRACKED:
+            return f"\n{dist_type} contains files not tracked by VCS:\n\t" + "\n\t".join(self._paths(max_paths))
+        elif check == MISSING:
+            return f"\nVCS-tracked files missing from {dist_type}: \n\t" + "\n\t".join(self._paths(max_paths))
+        elif dist_type is None:
+            return self.detail or ""
+        else:
+            return f"{dist_type}: {self.detail}"
+        if self.translated is not None:
+            msg += f" (translated to '{self.translated}' for {platform})"
+        return msg
+
+    def to_json(self) -> dict[str, Any]:
+        """Return the finding as a JSON-serializable dict."""
+        return {
+            "check": self.check,
+            "dist_type": self.dist_type,
+            "pattern": self.pattern,
+            "translated": self.translated,
+            "paths": list(self.paths),
+            "detail": self.detail,
+            "platform": self.platform,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Finding:
+        """Inverse of :meth:`to_json`."""
+        return cls(
+            data["check"],
+            data["dist_type"],
+            pattern=data["pattern"],
+            paths=data["paths"],
+            translated=data["translated"],
+            detail=data["detail"],
+            platform=data.get("platform"),
+        )
+
+
+class CheckResult:
+    """The findings of one check (*check* id) on one distribution (*dist_type* label)."""
+
+    __slots__ = ("check", "dist_type", "findings")
+
+    def __init__(self, check: str, dist_type: str | None, findings: list[Finding] | None = None) -> None:
+        self.check = check
+        self.dist_type = dist_type
+        self.findings = findings if findings is not None else []
+
+    def __repr__(self) -> str:
+        return f"CheckResult({self.check!r}, {self.dist_type!r}, <{len(self.findings)} finding(s)>)"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CheckResult):
+            return NotImplemented
+        return (self.check, self.dist_type, self.findings) == (other.check, other.dist_type, other.findings)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def passed(self) -> bool:
+        return not self.findings
+
+    def to_json(self) -> dict[str, Any]:
+        """Return the result as a JSON-serializable dict."""
+        return {"check": self.check, "dist_type": self.dist_type, "findings": [f.to_json() for f in self.findings]}
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> CheckResult:
+        """Inverse of :meth:`to_json`."""
+        return cls(data["check"], data["dist_type"], [Finding.from_json(f) for f in data["findings"]])
+
+
+def iter_findings(results: Iterable[CheckResult]) -> Iterable[Finding]:
+    """Yield the findings of *results* in order."""
+    for result in results:
+        yield from result.findings
+
+
+def write_json(success: bool, results: Iterable[CheckResult], stream: IO[str], *, timings: Timings | None = None) -> None:
+    """Write a JSON report of *results* to *stream*, one path at a time.
+
+    The report is ``{"success": ..., "results": [...], "timings": [...]}``
+    with each result as in :meth:`CheckResult.to_json`.  Paths are encoded
+    and written one by one, so findings matching very many files are never
+    held as one string.
+    """
+    import json
+
+    write = stream.write
+    write(f'{{"success": {json.dumps(success)}, "results": [')
+    for i, result in enumerate(results):
+        write(",\n  " if i else "\n  ")
+        write(f'{{"check": {json.dumps(result.check)}, "dist_type": {json.dumps(result.dist_type)}, "findings": [')
+        for j, finding in enumerate(result.findings):
+            write(", " if j else "")
+            write(
+                f'{{"check": {json.dumps(finding.check)}, "dist_type": {json.dumps(finding.dist_type)}, '
+                f'"pattern": {json.dumps(finding.pattern)}, "translated": {json.dumps(finding.translated)}, '
+                f'"detail": {json.dumps(finding.detail)}, "platform": {json.dumps(finding.platform)}, "paths": ['
+            )
+            for k, path in enumerate(finding.paths):
+                write(", " if k else "")
+                write(json.dumps(path))
+            write("]}")
+        write("]}")
+    write("\n]")
+    if timings is not None:
+        write(', "timings": ')
+        write(json.dumps([{"name": p.name, "wall": p.wall, "cpu": p.cpu} for p in timings.phases]))
+    write("}\n")
@@ -0,0 +1,474 @@
+"""In-process PEP 517 build frontend built on ``pyproject_hooks``."""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager, suppress
+from functools import lru_cache
+from typing import BinaryIO
+
+from ._core import CheckDistError, ProjectContext
+
+# PEP 517 defaults when ``[build-system]`` does not name a backend.
+_DEFAULT_REQUIRES = ["setuptools>=40.8.0"]
+_DEFAULT_BACKEND = "setuptools.build_meta:__legacy__"
+# Lines of backend output kept for error messages.
+_OUTPUT_TAIL = 200
+# ``pip --python``, used to install into pip-less environments.
+_MIN_PIP_VERSION = (22, 3)
+
+OutputCallback = Callable[[str], None]
+
+
+class BuildHookError(CheckDistError):
+    """A PEP 517 hook (or the requirement install before it) failed."""
+
+    def __init__(self, distribution: str, hook: str, output: str) -> None:
+        self.distribution = distribution
+        self.hook = hook
+        self.output = output
+        super().__init__(f"{distribution} build failed in hook '{hook}':\n{output}")
+
+
+def _read_build_system(source_dir: str) -> tuple[list[str], str, list[str] | None]:
+    """Return ``(requires, build_backend, backend_path)`` for *source_dir*."""
+    build_system = ProjectContext.load(os.path.join(source_dir, "pyproject.toml")).build_system
+    if "build-backend" not in build_system:
+        return list(build_system.get("requires", _DEFAULT_REQUIRES)), _DEFAULT_BACKEND, None
+    return list(build_system.get("requires", [])), build_system["build-backend"], build_system.get("backend-path")
+
+
+class _Runner:
+    """``pyproject_hooks`` subprocess runner that streams output line by line."""
+
+    def __init__(self, on_output: OutputCallback | None) -> None:
+        self.on_output = on_output
+        self.tail: deque[str] = deque(maxlen=_OUTPUT_TAIL)
+
+    def __call__(self, cmd: Sequence[str], cwd: str | None = None, extra_environ: Mapping[str, str] | None = None) -> None:
+        import subprocess
+
+        env = os.environ.copy()
+        if extra_environ:
+            env.update(extra_environ)
+        self.tail.clear()
+        with subprocess.Popen(cmd, cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace") as proc:
+            for line in proc.stdout:
+                self.tail.append(line)
+                if self.on_output is not None:
+                    self.on_output(line)
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, list(cmd), output="".join(self.tail))
+
+    def output(self) -> str:
+        return "".join(self.tail).strip()
+
+
+class BuildEnv:
+    """A Python environment that build requirements are installed into.
+
+    With *find_links*, requirements are installed offline from those
+    wheel directories/URLs only (``pip --no-index --find-links``).
+    """
+
+    def __init__(self, python: str, *, isolated: bool, find_links: Sequence[str] = ()) -> None:
+        self.python = python
+        self.isolated = isolated
+        self.find_links = list(find_links)
+
+    def install(self, requirements: Sequence[str], runner: _Runner) -> None:
+        """Install *requirements* with the host pip (no-op without isolation)."""
+        if not self.isolated or not requirements:
+            return
+        cmd = [sys.executable, "-m", "pip", "--python", self.python, "install", "--disable-pip-version-check", "--quiet"]
+        if self.find_links:
+            cmd.append("--no-index")
+            for link in self.find_links:
+                cmd.extend(["--find-links", link])
+        runner([*cmd, *requirements])
+
+    @contextmanager
+    def extended(self, requirements: Sequence[str], runner: _Runner, *, distribution: str, hook: str) -> Iterator[BuildEnv]:
+        """Yield an environment that also has *requirements* installed.
+
+        This installs them into the environment itself; *distribution* and
+        *hook* name the step in a :class:`BuildHookError`.
+        """
+        _run_step(runner, distribution, hook, self.install, requirements, runner)
+        yield self
+
+
+class _PooledEnv(BuildEnv):
+    """A :class:`BuildEnv` from an :class:`EnvPool`, holding *requires*."""
+
+    def __init__(self, python: str, pool: EnvPool, requires: Sequence[str], *, find_links: Sequence[str] = ()) -> None:
+        super().__init__(python, isolated=True, find_links=find_links)
+        self.pool = pool
+        self.requires = list(requires)
+
+    @contextmanager
+    def extended(self, requirements: Sequence[str], runner: _Runner, *, distribution: str, hook: str) -> Iterator[BuildEnv]:
+        """Yield the pooled environment for ``requires`` plus *requirements*.
+
+        Pooled environments are shared across projects, so per-build
+        requirements go into an environment of their own instead of
+        leaking into this one.
+        """
+        combined = normalize_requires([*self.requires, *requirements])
+        if combined == normalize_requires(self.requires):
+            yield self
+            return
+        with self.pool.acquire(combined, runner, find_links=self.find_links, distribution=distribution, hook=hook) as env:
+            yield env
+
+
+@lru_cache(maxsize=1)
+def _host_pip_version() -> tuple[int, ...] | None:
+    """Return the version of the running interpreter's pip, or ``None``."""
+    import subprocess
+
+    result = subprocess.run([sys.executable, "-m", "pip", "--version"], capture_output=True, text=True, check=False)
+    match = re.match(r"pip (\d+)\.(\d+)", result.stdout)
+    return tuple(int(part) for part in match.groups()) if result.returncode == 0 and match else None
+
+
+def _require_pip() -> None:
+    """Raise :class:`CheckDistError` unless the host pip supports ``--python``."""
+    version = _host_pip_version()
+    if version is None or version < _MIN_PIP_VERSION:
+        found = "not installed" if version is None else "pip " + ".".join(map(str, version))
+        required = ".".join(map(str, _MIN_PIP_VERSION))
+        raise CheckDistError(
+            f"isolated in-process builds install requirements with 'pip --python', which needs pip >= {required} ({found}); "
+            "upgrade pip, or pass --no-isolation"
+        )
+
+
+def _env_python(env_dir: str) -> str:
+    if sys.platform == "win32":
+        return os.path.join(env_dir, "Scripts", "python.exe")
+    return os.path.join(env_dir, "bin", "python")
+
+
+def create_venv(env_dir: str) -> str:
+    """Create a pip-less virtual environment and return its interpreter.
+
+    Requirements are installed with the host's ``pip --python``, which
+    avoids bootstrapping pip into every environment.
+    """
+    import venv
+
+    venv.EnvBuilder(with_pip=False, symlinks=sys.platform != "win32").create(env_dir)
+    return _env_python(env_dir)
+
+
+# ── Persistent environment pool ──────────────────────────────────────
+
+# Pooled environments unused for this long are evicted.
+_DEFAULT_ENV_MAX_AGE = 30 * 24 * 3600
+_READY_MARKER = ".check-dist-ready"
+
+
+def _lock(f: BinaryIO, path: str, blocking: bool) -> bool:
+    """Lock the open file *f*; return False if *blocking* is off and it is taken."""
+    if sys.platform == "win32":
+        import msvcrt
+
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+        except OSError as exc:
+            if not blocking:
+                return False
+            # LK_LOCK gives up after ten one-second retries.
+            raise CheckDistError(f"Timed out waiting for lock {path}: {exc}") from None
+    else:
+        import fcntl
+
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            return False
+    return True
+
+
+def _unlock(f: BinaryIO) -> None:
+    if sys.platform == "win32":
+        import msvcrt
+
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(f, fcntl.LOCK_UN)
+
+
+@contextmanager
+def _file_lock(path: str, *, blocking: bool = True) -> Iterator[bool]:
+    """Hold an exclusive advisory lock on *path*; yields False if not acquired.
+
+    The lock file may be removed by its holder (see :meth:`EnvPool.evict`),
+    so after locking, the lock is retried until *path* is still the file
+    that was locked.  A blocking lock that cannot be taken raises
+    :class:`CheckDistError`.
+    """
+    while True:
+        f = open(path, "a+b")  # noqa: SIM115
+        try:
+            if not _lock(f, path, blocking):
+                yield False
+                return
+            try:
+                current = os.stat(path)
+            except FileNotFoundError:
+                current = None
+            locked = os.fstat(f.fileno())
+            if current is None or (current.st_dev, current.st_ino) != (locked.st_dev, locked.st_ino):
+                _unlock(f)
+                continue
+            try:
+                yield True
+            finally:
+                _unlock(f)
+            return
+        finally:
+            f.close()
+
+
+def normalize_requires(requires: Sequence[str]) -> list[str]:
+    """Return *requires* deduplicated, sorted and with canonical project names.
+
+    ``Hatchling >= 1.20`` and ``hatchling>=1.20`` normalize identically, so
+    they share a pooled environment.
+    """
+    normalized = set()
+    for requirement in requires:
+        match = re.match(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)(.*)", requirement)
+        if match is None:
+            normalized.add(requirement.strip())
+            continue
+        name, rest = match.groups()
+        normalized.add(re.sub(r"[-_.]+", "-", name).lower() + re.sub(r"\s+", "", rest))
+    return sorted(normalized)
+
+
+def env_key(requires: Sequence[str]) -> str:
+    """Return the pool key for *requires* on the running interpreter."""
+    import hashlib
+
+    interpreter = f"{sys.implementation.name}-{sys.version_info.major}.{sys.version_info.minor}-{sys.platform}-{sys.executable}"
+    payload = "\0".join([interpreter, *normalize_requires(requires)])
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+class EnvPool:
+    """Build environments kept on disk and shared across runs and projects.
+
+    Environments are keyed by :func:`env_key` (normalized
+    ``build-system.requires`` plus interpreter) under
+    ``<cache>/envs/<key>/``.  A per-key lock file serializes concurrent
+    jobs using or creating the same environment; environments unused for
+    *max_age* seconds are evicted, with their lock files, when nobody
+    holds their lock.
+    """
+
+    def __init__(self, root: str | None = None, *, max_age: float | None = None) -> None:
+        from ._cache import cache_root
+
+        self.root = root if root is not None else str(cache_root() / "envs")
+        if max_age is None:
+            days = os.environ.get("CHECK_DIST_ENV_MAX_AGE_DAYS")
+            max_age = float(days) * 24 * 3600 if days else _DEFAULT_ENV_MAX_AGE
+        self.max_age = max_age
+
+    @contextmanager
+    def acquire(
+        self,
+        requires: Sequence[str],
+        runner: _Runner,
+        *,
+        find_links: Sequence[str] = (),
+        distribution: str = "sdist and wheel",
+        hook: str = "install build-system.requires",
+    ) -> Iterator[BuildEnv]:
+        """Yield a ready environment for *requires*, creating it if needed.
+
+        The environment stays locked for the duration of the ``with``
+        block.  Requirements reported by ``get_requires_for_build_*``
+        are not installed into it: :meth:`BuildEnv.extended` acquires a
+        separate pooled environment for them.  *distribution* and *hook*
+        name the install step in a :class:`BuildHookError`.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        self.evict()
+        key = env_key(requires)
+        env_dir = os.path.join(self.root, key)
+        marker = os.path.join(env_dir, _READY_MARKER)
+        with _file_lock(env_dir + ".lock"):
+            if os.path.exists(marker):
+                env = _PooledEnv(_env_python(env_dir), self, requires, find_links=find_links)
+            else:
+                import shutil
+
+                shutil.rmtree(env_dir, ignore_errors=True)  # half-built by an interrupted run
+                env = _PooledEnv(create_venv(env_dir), self, requires, find_links=find_links)
+                _run_step(runner, distribution, hook, env.install, requires, runner)
+                with open(marker, "w") as f:
+                    f.write("\n".join(normalize_requires(requires)) + "\n")
+            os.utime(marker)
+            yield env
+
+    def evict(self) -> None:
+        """Remove environments, and their lock files, not used within ``max_age`` seconds."""
+        cutoff = time.time() - self.max_age
+        for name in os.listdir(self.root):
+            if name.endswith(".lock"):
+                # Lock files are handled with their environment, unless
+                # the environment is already gone.
+                env_dir = os.path.join(self.root, name.removesuffix(".lock"))
+                if os.path.isdir(env_dir):
+                    continue
+            else:
+                env_dir = os.path.join(self.root, name)
+                if not os.path.isdir(env_dir):
+                    continue
+            lock_path = env_dir + ".lock"
+            if _last_used(env_dir, lock_path) >= cutoff:
+                continue
+            with _file_lock(lock_path, blocking=False) as locked:
+                # Another job may have used the environment between the
+                # check above and taking the lock.
+                stale = locked and _last_used(env_dir, lock_path) < cutoff
+                if stale:
+                    import shutil
+
+                    shutil.rmtree(env_dir, ignore_errors=True)
+                    if sys.platform != "win32":
+                        # Jobs waiting on the removed file notice and retry.
+                        with suppress(OSError):
+                            os.remove(lock_path)
+            if stale and sys.platform == "win32":
+                # Windows cannot remove open files, so this fails harmlessly
+                # if another job has opened the lock file meanwhile.
+                with suppress(OSError):
+                    os.remove(lock_path)
+
+
+def _last_used(env_dir: str, lock_path: str) -> float:
+    """Return when the pooled environment at *env_dir* was last used."""
+    for path in (os.path.join(env_dir, _READY_MARKER), env_dir, lock_path):
+        with suppress(OSError):
+            return os.path.getmtime(path)
+    return 0.0
+
+
+# ── Building ──────────────────────────────────────────────────────────
+
+
+@contextmanager
+def _prepared_env(
+    env: BuildEnv | None,
+    requires: Sequence[str],
+    runner: _Runner,
+    *,
+    no_isolation: bool,
+    reuse_env: bool,
+    find_links: Sequence[str],
+) -> Iterator[BuildEnv]:
+    """Yield an environment with *requires* installed."""
+    if env is not None or no_isolation:
+        env = env if env is not None else BuildEnv(sys.executable, isolated=False)
+        _run_step(runner, "sdist and wheel", "install build-system.requires", env.install, requires, runner)
+        yield env
+    elif reuse_env:
+        with EnvPool().acquire(requires, runner, find_links=find_links) as pooled:
+            yield pooled
+    else:
+        import tempfile
+
+        with tempfile.TemporaryDirectory(prefix="check-dist-env-") as env_dir:
+            env = BuildEnv(create_venv(env_dir), isolated=True, find_links=find_links)
+            _run_step(runner, "sdist and wheel", "install build-system.requires", env.install, requires, runner)
+            yield env
+
+
+def _run_step(runner: _Runner, distribution: str, hook: str, call: Callable[..., object], *args: object) -> object:
+    """Call one hook (or install step), converting failures to :class:`BuildHookError`."""
+    try:
+        return call(*args)
+    except BuildHookError:
+        raise
+    except Exception as exc:
+        raise BuildHookError(distribution, hook, runner.output() or str(exc)) from exc
+
+
+def build_dists_in_process(
+    source_dir: str,
+    output_dir: str,
+    *,
+    no_isolation: bool = False,
+    on_output: OutputCallback | None = None,
+    env: BuildEnv | None = None,
+    reuse_env: bool = False,
+    find_links: Sequence[str] = (),
+) -> list[str]:
+    """Build sdist and wheel into *output_dir* by calling PEP 517 hooks directly.
+
+    Unlike :func:`check_dist._core.build_dists`, this does not spawn
+    ``python -m build``: one build environment is prepared (a temporary
+    venv, the current interpreter with *no_isolation*, or *env* when
+    given) and both distributions are built from it.  Backend and
+    installer output is passed line by line to *on_output*.
+
+    With *reuse_env*, the environment comes from the persistent
+    :class:`EnvPool` instead of a fresh temporary venv, and requirements
+    from ``get_requires_for_build_*`` go into a pooled environment of
+    their own rather than into the shared one.  *find_links*
+    makes requirement installation offline, from those locations only.
+
+    Needs ``pyproject_hooks`` (the ``fast`` extra) and, for isolated
+    builds, pip 22.3 or newer for ``pip --python``; raises
+    :class:`CheckDistError` up front otherwise.
+
+    Each distribution is built independently, so a failing wheel hook does
+    not cost an sdist rebuild.  Returns warnings naming the failed hook when
+    only one distribution could be built, and raises
+    :class:`CheckDistError` when neither could.
+    """
+    try:
+        from pyproject_hooks import BuildBackendHookCaller
+    except ImportError:
+        raise CheckDistError("in-process builds require pyproject_hooks (pip install 'check-dist[fast]')") from None
+    if env.isolated if env is not None else not no_isolation:
+        _require_pip()
+
+    source_dir = os.path.abspath(source_dir)
+    output_dir = os.path.abspath(output_dir)
+    requires, backend, backend_path = _read_build_system(source_dir)
+    runner = _Runner(on_output)
+    failures: list[BuildHookError] = []
+
+    def hooks_for(build_env: BuildEnv) -> BuildBackendHookCaller:
+        return BuildBackendHookCaller(source_dir, backend, backend_path=backend_path, runner=runner, python_executable=build_env.python)
+
+    with _prepared_env(env, requires, runner, no_isolation=no_isolation, reuse_env=reuse_env, find_links=find_links) as build_env:
+        hooks = hooks_for(build_env)
+        for distribution in ("sdist", "wheel"):
+            get_requires = f"get_requires_for_build_{distribution}"
+            build = f"build_{distribution}"
+            try:
+                extra = _run_step(runner, distribution, get_requires, getattr(hooks, get_requires))
+                with build_env.extended(list(extra), runner, distribution=distribution, hook=f"install {get_requires}") as extended_env:
+                    build_hooks = hooks if extended_env is build_env else hooks_for(extended_env)
+                    _run_step(runner, distribution, build, getattr(build_hooks, build), output_dir)
+            except BuildHookError as exc:
+                failures.append(exc)
+
+    if len(failures) == 2:
+        raise CheckDistError("Build failed:\n" + "\n".join(str(f) for f in failures))
+    return [f"Warning: {f}" for f in failures]
@@ -0,0 +1,60 @@
+"""Locating git's ``.git/index`` file, whose changes invalidate VCS listings."""
+
+from __future__ import annotations
+
+import os
+
+from ._core import CheckDistError
+
+# Environment variables that point git somewhere other than ./.git.
+_GIT_ENV_OVERRIDES = ("GIT_DIR", "GIT_INDEX_FILE", "GIT_WORK_TREE", "GIT_COMMON_DIR")
+
+
+def _git_dir(worktree: str) -> str:
+    """Return the git dir for the worktree root *worktree*."""
+    dot_git = os.path.join(worktree, ".git")
+    if os.path.isdir(dot_git):
+        return dot_git
+    # Linked worktrees and submodules point at their git dir.
+    with open(dot_git, encoding="utf-8") as f:
+        content = f.read().strip()
+    if not content.startswith("gitdir:"):
+        raise CheckDistError(f"unrecognized .git file in {worktree}")
+    return os.path.join(worktree, content[len("gitdir:") :].strip())
+
+
+def _find_worktree(path: str) -> str:
+    path = os.path.realpath(path)
+    while not os.path.exists(os.path.join(path, ".git")):
+        parent = os.path.dirname(path)
+        if parent == path:
+            raise CheckDistError("not inside a git worktree")
+        path = parent
+    return path
+
+
+def git_index_path(source_dir: str) -> str | None:
+    """Return the path of the index file for the worktree holding *source_dir*, if any."""
+    try:
+        return os.path.join(_git_dir(_find_worktree(source_dir)), "index")
+    except (CheckDistError, OSError):
+        return None
+
+
+def listing_index_path(source_dir: str) -> str | None:
+    """Return the index file that alone determines the VCS listing of *source_dir*.
+
+    ``None`` when there is none to go by: outside a repository, before the
+    first ``git add``, with git environment overrides, or with submodules
+    (whose files come from their own indexes).
+    """
+    if any(var in os.environ for var in _GIT_ENV_OVERRIDES):
+        return None
+    try:
+        worktree = _find_worktree(source_dir)
+    except CheckDistError:
+        return None
+    if os.path.exists(os.path.join(worktree, ".gitmodules")):
+        return None
+    index = git_index_path(worktree)
+    return index if index is not None and os.path.isfile(index) else None
@@ -0,0 +1,169 @@
+"""Verification of a wheel's ``*.dist-info/RECORD`` against its contents."""
+
+from __future__ import annotations
+
+import base64
+import csv
+import io
+import os
+from collections import deque
+from typing import TYPE_CHECKING
+
+from ._core import CheckDistError
+from ._findings import RECORD, Finding
+from ._zip import ZipReader
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+# Files the wheel spec allows to be missing from RECORD.
+_UNRECORDED = ("RECORD", "RECORD.jws", "RECORD.p7s")
+_CHUNK_SIZE = 1 << 20
+
+
+def _find_record(names: list[str]) -> str:
+    """Return the name of the wheel's ``.dist-info/RECORD`` member."""
+    records = [n for n in names if n.count("/") == 1 and n.endswith(".dist-info/RECORD")]
+    if len(records) != 1:
+        found = ", ".join(records) if records else "none"
+        raise CheckDistError(f"expected exactly one .dist-info/RECORD, found {found}")
+    return records[0]
+
+
+def _parse_record(data: bytes) -> list[tuple[str, str, str]]:
+    """Parse RECORD into sorted ``(path, hash, size)`` rows.
+
+    Raises :class:`UnicodeDecodeError` or :class:`csv.Error` for a RECORD
+    that is not valid UTF-8 CSV.
+    """
+    rows = []
+    for row in csv.reader(io.StringIO(data.decode("utf-8")), strict=True):
+        if not row:
+            continue
+        path, digest, size = (row + ["", ""])[:3]
+        rows.append((path, digest, size))
+    return sorted(rows)
+
+
+def _is_unrecorded(name: str, record_dir: str) -> bool:
+    head, _, tail = name.rpartition("/")
+    return head == record_dir and tail in _UNRECORDED
+
+
+class _Hasher:
+    """Stream wheel members through hashlib from one shared zip reader."""
+
+    def __init__(self, reader: ZipReader) -> None:
+        self._reader = reader
+
+    def __call__(self, name: str, algorithm: str) -> tuple[str, int]:
+        """Return ``(urlsafe-b64 digest, size)`` of member *name*."""
+        import hashlib
+
+        digest = hashlib.new(algorithm)
+        size = 0
+        for chunk in self._reader.iter_chunks(name, _CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+        return base64.urlsafe_b64encode(digest.digest()).rstrip(b"=").decode("ascii"), size
+
+
+def _finding(dist_type: str, path: str | None, detail: str) -> Finding:
+    return Finding(RECORD, dist_type, paths=(path,) if path is not None else (), detail=detail)
+
+
+def _compare(name: str, expected_hash: str, expected_size: str, result: tuple[str, int], dist_type: str) -> list[Finding]:
+    actual_hash, actual_size = result
+    findings = []
+    if expected_hash.partition("=")[2] != actual_hash:
+        findings.append(_finding(dist_type, name, f"RECORD hash mismatch for '{name}'"))
+    if expected_size and expected_size != str(actual_size):
+        findings.append(_finding(dist_type, name, f"RECORD size mismatch for '{name}' (recorded {expected_size}, actual {actual_size})"))
+    return findings
+
+
+def check_wheel_record(wheel_path: str, *, jobs: int | None = None, dist_type: str = "wheel") -> list[str]:
+    """Verify that the wheel's RECORD matches the archive.
+
+    Every file in the wheel must be listed in RECORD (except RECORD and
+    its signatures), every RECORD entry must exist, and recorded hashes
+    and sizes must match the member contents.
+
+    Members are hashed on a pool of *jobs* threads (default: CPU count);
+    zlib and hashlib release the GIL, so large native wheels verify in
+    parallel.  Members are streamed in fixed-size chunks and at most a
+    few hashes are in flight per thread, so memory stays bounded.
+    *dist_type* labels the wheel in error messages.
+    """
+    return [str(f) for f in _record_findings(wheel_path, jobs=jobs, dist_type=dist_type)]
+
+
+def _record_findings(wheel_path: str, *, jobs: int | None = None, dist_type: str = "wheel") -> list[Finding]:
+    reader = ZipReader(wheel_path)
+    try:
+        return _verify(reader, jobs=jobs, dist_type=dist_type)
+    finally:
+        reader.close()
+
+
+def _verify(reader: ZipReader, *, jobs: int | None, dist_type: str) -> list[Finding]:
+    import hashlib
+    from concurrent.futures import ThreadPoolExecutor
+
+    entries = [name for name in reader.names() if not name.endswith("/")]
+    try:
+        record_name = _find_record(entries)
+    except CheckDistError as exc:
+        return [_finding(dist_type, None, str(exc))]
+    try:
+        rows = _parse_record(reader.read(record_name))
+    except CheckDistError as exc:
+        return [_finding(dist_type, record_name, f"cannot read {record_name}: {exc}")]
+    except (UnicodeDecodeError, csv.Error) as exc:
+        return [_finding(dist_type, record_name, f"{record_name} is not valid UTF-8 CSV: {exc}")]
+    record_dir = record_name.rpartition("/")[0]
+
+    findings: list[Finding] = []
+    workers = jobs or os.cpu_count() or 1
+    hasher = _Hasher(reader)
+    pending: deque[tuple[str, str, str, Future]] = deque()
+
+    def drain(limit: int) -> None:
+        while len(pending) > limit:
+            name, digest, size, future = pending.popleft()
+            try:
+                result = future.result()
+            except CheckDistError as exc:
+                findings.append(_finding(dist_type, name, f"cannot read '{name}': {exc}"))
+            else:
+                findings.extend(_compare(name, digest, size, result, dist_type))
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="check-dist-record") as pool:
+        # Merge-join the sorted archive listing against sorted RECORD rows.
+        archive = sorted(entries)
+        i = j = 0
+        while i < len(archive) or j < len(rows):
+            name = archive[i] if i < len(archive) else None
+            row = rows[j] if j < len(rows) else None
+            if row is None or (name is not None and name < row[0]):
+                if not _is_unrecorded(name, record_dir):
+                    findings.append(_finding(dist_type, name, f"'{name}' is not listed in RECORD"))
+                i += 1
+            elif name is None or row[0] < name:
+                findings.append(_finding(dist_type, row[0], f"RECORD lists '{row[0]}' which is not in the wheel"))
+                j += 1
+            else:
+                path, digest, size = row
+                algorithm = digest.partition("=")[0]
+                if not digest:
+                    if not _is_unrecorded(path, record_dir):
+                        findings.append(_finding(dist_type, path, f"RECORD has no hash for '{path}'"))
+                elif algorithm not in hashlib.algorithms_guaranteed:
+                    findings.append(_finding(dist_type, path, f"RECORD uses unsupported hash algorithm '{algorithm}' for '{path}'"))
+                else:
+                    pending.append((path, digest, size, pool.submit(hasher, path, algorithm)))
+                    drain(workers * 4)
+                i += 1
+                j += 1
+        drain(0)
+    return findings
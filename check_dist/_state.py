@@ -0,0 +1,106 @@
+"""Per-project state persisted between runs for incremental re-checks."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from ._cache import cache_root
+from ._findings import CheckResult
+
+# Bump when the layout of memo keys or values changes.
+_STATE_VERSION = 3
+
+
+def _freeze(value: Any) -> Any:
+    """Turn the lists JSON made of tuples back into (hashable) tuples."""
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, CheckResult):
+        return {"check_result": value.to_json()}
+    raise TypeError(f"cannot store {type(value).__name__}")
+
+
+def _decode(obj: dict) -> Any:
+    if obj.keys() == {"check_result"}:
+        return CheckResult.from_json(obj["check_result"])
+    return obj
+
+
+class _Memo(dict):
+    """Memo that falls back to the entries of the previous run.
+
+    Entries are copied over when looked up, so the saved state only keeps
+    what the last run used and stale entries drop out on their own.
+    """
+
+    def __init__(self, previous: dict) -> None:
+        super().__init__()
+        self.previous = previous
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = super().get(key)
+        if value is None:
+            value = self.previous.get(key)
+            if value is None:
+                return default
+            self[key] = value
+        return value
+
+
+class CheckState:
+    """Archive listings, VCS listings and check results of the last run.
+
+    Stored as ``<root>/<hash of source_dir>.json`` (default root:
+    ``cache_root()/"state"``).  :attr:`memo` is meant for the *memo*
+    argument of the checks, whose keys already carry everything the
+    values depend on (file stats, configuration digests); :meth:`save`
+    writes back the entries used since loading.  A missing, unreadable or
+    outdated state file just means starting from scratch.
+    """
+
+    def __init__(self, source_dir: str, root: str | Path | None = None) -> None:
+        root = Path(root) if root is not None else cache_root() / "state"
+        name = hashlib.sha256(os.path.realpath(source_dir).encode()).hexdigest()[:32]
+        self.path = root / f"{name}.json"
+        self.memo = _Memo(self._load())
+
+    @staticmethod
+    def _version() -> list:
+        from . import __version__
+
+        return [_STATE_VERSION, __version__]
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f, object_hook=_decode)
+            if data.get("version") != self._version():
+                return {}
+            return {_freeze(key): value for key, value in data["entries"]}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return {}
+
+    def save(self) -> None:
+        """Atomically write the entries used since loading; errors are ignored."""
+        data = {"version": self._version(), "entries": list(self.memo.items())}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=".state-", dir=self.path.parent)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"), default=_encode)
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            pass
@@ -0,0 +1,84 @@
+"""Per-phase wall and CPU time of a check-dist run."""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import NamedTuple, TypeVar
+
+from ._events import PHASE_END, PHASE_START, Event
+
+T = TypeVar("T")
+
+
+class Phase(NamedTuple):
+    """One timed phase: seconds of wall time and of CPU time."""
+
+    name: str
+    wall: float
+    cpu: float
+
+
+def _child_cpu() -> float:
+    times = os.times()
+    return times.children_user + times.children_system
+
+
+class Timings:
+    """Phases of one run in the order they finished.
+
+    CPU time is that of the thread running the phase plus that of child
+    processes (builds, ``git``) reaped meanwhile.  Phases may run
+    concurrently on several threads, so wall times need not add up to the
+    total.  *on_event*, if given, is called with a ``phase-start`` and a
+    ``phase-end`` :class:`check_dist._events.Event` around each phase, on
+    the thread running it.
+    """
+
+    def __init__(self, on_event: Callable[[Event], None] | None = None) -> None:
+        self.phases: list[Phase] = []
+        self.on_event = on_event
+        self._start = time.perf_counter(), time.process_time() + _child_cpu()
+
+    def __getstate__(self) -> dict:
+        # The callback belongs to the run, not to its record.
+        return {**self.__dict__, "on_event": None}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the body of the ``with`` block as phase *name*."""
+        if self.on_event is not None:
+            self.on_event(Event(PHASE_START, name))
+        wall, cpu, child = time.perf_counter(), time.thread_time(), _child_cpu()
+        try:
+            yield
+        finally:
+            phase = Phase(name, time.perf_counter() - wall, time.thread_time() - cpu + _child_cpu() - child)
+            # list.append is atomic, so threads need no lock here.
+            self.phases.append(phase)
+            if self.on_event is not None:
+                self.on_event(Event(PHASE_END, name, phase))
+
+    def timed(self, name: str, fn: Callable[[], T]) -> Callable[[], T]:
+        """Return *fn* wrapped to be timed as phase *name* when called."""
+
+        def run() -> T:
+            with self.phase(name):
+                return fn()
+
+        return run
+
+    def finish(self, name: str = "total") -> None:
+        """Record the time since creation, with the CPU time of all threads, as phase *name*."""
+        wall, cpu = self._start
+        self.phases.append(Phase(name, time.perf_counter() - wall, time.process_time() + _child_cpu() - cpu))
+
+    def format(self) -> list[str]:
+        """Return report lines, one per phase."""
+        width = max((len(p.name) for p in self.phases), default=0)
+        lines = [f"\n{'Timings':<{width + 2}}  {'wall':>9}  {'cpu':>9}"]
+        for p in self.phases:
+            lines.append(f"  {p.name:<{width}}  {p.wall:8.3f}s  {p.cpu:8.3f}s")
+        return lines
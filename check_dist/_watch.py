@@ -0,0 +1,277 @@
+"""Watch mode: keep project state in memory and re-check on changes."""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable
+from typing import Any
+
+from ._core import (
+    CheckDistError,
+    ProjectContext,
+    _build,
+    _evaluate,
+    _find_pre_built,
+    find_all_dist_files,
+    get_untracked_files,
+    get_vcs_files,
+)
+
+_CONFIG_FILES = ("pyproject.toml", ".copier-answers.yaml")
+# Files polled on every tick, however large the tree is (with the git index).
+_INPUT_FILES = (*_CONFIG_FILES, "MANIFEST.in", ".gitignore")
+# The inputs are polled every _POLL_INTERVAL seconds.  The whole tree is
+# scanned at most that often, and rarely enough that scanning uses at most
+# 1/_SCAN_RATIO of the wall time.
+_POLL_INTERVAL = 0.25
+_SCAN_RATIO = 20
+
+Snapshot = dict[str, tuple[int, int]]
+
+
+def _stat(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _build_inputs(pyproject_path: str) -> Any:
+    """Return the parts of ``pyproject.toml`` that can affect the built dists.
+
+    Everything except ``[tool.check-dist]``, which only drives the checks.
+    """
+    try:
+        pyproject = ProjectContext.load(pyproject_path).pyproject or {}
+    except (OSError, ValueError):  # ValueError covers TOMLDecodeError
+        return None
+    tool = {name: table for name, table in pyproject.get("tool", {}).items() if name != "check-dist"}
+    return {**pyproject, "tool": tool}
+
+
+class Watcher:
+    """Re-run the checks for *source_dir* whenever its inputs change.
+
+    The parsed configuration, the VCS listing, the built distributions and
+    their archive listings are kept between runs, and each change re-runs
+    only what it affects:
+
+    * ``[tool.check-dist]`` or ``.copier-answers.yaml`` edits re-evaluate
+      the patterns against the cached listings;
+    * other edits to tracked or untracked, non-ignored files (including
+      the rest of ``pyproject.toml``), and files being created, removed or
+      added to the git index, re-list the files and rebuild;
+    * in pre-built mode, changes in the distribution directory re-list the
+      changed archives.
+
+    Changes are detected by polling the sizes and mtimes of those files
+    and the mtimes of the directories holding them, which change when an
+    entry is created, removed or renamed.  :meth:`run` polls the
+    configuration files and the git index on every tick, and scans the
+    whole tree only every :attr:`scan_interval` seconds.  Build options,
+    *max_paths* and *platform* are those of :func:`check_dist.check_dist`.
+    """
+
+    def __init__(
+        self,
+        source_dir: str = ".",
+        *,
+        pre_built: str | None = None,
+        rebuild: bool = False,
+        verbose: bool = False,
+        max_paths: int | None = None,
+        platform: str | None = None,
+        **build_options: Any,
+    ) -> None:
+        from ._gitindex import git_index_path
+
+        self.source_dir = os.path.abspath(source_dir)
+        self.verbose = verbose
+        self.max_paths = max_paths
+        self.platform = platform
+        self.build_options = build_options
+        self._pyproject = os.path.join(self.source_dir, "pyproject.toml")
+        self._git_index = git_index_path(self.source_dir)
+
+        if pre_built is not None:
+            self.dist_dir = os.path.abspath(pre_built)
+        elif not rebuild:
+            self.dist_dir = _find_pre_built(self.source_dir)
+        else:
+            self.dist_dir = None
+        self.pre_built = self.dist_dir is not None
+        if self.pre_built:
+            self._build_dir = None
+        else:
+            import tempfile
+
+            self._build_dir = tempfile.mkdtemp(prefix="check-dist-watch-")
+
+        self._memo: dict = {}
+        self._snapshot: Snapshot | None = None
+        self._vcs_files: list[str] | None = None
+        self._untracked_files: list[str] = []
+        self._dirs: set[str] = set()
+        self._scan_seconds = 0.0
+        self._next_scan = 0.0
+        self._build_inputs: Any = None
+        self._build_messages: list[str] = []
+        self.builds = 0
+
+    def close(self) -> None:
+        """Remove the build directory."""
+        if self._build_dir is not None:
+            import shutil
+
+            shutil.rmtree(self._build_dir, ignore_errors=True)
+
+    def _take_snapshot(self, *, full: bool = True) -> Snapshot:
+        """Stat the inputs, and with *full* the whole tree too.
+
+        Without *full*, the tree's entries are carried over from the
+        previous snapshot.
+        """
+        started = time.perf_counter()
+        paths = [os.path.join(self.source_dir, name) for name in _INPUT_FILES]
+        if self._git_index is not None:
+            paths.append(self._git_index)
+        if not full:
+            snapshot = dict(self._snapshot or {})
+            for path in paths:
+                stat = _stat(path)
+                if stat is None:
+                    snapshot.pop(path, None)
+                else:
+                    snapshot[path] = stat
+            return snapshot
+        files = [*(self._vcs_files or ()), *self._untracked_files]
+        paths.extend(os.path.join(self.source_dir, name) for name in files)
+        dirs = {""}
+        for name in files:
+            name = os.path.dirname(name)
+            while name not in dirs:
+                dirs.add(name)
+                name = os.path.dirname(name)
+        self._dirs = {os.path.join(self.source_dir, name) for name in dirs}
+        paths.extend(self._dirs)
+        if self.pre_built:
+            sdists, wheels = find_all_dist_files(self.dist_dir)
+            paths.extend(sdists + wheels)
+        snapshot = {}
+        for path in paths:
+            stat = _stat(path)
+            if stat is not None:
+                snapshot[path] = stat
+        self._scan_seconds = time.perf_counter() - started
+        self._next_scan = time.monotonic() + self.scan_interval
+        return snapshot
+
+    def _list_vcs(self) -> None:
+        try:
+            self._vcs_files = get_vcs_files(self.source_dir)
+            self._untracked_files = get_untracked_files(self.source_dir)
+        except CheckDistError:
+            self._vcs_files = None
+            self._untracked_files = []
+
+    def _rebuild(self) -> None:
+        for name in os.listdir(self._build_dir):
+            os.remove(os.path.join(self._build_dir, name))
+        self._memo.clear()
+        self._build_messages = ["Building distributions..."]
+        self.builds += 1
+        try:
+            warnings = _build(self.source_dir, self._build_dir, **self.build_options)
+        except CheckDistError as exc:
+            self._build_messages.append(f"  Error: {exc}")
+        else:
+            self._build_messages.extend(f"  {w}" for w in warnings)
+
+    def poll(self, *, full: bool = True) -> tuple[bool, list[str]] | None:
+        """Check once for changes; return the new result, or ``None`` if nothing changed.
+
+        Without *full*, only the configuration files and the git index
+        are checked (the first poll always scans the whole tree).
+        """
+        snapshot = self._take_snapshot(full=full or self._snapshot is None)
+        if snapshot == self._snapshot:
+            return None
+        first = self._snapshot is None
+        changed = {path for path in snapshot.keys() | (self._snapshot or {}).keys() if snapshot.get(path) != (self._snapshot or {}).get(path)}
+        config_paths = {os.path.join(self.source_dir, name) for name in _CONFIG_FILES}
+        dist_paths = {path for path in changed if self.pre_built and os.path.dirname(path) == self.dist_dir}
+
+        listing_paths = self._dirs | {self._git_index}
+
+        build_inputs = _build_inputs(self._pyproject)
+        sources_changed = first or bool(changed - config_paths - dist_paths - listing_paths) or build_inputs != self._build_inputs
+        self._build_inputs = build_inputs
+        if sources_changed or changed & listing_paths:
+            # git rewrites the index for mere stat refreshes, and directory
+            # mtimes also change for ignored files, so these only count if
+            # the set of tracked or untracked files changed.
+            previous = self._vcs_files, self._untracked_files
+            self._list_vcs()
+            sources_changed = sources_changed or (self._vcs_files, self._untracked_files) != previous
+            # Re-take the snapshot so a changed set of files does not look
+            # like a change on the next poll.
+            snapshot = self._take_snapshot()
+        self._snapshot = snapshot
+        if dist_paths:
+            self._memo = {key: value for key, value in self._memo.items() if key[1] not in dist_paths}
+        if sources_changed and not self.pre_built:
+            self._rebuild()
+            # Builds may write into the tree (e.g. ``*.egg-info``); do not
+            # take those writes for edits that need another build.
+            self._list_vcs()
+            self._snapshot = self._take_snapshot()
+        return self._check()
+
+    def _check(self) -> tuple[bool, list[str]]:
+        messages = [f"Using pre-built distributions from {self.dist_dir}"] if self.pre_built else list(self._build_messages)
+        try:
+            project = ProjectContext.load(self._pyproject, source_dir=self.source_dir)
+            config = project.config
+            hatch_config = project.hatch_config
+            sdist_paths, wheel_paths = find_all_dist_files(self.dist_dir or self._build_dir)
+            success, result, _ = _evaluate(
+                self.source_dir,
+                config,
+                hatch_config,
+                sdist_paths,
+                wheel_paths,
+                pre_built=self.pre_built,
+                vcs_files=self._vcs_files,
+                verbose=self.verbose,
+                memo=self._memo,
+                max_paths=self.max_paths,
+                platform=self.platform,
+            )
+        except (CheckDistError, OSError, ValueError) as exc:
+            return False, [*messages, f"Error: {exc}"]
+        return success, messages + result
+
+    def run(self, on_result: Callable[[bool, list[str]], None], *, interval: float = _POLL_INTERVAL, stop: Callable[[], bool] | None = None) -> None:
+        """Poll for changes and pass each new result to *on_result*.
+
+        The configuration files and the git index are polled every
+        *interval* seconds, so edits to them show up quickly whatever the
+        size of the tree; the whole tree is scanned every
+        :attr:`scan_interval` seconds.
+        """
+        while stop is None or not stop():
+            result = self.poll(full=time.monotonic() >= self._next_scan)
+            if result is not None:
+                on_result(*result)
+            time.sleep(interval)
+
+    @property
+    def scan_interval(self) -> float:
+        """Seconds between whole-tree scans, scaled to the last scan's cost.
+
+        At least 0.25 s, and long enough that scanning takes no more than
+        5% of the time.
+        """
+        return max(_POLL_INTERVAL, _SCAN_RATIO * self._scan_seconds)
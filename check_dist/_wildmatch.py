@@ -0,0 +1,159 @@
+"""Gitignore-style ("gitwildmatch") patterns, as hatchling matches include/exclude."""
+
+from __future__ import annotations
+
+import re
+
+
+def _translate_segment(segment: str) -> str:
+    """Translate one path segment's glob into a regex that never crosses ``/``."""
+    out: list[str] = []
+    i, n = 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "\\" and i < n:
+            out.append(re.escape(segment[i]))
+            i += 1
+        elif c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and segment[j] in "!^":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                out.append("\\[")  # no closing bracket: a literal "["
+                continue
+            body = segment[i:j].replace("\\", "\\\\").replace("[", "\\[")
+            i = j + 1
+            if body[:1] in ("!", "^"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+def translate(pattern: str) -> tuple[str, bool, bool] | None:
+    """Translate one gitignore pattern into ``(regex source, include, dir group)``.
+
+    Returns ``None`` for lines that match nothing (blank lines and
+    comments).  *include* is False for ``!`` negations.  The regex matches
+    a whole ``/``-separated relative path: a pattern without an inner
+    ``/`` matches at any depth, one with a leading or inner ``/`` only
+    relative to the root, a trailing ``/`` only below directories of that
+    name, and whatever names a directory also matches everything below it.
+    When *dir group* is True the regex's first group captures the ``/``
+    after the directory whenever the path matched only through one.
+    """
+    if pattern.startswith("#"):
+        return None
+    include = not pattern.startswith("!")
+    if not include:
+        pattern = pattern[1:]
+    if pattern.startswith("\\") and pattern[1:2] in ("!", "#"):
+        pattern = pattern[1:]
+    stripped = pattern.rstrip(" ")
+    if stripped != pattern and (len(stripped) - len(stripped.rstrip("\\"))) % 2:
+        stripped += " "  # a trailing space escaped with a backslash stays
+    pattern = stripped
+    if not pattern or pattern == "/":
+        return None
+
+    segments = pattern.split("/")
+    is_dir = segments[-1] == ""
+    if segments[0] == "":
+        del segments[0]  # anchored to the root
+    elif len(segments) == 1 + is_dir and segments[0] != "**":
+        segments.insert(0, "**")  # a bare name matches at any depth
+    if is_dir:
+        segments[-1] = "**"  # a directory: everything below it
+    for i in range(len(segments) - 1, 0, -1):
+        if segments[i] == segments[i - 1] == "**":
+            del segments[i]
+
+    if segments == ["**"]:
+        return (r"[^/]+(/).*\Z", include, True) if is_dir else (r".+\Z", include, False)
+    out: list[str] = []
+    end = len(segments) - 1
+    need_slash = False
+    dir_group = False
+    for i, segment in enumerate(segments):
+        if segment == "**":
+            if i == 0:
+                out.append("(?:.+/)?")
+            elif i < end:
+                out.append("(?:/.+)?")
+                need_slash = True
+            else:
+                dir_group = is_dir
+                out.append("(/).*" if is_dir else "/.*")
+            continue
+        if need_slash:
+            out.append("/")
+        out.append("[^/]+" if segment == "*" else _translate_segment(segment))
+        if i == end:
+            dir_group = True
+            out.append("(?:(/).*)?")
+        need_slash = True
+    return "".join(out) + r"\Z", include, dir_group
+
+
+class WildMatchSpec:
+    """A list of gitignore patterns compiled into a single regex.
+
+    :meth:`match` follows the precedence of hatchling's
+    ``pathspec.GitIgnoreSpec``: the last pattern matching a path decides,
+    so a later ``!pattern`` re-includes what an earlier one matched,
+    except that a pattern naming the file itself beats one matching only
+    through a parent directory.  The patterns are joined in reverse
+    order, each in its own group, so one regex call per path finds the
+    last matching one; only a match through a directory needs the
+    patterns before it.  Matching is case-sensitive, as in hatchling.
+    """
+
+    __slots__ = ("_groups", "_regex", "_regexes", "patterns")
+
+    def __init__(self, patterns: list[str]) -> None:
+        self.patterns = list(patterns)
+        compiled = [t for t in map(translate, self.patterns) if t is not None]
+        # (regex, include, dir group) in pattern order, for directory matches.
+        self._regexes = [(re.compile(source), include, dir_group) for source, include, dir_group in compiled]
+        # Group number of each alternative of the joined regex -> pattern position.
+        self._groups: dict[int, int] = {}
+        parts = []
+        group = 1
+        for position in range(len(compiled) - 1, -1, -1):
+            source, _, dir_group = compiled[position]
+            self._groups[group] = position
+            parts.append(f"({source})")
+            group += 2 if dir_group else 1
+        self._regex = re.compile("|".join(parts)) if parts else None
+
+    def __bool__(self) -> bool:
+        return self._regex is not None
+
+    def match(self, path: str) -> bool:
+        """Return True if *path* (relative, ``/``-separated) is matched and not negated."""
+        if self._regex is None:
+            return False
+        m = self._regex.match(path)
+        if m is None:
+            return False
+        group = m.lastindex
+        position = self._groups[group]
+        _, include, dir_group = self._regexes[position]
+        if not dir_group or m.start(group + 1) < 0:
+            return include
+        # The path only matched through a directory: a pattern before it
+        # naming the file itself takes precedence.
+        for regex, earlier_include, dir_group in reversed(self._regexes[:position]):
+            if (earlier := regex.match(path)) is not None and (not dir_group or earlier.start(1) < 0):
+                return earlier_include
+        return include
@@ -0,0 +1,225 @@
+"""Minimal zip central-directory reader used for wheel and zip-sdist listings."""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from collections.abc import Iterator
+
+from ._core import CheckDistError
+
+# Record layouts, see APPNOTE.TXT sections 4.3.12 - 4.3.16.
+_EOCD = struct.Struct("<4s4H2LH")
+_EOCD_SIG = b"PK\x05\x06"
+_ZIP64_LOCATOR = struct.Struct("<4sLQL")
+_ZIP64_LOCATOR_SIG = b"PK\x06\x07"
+_ZIP64_EOCD = struct.Struct("<4sQ2H2L4Q")
+_ZIP64_EOCD_SIG = b"PK\x06\x06"
+_CENTRAL_HEADER = struct.Struct("<4s6H3L5H2L")
+_CENTRAL_HEADER_SIG = b"PK\x01\x02"
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_LOCAL_HEADER_SIG = b"PK\x03\x04"
+_ZIP64_EXTRA_ID = 0x0001
+_ENCRYPTED_FLAG = 0x1
+_UTF8_FLAG = 0x800
+_STORED = 0
+_DEFLATED = 8
+_MAX_COMMENT = 0xFFFF
+
+
+def _find_eocd(buf: mmap.mmap, path: str) -> int:
+    """Return the offset of the end-of-central-directory record."""
+    size = len(buf)
+    start = max(0, size - _EOCD.size - _MAX_COMMENT)
+    pos = buf.rfind(_EOCD_SIG, start)
+    # A stray signature inside the comment is possible; walk backwards
+    # until the record's comment length lines up with the end of file.
+    while pos != -1:
+        if pos + _EOCD.size <= size and pos + _EOCD.size + _EOCD.unpack_from(buf, pos)[-1] == size:
+            return pos
+        pos = buf.rfind(_EOCD_SIG, start, pos)
+    raise CheckDistError(f"Not a zip file (no end of central directory record): {path}")
+
+
+def _directory_bounds(buf: mmap.mmap, path: str) -> tuple[int, int, int, int]:
+    """Return ``(entry_count, start, end, shift)`` of the central directory.
+
+    *shift* is the number of bytes prepended to the archive.
+    """
+    eocd = _find_eocd(buf, path)
+    _, _, _, _, count, cd_size, cd_offset, _ = _EOCD.unpack_from(buf, eocd)
+    record_pos = eocd
+
+    locator = eocd - _ZIP64_LOCATOR.size
+    if locator >= 0 and buf[locator : locator + 4] == _ZIP64_LOCATOR_SIG:
+        _, _, zip64_offset, _ = _ZIP64_LOCATOR.unpack_from(buf, locator)
+        # The recorded offset is wrong when data was prepended to the
+        # archive; the Zip64 record always sits right before the locator.
+        record_pos = locator - _ZIP64_EOCD.size
+        if record_pos < 0 or buf[record_pos : record_pos + 4] != _ZIP64_EOCD_SIG:
+            record_pos = zip64_offset
+        if buf[record_pos : record_pos + 4] != _ZIP64_EOCD_SIG:
+            raise CheckDistError(f"Corrupt Zip64 end of central directory record: {path}")
+        fields = _ZIP64_EOCD.unpack_from(buf, record_pos)
+        count, cd_size, cd_offset = fields[7], fields[8], fields[9]
+
+    # Bytes prepended to the archive (e.g. self-extracting stubs) shift
+    # every recorded offset by the same amount.
+    start = record_pos - cd_size
+    if start < 0 or cd_offset > start:
+        raise CheckDistError(f"Corrupt zip central directory: {path}")
+    return count, start, record_pos, start - cd_offset
+
+
+def _zip64_fields(extra: bytes, size: int, csize: int, offset: int) -> tuple[int, int, int]:
+    """Return the real sizes and local header offset from a Zip64 extra field."""
+    pos = 0
+    while pos + 4 <= len(extra):
+        field_id, length = struct.unpack_from("<2H", extra, pos)
+        # Zip64 fields only appear for saturated header values, in the
+        # order uncompressed size, compressed size, local header offset.
+        if field_id == _ZIP64_EXTRA_ID:
+            values = iter(struct.unpack_from(f"<{min(length, len(extra) - pos - 4) // 8}Q", extra, pos + 4))
+            if size == 0xFFFFFFFF:
+                size = next(values, size)
+            if csize == 0xFFFFFFFF:
+                csize = next(values, csize)
+            if offset == 0xFFFFFFFF:
+                offset = next(values, offset)
+            break
+        pos += 4 + length
+    return size, csize, offset
+
+
+def _map(path: str) -> mmap.mmap:
+    with open(path, "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise CheckDistError(f"Not a zip file (empty): {path}") from None
+
+
+def _iter_entries(buf: mmap.mmap, path: str) -> Iterator[tuple[str, int, int, int, int, int, int]]:
+    """Yield ``(name, size, crc32, flags, method, compressed_size, local_header_offset)``.
+
+    Local header offsets are corrected for data prepended to the archive.
+    """
+    count, pos, end, shift = _directory_bounds(buf, path)
+    header_size = _CENTRAL_HEADER.size
+    unpack = _CENTRAL_HEADER.unpack_from
+    for _ in range(count):
+        if pos + header_size > end:
+            raise CheckDistError(f"Truncated zip central directory: {path}")
+        (sig, _, _, flags, method, _, _, crc, csize, size, name_len, extra_len, comment_len, _, _, _, offset) = unpack(buf, pos)
+        if sig != _CENTRAL_HEADER_SIG:
+            raise CheckDistError(f"Bad zip central directory entry at offset {pos}: {path}")
+        name_start = pos + header_size
+        raw_name = buf[name_start : name_start + name_len]
+        name = raw_name.decode("utf-8") if flags & _UTF8_FLAG else raw_name.decode("cp437")
+        if 0xFFFFFFFF in (size, csize, offset):
+            extra_start = name_start + name_len
+            size, csize, offset = _zip64_fields(buf[extra_start : extra_start + extra_len], size, csize, offset)
+        yield name, size, crc, flags, method, csize, offset + shift
+        pos = name_start + name_len + extra_len + comment_len
+
+
+def read_central_directory(path: str) -> list[tuple[str, int, int]]:
+    """Return ``(name, size, crc32)`` for every entry of the zip at *path*.
+
+    The file is memory-mapped and the central directory is parsed straight
+    from the buffer, without building ``ZipInfo`` objects or a name index.
+    Zip64 archives are supported.  Entries are returned in archive order
+    and directory entries (names ending in ``/``) are included.
+    """
+    with _map(path) as buf:
+        return [(name, size, crc) for name, size, crc, *_ in _iter_entries(buf, path)]
+
+
+class ZipReader:
+    """Read members of the zip at *path* through one shared memory map.
+
+    The central directory is parsed once; members are then located by
+    their recorded offsets and decompressed straight from the map, so any
+    number of threads can read concurrently without each re-opening the
+    archive.  Only stored and deflated members are supported, which is
+    all the wheel spec allows.  Every read error, including a CRC or size
+    mismatch, raises :class:`CheckDistError`.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._buf = _map(path)
+        try:
+            self._entries = {name: entry for name, *entry in _iter_entries(self._buf, path)}
+        except BaseException:
+            self._buf.close()
+            raise
+
+    def close(self) -> None:
+        self._buf.close()
+
+    def names(self) -> list[str]:
+        """Return the member names in archive order."""
+        return list(self._entries)
+
+    def _locate(self, name: str) -> tuple[int, int, int, int, int]:
+        """Return ``(size, crc32, method, start, end)`` of the data of *name*."""
+        try:
+            size, crc, flags, method, csize, offset = self._entries[name]
+        except KeyError:
+            raise CheckDistError(f"No member named '{name}': {self.path}") from None
+        if flags & _ENCRYPTED_FLAG:
+            raise CheckDistError(f"Member '{name}' is encrypted: {self.path}")
+        buf = self._buf
+        if offset < 0 or offset + _LOCAL_HEADER.size > len(buf) or buf[offset : offset + 4] != _LOCAL_HEADER_SIG:
+            raise CheckDistError(f"Bad local header for '{name}': {self.path}")
+        name_len, extra_len = _LOCAL_HEADER.unpack_from(buf, offset)[-2:]
+        start = offset + _LOCAL_HEADER.size + name_len + extra_len
+        if start + csize > len(buf):
+            raise CheckDistError(f"Truncated data for '{name}': {self.path}")
+        return size, crc, method, start, start + csize
+
+    def iter_chunks(self, name: str, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+        """Yield the uncompressed contents of member *name* in chunks.
+
+        No chunk is larger than *chunk_size*.  The CRC-32 and size are
+        checked once the member has been read completely.
+        """
+        import zlib
+
+        size, crc, method, start, end = self._locate(name)
+        if method == _DEFLATED:
+            inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+        elif method != _STORED:
+            raise CheckDistError(f"Unsupported compression method {method} for '{name}': {self.path}")
+        actual_crc = actual_size = 0
+        try:
+            for pos in range(start, end, chunk_size):
+                data = self._buf[pos : min(pos + chunk_size, end)]
+                while data:
+                    if method == _STORED:
+                        chunk, data = data, b""
+                    else:
+                        chunk = inflater.decompress(data, chunk_size)
+                        data = inflater.unconsumed_tail
+                    actual_crc = zlib.crc32(chunk, actual_crc)
+                    actual_size += len(chunk)
+                    yield chunk
+            if method == _DEFLATED:
+                chunk = inflater.flush()
+                if chunk:
+                    actual_crc = zlib.crc32(chunk, actual_crc)
+                    actual_size += len(chunk)
+                    yield chunk
+                if not inflater.eof:
+                    raise CheckDistError(f"Truncated compressed data for '{name}': {self.path}")
+        except zlib.error as exc:
+            raise CheckDistError(f"Corrupt compressed data for '{name}': {exc}: {self.path}") from None
+        if actual_size != size:
+            raise CheckDistError(f"Size mismatch for '{name}' (recorded {size}, read {actual_size}): {self.path}")
+        if actual_crc != crc:
+            raise CheckDistError(f"Bad CRC-32 for '{name}': {self.path}")
+
+    def read(self, name: str) -> bytes:
+        """Return the uncompressed contents of member *name*."""
+        return b"".join(self.iter_chunks(name))
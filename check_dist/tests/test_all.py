@@ -3,31 +3,47 @@
 from __future__ import annotations
 
 import io
+import os
+import pickle
+import shutil
 import subprocess
 import sys
 import tarfile
 import textwrap
 import zipfile
+from contextlib import closing
 from pathlib import Path
+from typing import ClassVar
 from unittest.mock import patch
 
 import pytest
 
+from check_dist._batch import ERRORED, FAILED, PASSED, _subtree, check_dist_many, format_batch_report
+from check_dist._cache import BuildCache, build_cache_key, cache_root
 from check_dist._core import (
     CheckDistError,
+    CheckDistResult,
+    PathIndex,
+    PatternSet,
+    ProjectContext,
     _filter_extras_by_hatch,
     _find_pre_built,
+    _load_toml,
     _matches_hatch_pattern,
     _module_name_from_project,
     _sdist_expected_files,
+    _vcs_pathspecs,
+    build_dists,
     check_absent,
     check_dist,
     check_present,
     check_sdist_vs_vcs,
     check_wrong_platform_extensions,
     copier_defaults,
+    find_all_dist_files,
     find_dist_files,
     get_vcs_files,
+    iter_sdist_files,
     list_sdist_files,
     list_wheel_files,
     load_config,
@@ -35,7 +51,24 @@ from check_dist._core import (
     load_hatch_config,
     matches_pattern,
     translate_extension,
+    wheel_platform,
 )
+from check_dist._events import FINDING, LISTED, PHASE_END, PHASE_START, Event
+from check_dist._findings import ABSENT, PRESENT, CheckResult, Finding, write_json
+from check_dist._frontend import BuildEnv, EnvPool, _file_lock, _Runner, build_dists_in_process, env_key, normalize_requires
+from check_dist._record import check_wheel_record
+from check_dist._state import CheckState
+from check_dist._timings import Phase, Timings
+from check_dist._watch import Watcher, _stat as _watch_stat
+from check_dist._wildmatch import WildMatchSpec
+from check_dist._zip import ZipReader, read_central_directory
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path_factory, monkeypatch):
+    """Keep the build cache out of the user's home directory."""
+    monkeypatch.setenv("CHECK_DIST_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+
 
 # ── translate_extension ───────────────────────────────────────────────
 
@@ -85,6 +118,35 @@ class TestTranslateExtension:
         with patch("check_dist._core._get_platform_key", return_value="win32"):
             assert translate_extension("*.so") == "*.pyd"
 
+    @pytest.mark.parametrize(
+        ("platform", "expected"),
+        [("win32", "*.pyd"), ("darwin", "*.so"), ("linux", "*.so"), ("freebsd14", "*.so")],
+    )
+    def test_explicit_platform(self, platform, expected):
+        assert translate_extension("*.so", platform) == expected
+
+
+class TestWheelPlatform:
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("pkg-1.0-cp312-cp312-win_amd64.whl", "win32"),
+            ("pkg-1.0-cp312-cp312-win32.whl", "win32"),
+            ("pkg-1.0-cp312-cp312-macosx_11_0_arm64.whl", "darwin"),
+            ("pkg-1.0-cp312-cp312-macosx_10_9_x86_64.macosx_11_0_arm64.whl", "darwin"),
+            ("pkg-1.0-cp312-cp312-manylinux_2_17_x86_64.manylinux2014_x86_64.whl", "linux"),
+            ("pkg-1.0-cp312-cp312-musllinux_1_2_aarch64.whl", "linux"),
+            ("pkg-1.0-1-cp312-cp312-linux_x86_64.whl", "linux"),
+            ("/wheelhouse/pkg-1.0-cp312-abi3-win_arm64.whl", "win32"),
+            ("pkg-1.0-py3-none-any.whl", None),
+            ("pkg-1.0-cp312-cp312-emscripten_3_1_58_wasm32.whl", None),
+            ("pkg-1.0.tar.gz", None),
+            ("not-a-wheel.whl", None),
+        ],
+    )
+    def test_platform_tags(self, filename, expected):
+        assert wheel_platform(filename) == expected
+
 
 # ── matches_pattern ───────────────────────────────────────────────────
 
@@ -131,6 +193,151 @@ class TestMatchesPattern:
         assert matches_pattern(".github/workflows/ci.yml", ".github")
 
 
+# ── PatternSet ────────────────────────────────────────────────────────
+
+
+class TestPatternSet:
+    FILES = (
+        "check_dist/__init__.py",
+        "check_dist_extra/foo.py",
+        "check_dist/tests/test_all.py",
+        "LICENSE",
+        "README.md",
+        "some/deep/path/setup.cfg",
+        ".github/workflows/ci.yml",
+        "a1.txt",
+        "ab.txt",
+        "mylib.pyd",
+        "pkg/ext.so",
+    )
+    PATTERNS = (
+        "check_dist",
+        "LICENSE",
+        "*.py",
+        "check_dist/*.py",
+        "setup.cfg",
+        ".github",
+        "a[0-9].txt",
+        "?.py",
+        "*.so",
+        "tests",
+        "missing",
+    )
+
+    def test_identical_to_matches_pattern(self):
+        pattern_set = PatternSet(self.PATTERNS)
+        for f in self.FILES:
+            expected = [i for i, p in enumerate(self.PATTERNS) if matches_pattern(f, p)]
+            assert pattern_set.match_indices(f) == expected, f
+            assert pattern_set.match_any(f) == bool(expected), f
+
+    @patch("check_dist._core._get_platform_key", return_value="win32")
+    def test_identical_to_matches_pattern_translated(self, _mock):
+        pattern_set = PatternSet(self.PATTERNS)
+        assert pattern_set.translated[self.PATTERNS.index("*.so")] == "*.pyd"
+        for f in self.FILES:
+            expected = [i for i, p in enumerate(self.PATTERNS) if matches_pattern(f, p)]
+            assert pattern_set.match_indices(f) == expected, f
+
+    def test_unmatched(self):
+        pattern_set = PatternSet(["check_dist", "missing", "*.md"])
+        assert pattern_set.unmatched(self.FILES) == [1]
+
+    def test_classify(self):
+        pattern_set = PatternSet([".github", "*.txt"])
+        buckets = pattern_set.classify(self.FILES)
+        assert buckets == [[".github/workflows/ci.yml"], ["a1.txt", "ab.txt"]]
+
+    def test_classify_exclude(self):
+        pattern_set = PatternSet(["*.py"])
+        buckets = pattern_set.classify(self.FILES, exclude=PatternSet(["check_dist"]))
+        assert buckets == [["check_dist_extra/foo.py"]]
+
+    @pytest.mark.parametrize("exclude", [["check_dist"], ["setup.cfg", "*.txt"], ["tests", "pkg"], ["?.py", "missing"]])
+    def test_classify_exclude_with_index(self, exclude):
+        exclude_set = PatternSet(exclude)
+        # With only glob patterns the index never builds its basename map.
+        for pattern_set in (PatternSet(self.PATTERNS), PatternSet(["*.py", "*.txt", "*.cfg"])):
+            indexed = pattern_set.classify(self.FILES, exclude=exclude_set, index=PathIndex(self.FILES))
+            assert indexed == [sorted(bucket) for bucket in pattern_set.classify(self.FILES, exclude=exclude_set)]
+
+    @pytest.mark.parametrize("platform", ["win32", "linux", "darwin"])
+    def test_classify_exclude_with_index_for_platform(self, platform):
+        files = ["libs/foo.pyd", "libs/foo.so", "libs/bar.dylib", "other.pyd", "pkg/mod.py"]
+        # A bare name alongside the globs makes the coverage recompile them.
+        present = ["pkg", "libs/*.so", "libs/*.dll"]
+        absent = ["*.pyd", "*.dylib"]
+        without_index = check_absent(files, absent, "wheel", present_patterns=present, platform=platform)
+        with_index = check_absent(files, absent, "wheel", present_patterns=present, index=PathIndex(files), platform=platform)
+        assert with_index == without_index
+        if platform == "win32":
+            assert with_index == ["wheel: unwanted pattern '*.pyd' matched: other.pyd"]
+
+    def test_empty(self):
+        pattern_set = PatternSet([])
+        assert not pattern_set
+        assert not pattern_set.match_any("anything")
+        assert pattern_set.match_indices("anything") == []
+        assert pattern_set.classify(self.FILES) == []
+
+
+# ── PathIndex ─────────────────────────────────────────────────────────
+
+
+class TestPathIndex:
+    FILES = (
+        "pkg/sub/mod.py",
+        "pkg/__init__.py",
+        "pkg.cfg",
+        "pkg2/__init__.py",
+        "LICENSE",
+        "docs/LICENSE",
+        "docs/index.md",
+    )
+
+    def test_files_sorted(self):
+        assert PathIndex(self.FILES).files == sorted(self.FILES)
+
+    def test_contains(self):
+        index = PathIndex(self.FILES)
+        assert "pkg.cfg" in index
+        assert "pkg" not in index
+
+    def test_is_dir(self):
+        index = PathIndex(self.FILES)
+        assert index.is_dir("pkg")
+        assert index.is_dir("pkg/sub")
+        assert not index.is_dir("pkg/__init__.py")
+        assert not index.is_dir("missing")
+
+    def test_under(self):
+        index = PathIndex(self.FILES)
+        assert index.under("pkg") == ["pkg/__init__.py", "pkg/sub/mod.py"]
+        assert index.under("pkg/sub") == ["pkg/sub/mod.py"]
+        assert index.under("LICENSE") == ["LICENSE"]
+        assert index.under("pkg/") == []
+        assert index.under("missing") == []
+
+    def test_with_basename(self):
+        index = PathIndex(self.FILES)
+        assert index.with_basename("LICENSE") == ["LICENSE", "docs/LICENSE"]
+        assert index.with_basename("__init__.py") == ["pkg/__init__.py", "pkg2/__init__.py"]
+
+    def test_matching_literal_agrees_with_matches_pattern(self):
+        index = PathIndex(self.FILES)
+        for name in ["pkg", "pkg/sub", "LICENSE", "docs", "pkg/", "index.md", "missing", "pkg.cfg"]:
+            expected = sorted(f for f in self.FILES if matches_pattern(f, name))
+            assert index.matching_literal(name) == expected, name
+
+    def test_checks_with_index(self):
+        index = PathIndex(self.FILES)
+        patterns = ["pkg", "LICENSE", "*.md", "missing", "*.rs"]
+        assert check_present(self.FILES, patterns, "sdist", index=index) == check_present(self.FILES, patterns, "sdist")
+        assert check_absent(sorted(self.FILES), patterns, "sdist", present_patterns=["docs"], index=index) == check_absent(
+            sorted(self.FILES), patterns, "sdist", present_patterns=["docs"]
+        )
+
+
 # ── check_present / check_absent ─────────────────────────────────────
 
 
@@ -266,6 +473,13 @@ class TestCheckWrongPlatformExtensions:
         errors = check_wrong_platform_extensions(files, "wheel")
         assert errors == []
 
+    def test_explicit_platform(self):
+        files = ["mypackage/ext.so", "mypackage/helper.dll"]
+        assert check_wrong_platform_extensions(files, "wheel", platform="win32") == [
+            "wheel: 'mypackage/ext.so' uses extension '.so' which is incorrect for win32 (expected '.pyd')"
+        ]
+        assert len(check_wrong_platform_extensions(files, "wheel", platform="darwin")) == 1
+
 
 # ── check_sdist_vs_vcs ───────────────────────────────────────────────
 
@@ -359,6 +573,72 @@ class TestMatchesHatchPattern:
     def test_basename_match(self):
         assert _matches_hatch_pattern("deep/Makefile", "Makefile")
 
+    def test_rooted_pattern_not_nested(self):
+        assert not _matches_hatch_pattern("vendor/rust/lib.rs", "/rust")
+
+    def test_star_does_not_cross_slash(self):
+        assert _matches_hatch_pattern("src/a.py", "src/*.py")
+        assert not _matches_hatch_pattern("src/sub/a.py", "src/*.py")
+
+    def test_double_star(self):
+        assert _matches_hatch_pattern("rust/src/deep/lib.rs", "/rust/**/*.rs")
+        assert _matches_hatch_pattern("rust/lib.rs", "/rust/**/*.rs")
+
+    def test_trailing_slash_matches_directories_only(self):
+        assert _matches_hatch_pattern("build/out.txt", "build/")
+        assert not _matches_hatch_pattern("build", "build/")
+
+    def test_case_sensitive(self):
+        assert not _matches_hatch_pattern("README.MD", "*.md")
+
+
+class TestWildMatchSpec:
+    def test_last_pattern_wins(self):
+        spec = WildMatchSpec(["*.py", "!test_*.py"])
+        assert spec.match("pkg/core.py")
+        assert not spec.match("pkg/test_core.py")
+        assert WildMatchSpec(["!test_*.py", "*.py"]).match("pkg/test_core.py")
+
+    def test_negated_directory_keeps_named_file(self):
+        # As in pathspec.GitIgnoreSpec, a pattern naming the file beats a
+        # later one matching it only through a parent directory.
+        spec = WildMatchSpec(["*.py", "!/pkg/tests"])
+        assert spec.match("pkg/tests/test_a.py")
+        assert not spec.match("pkg/tests/data.json")
+
+    def test_comments_blank_and_escapes(self):
+        spec = WildMatchSpec(["# comment", "", r"\#hash", r"\!bang"])
+        assert spec.match("#hash")
+        assert spec.match("!bang")
+        assert not spec.match("# comment")
+        assert not WildMatchSpec(["#", ""])
+
+    def test_brackets(self):
+        spec = WildMatchSpec(["file[0-9].txt", "[!a]b"])
+        assert spec.match("file3.txt")
+        assert not spec.match("fileX.txt")
+        assert spec.match("cb")
+        assert not spec.match("ab")
+
+    @pytest.mark.parametrize(
+        "patterns",
+        [
+            ["*.py", "!/pkg/tests", "tests/"],
+            ["/pkg", "!*.md", "docs/**/*.md"],
+            ["**/data/", "!**/data/keep.json", "a/**/b"],
+            ["*", "!*/", "pkg/*/"],
+            ["foo", "!foo/", "**/bar/**"],
+        ],
+    )
+    def test_agrees_with_pathspec(self, patterns):
+        pathspec = pytest.importorskip("pathspec")
+        reference = pathspec.GitIgnoreSpec.from_lines(patterns)
+        spec = WildMatchSpec(patterns)
+        names = ["pkg", "tests", "data", "foo", "bar", "a.py", "keep.json", "b", "README.md", "docs"]
+        paths = [f"{x}/{y}/{z}" for x in names for y in names for z in names] + [f"{x}/{y}" for x in names for y in names] + names
+        for path in paths:
+            assert spec.match(path) == reference.match_file(path), path
+
 
 class TestSdistExpectedFiles:
     """Covers hatch semantics: packages, include, exclude, only-include,
@@ -549,6 +829,92 @@ class TestSdistExpectedFiles:
         result = _sdist_expected_files(self.VCS, {"targets": {"sdist": {}}})
         assert result == set(self.VCS)
 
+    # ── sorted listings ──────────────────────────────────────────
+
+    def test_presorted_ranges(self):
+        vcs = ["pkg", "pkg-extra/a.py", "pkg.py", "pkg/a.py", "pkg/b/c.py", "pkg0/x"]
+        hatch = {"targets": {"sdist": {"packages": ["pkg/"], "force-include": {"x": "pkg0"}}}}
+        assert _sdist_expected_files(vcs, hatch, presorted=True) == {"pkg", "pkg/a.py", "pkg/b/c.py", "pkg0/x"}
+        assert _sdist_expected_files(list(reversed(vcs)), hatch) == {"pkg", "pkg/a.py", "pkg/b/c.py", "pkg0/x"}
+
+    def test_presorted_scales_with_paths_not_files(self):
+        class CountingList(list):
+            reads = 0
+
+            def __getitem__(self, key):
+                self.reads += 1
+                return super().__getitem__(key)
+
+            def __iter__(self):
+                raise AssertionError("the whole listing was scanned")
+
+        # 1M files, generated in sorted order.
+        vcs = CountingList(f"d{a:02d}/f{i:05d}.py" for a in range(100) for i in range(10_000))
+        hatch = {"targets": {"sdist": {"packages": ["d07"], "force-include": {"x": "d42/f00042.py"}}}}
+        result = _sdist_expected_files(vcs, hatch, presorted=True)
+        assert result == {f"d07/f{i:05d}.py" for i in range(10_000)} | {"d42/f00042.py"}
+        # A few binary searches per path, not one read per file.
+        assert vcs.reads < 200
+
+
+# ── VCS listing scope ────────────────────────────────────────────────
+
+
+class TestVcsPathspecs:
+    HATCH: ClassVar[dict] = {
+        "targets": {
+            "sdist": {
+                "packages": ["src/pkg"],
+                "force-include": {"../shared/data.json": "src/pkg/data.json", "extra/build.py": "build.py"},
+            }
+        }
+    }
+
+    def test_unrestricted_tree(self):
+        assert _vcs_pathspecs({}, ["pkg/__init__.py"]) is None
+
+    def test_scope(self):
+        sdist = ["PKG-INFO", "README.md", "pyproject.toml", "src/pkg/__init__.py", "stray/x.py"]
+        assert _vcs_pathspecs(self.HATCH, sdist) == [
+            "PKG-INFO",
+            "README.md",
+            "build.py",
+            "pyproject.toml",
+            "src",
+            "src/pkg",
+            "src/pkg/data.json",
+            "stray",
+        ]
+
+    def test_parent_paths_disable_scope(self):
+        assert _vcs_pathspecs({"targets": {"sdist": {"only-include": ["../other"]}}}, []) is None
+
+    def test_matches_unscoped_comparison(self, tmp_path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        _git(repo, "init")
+        tracked = [
+            "README.md",
+            "pyproject.toml",
+            "build.py",
+            "src/pkg/__init__.py",
+            "src/pkg/missing.py",
+            "src/other/x.py",
+            "docs/a.md",
+            "stray/x.py",
+        ]
+        for name in tracked:
+            (repo / name).parent.mkdir(parents=True, exist_ok=True)
+            (repo / name).write_text(name)
+        _git(repo, "add", ".")
+        sdist = ["PKG-INFO", "README.md", "pyproject.toml", "build.py", "src/pkg/__init__.py", "stray/x.py", "untracked.txt"]
+
+        full = get_vcs_files(str(repo))
+        scoped = get_vcs_files(str(repo), _vcs_pathspecs(self.HATCH, sdist))
+        assert "docs/a.md" not in scoped
+        expected = check_sdist_vs_vcs(sdist, full, self.HATCH)
+        assert expected and check_sdist_vs_vcs(sdist, scoped, self.HATCH) == expected
+
 
 # ── _filter_extras_by_hatch ──────────────────────────────────────────
 
@@ -691,6 +1057,70 @@ class TestLoadHatchConfig:
         assert cfg["targets"]["sdist"]["packages"] == ["mylib"]
 
 
+def _settle(*paths: Path) -> None:
+    """Backdate *paths* out of the window in which parses are not cached."""
+    for path in paths:
+        os.utime(path, (1_000_000_000, 1_000_000_000))
+
+
+class TestProjectContext:
+    def _project(self, tmp_path: Path) -> Path:
+        toml = tmp_path / "pyproject.toml"
+        toml.write_text(
+            textwrap.dedent("""\
+            [build-system]
+            requires = ["hatchling>=1.20"]
+            [tool.hatch.build.targets.wheel]
+            packages = ["mylib"]
+            [tool.check-dist]
+            present = ["mylib"]
+        """)
+        )
+        _settle(toml)
+        return toml
+
+    def test_parses_once(self, tmp_path):
+        toml = self._project(tmp_path)
+        with patch("check_dist._core._load_toml", wraps=_load_toml) as load:
+            project = ProjectContext.load(toml)
+            assert ProjectContext.load(toml) is project
+            load_config(toml)
+            load_hatch_config(toml)
+        assert load.call_count == 1
+        assert project.build_requires == ["hatchling>=1.20"]
+        assert project.hatch_config["targets"]["wheel"]["packages"] == ["mylib"]
+        assert project.config["wheel"]["present"] == ["mylib"]
+        # With a [tool.check-dist] section the copier answers are never read.
+        assert "copier_answers" not in vars(project)
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        toml = self._project(tmp_path)
+        project = ProjectContext.load(toml)
+        toml.write_text(toml.read_text().replace('present = ["mylib"]', 'present = ["mylib", "README.md"]'))
+        _settle(toml)
+        os.utime(toml, (2_000_000_000, 2_000_000_000))
+        assert ProjectContext.load(toml) is not project
+        assert load_config(toml)["sdist"]["present"] == ["mylib", "README.md"]
+
+    def test_copier_answers_are_part_of_the_key(self, tmp_path):
+        toml = tmp_path / "pyproject.toml"
+        toml.write_text("[project]\nname = 'foo'\n")
+        answers = tmp_path / ".copier-answers.yaml"
+        answers.write_text("add_extension: rust\nproject_name: my project\n")
+        _settle(toml, answers)
+        assert "rust" in load_config(toml, source_dir=tmp_path)["sdist"]["present"]
+        answers.write_text("add_extension: cpp\nproject_name: my project\n")
+        _settle(answers)
+        os.utime(answers, (2_000_000_000, 2_000_000_000))
+        assert "cpp" in load_config(toml, source_dir=tmp_path)["sdist"]["present"]
+
+    def test_recently_modified_file_is_not_cached(self, tmp_path):
+        toml = tmp_path / "pyproject.toml"
+        toml.write_text("[tool.check-dist]\npresent = ['a']\n")
+        project = ProjectContext.load(toml)
+        assert ProjectContext.load(toml) is not project
+
+
 # ── Copier defaults ──────────────────────────────────────────────────
 
 
@@ -718,6 +1148,11 @@ class TestLoadCopierConfig:
         assert cfg["add_extension"] == "rust"
         assert cfg["project_name"] == "my project"
 
+    def test_malformed_pyproject_is_not_parsed(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text("[project\nname = ")
+        (tmp_path / ".copier-answers.yaml").write_text("add_extension: cpp\nproject_name: foo\n")
+        assert load_copier_config(tmp_path) == {"add_extension": "cpp", "project_name": "foo"}
+
 
 class TestCopierDefaults:
     def test_cpp(self):
@@ -826,6 +1261,51 @@ class TestListSdistFiles:
             list_sdist_files(str(archive))
 
 
+class TestIterSdistFiles:
+    def test_tar_gz_names_and_sizes(self, tmp_path):
+        archive = tmp_path / "pkg-1.0.tar.gz"
+        with tarfile.open(archive, "w:gz") as tf:
+            directory = tarfile.TarInfo(name="pkg-1.0/src")
+            directory.type = tarfile.DIRTYPE
+            tf.addfile(directory)
+            for name, content in [
+                ("pkg-1.0/src/__init__.py", b"x = 1\n"),
+                ("pkg-1.0/pyproject.toml", b"[project]\n"),
+            ]:
+                info = tarfile.TarInfo(name=name)
+                info.size = len(content)
+                tf.addfile(info, io.BytesIO(content))
+
+        assert list(iter_sdist_files(str(archive))) == [("src/__init__.py", 6), ("pyproject.toml", 10)]
+
+    def test_tar_gz_does_not_retain_members(self, tmp_path):
+        archive = tmp_path / "pkg-1.0.tar.gz"
+        with tarfile.open(archive, "w:gz") as tf:
+            for i in range(50):
+                info = tarfile.TarInfo(name=f"pkg-1.0/data/{i}.bin")
+                info.size = 1024
+                tf.addfile(info, io.BytesIO(b"\0" * 1024))
+
+        retained = []
+        original_next = tarfile.TarFile.next
+
+        def spy(self):
+            retained.append(len(self.members))
+            return original_next(self)
+
+        with patch.object(tarfile.TarFile, "next", spy):
+            assert sum(1 for _ in iter_sdist_files(str(archive))) == 50
+        assert max(retained) <= 1
+
+    def test_zip_names_and_sizes(self, tmp_path):
+        archive = tmp_path / "pkg-1.0.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("pkg-1.0/src/", "")
+            zf.writestr("pkg-1.0/src/__init__.py", "x = 1\n")
+
+        assert list(iter_sdist_files(str(archive))) == [("src/__init__.py", 6)]
+
+
 # ── list_wheel_files ──────────────────────────────────────────────────
 
 
@@ -840,6 +1320,534 @@ class TestListWheelFiles:
         assert files == ["pkg-1.0.dist-info/METADATA", "pkg/__init__.py"]
 
 
+# ── read_central_directory ────────────────────────────────────────────
+
+
+class TestReadCentralDirectory:
+    @staticmethod
+    def _expected(path):
+        with zipfile.ZipFile(path) as zf:
+            return [(i.filename, i.file_size, i.CRC) for i in zf.infolist()]
+
+    def test_matches_zipfile(self, tmp_path):
+        archive = tmp_path / "pkg-1.0-py3-none-any.whl"
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("pkg/", "")
+            zf.writestr("pkg/__init__.py", "x = 1\n" * 100)
+            zf.writestr("pkg/données.txt", "unicode name")
+            zf.writestr("pkg-1.0.dist-info/RECORD", "")
+            zf.comment = b"archive comment"
+
+        assert read_central_directory(str(archive)) == self._expected(archive)
+
+    def test_signature_in_comment(self, tmp_path):
+        archive = tmp_path / "pkg-1.0-py3-none-any.whl"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("pkg/__init__.py", "")
+            zf.comment = b"PK\x05\x06 looks like an end record"
+
+        assert [e[0] for e in read_central_directory(str(archive))] == ["pkg/__init__.py"]
+
+    def test_zip64(self, tmp_path):
+        archive = tmp_path / "pkg-1.0-py3-none-any.whl"
+        # Lower the limits so zipfile writes Zip64 records for a tiny archive.
+        with patch.object(zipfile, "ZIP64_LIMIT", 4), patch.object(zipfile, "ZIP_FILECOUNT_LIMIT", 2), zipfile.ZipFile(archive, "w") as zf:
+            for i in range(5):
+                zf.writestr(f"pkg/mod{i}.py", f"value = {i}\n")
+        with open(archive, "rb") as f:
+            assert b"PK\x06\x06" in f.read()
+
+        assert read_central_directory(str(archive)) == self._expected(archive)
+
+    def test_prepended_data(self, tmp_path):
+        plain = tmp_path / "plain.zip"
+        with zipfile.ZipFile(plain, "w") as zf:
+            zf.writestr("a.txt", "a")
+        archive = tmp_path / "stub.zip"
+        archive.write_bytes(b"#!stub\n" * 10 + plain.read_bytes())
+
+        assert [e[0] for e in read_central_directory(str(archive))] == ["a.txt"]
+
+    def test_not_a_zip(self, tmp_path):
+        bogus = tmp_path / "bogus.whl"
+        bogus.write_bytes(b"not a zip file")
+        with pytest.raises(CheckDistError, match="Not a zip file"):
+            read_central_directory(str(bogus))
+
+    def test_empty_file(self, tmp_path):
+        empty = tmp_path / "empty.whl"
+        empty.touch()
+        with pytest.raises(CheckDistError, match="Not a zip file"):
+            read_central_directory(str(empty))
+
+
+# ── check_wheel_record ────────────────────────────────────────────────
+
+
+def _record_hash(content: bytes) -> str:
+    import base64
+    import hashlib
+
+    return "sha256=" + base64.urlsafe_b64encode(hashlib.sha256(content).digest()).rstrip(b"=").decode()
+
+
+def _make_wheel(path: Path, files: dict[str, bytes], *, record: str | None = None) -> Path:
+    """Write a wheel whose RECORD is generated from *files* unless given."""
+    if record is None:
+        lines = [f"{name},{_record_hash(content)},{len(content)}" for name, content in files.items()]
+        record = "\n".join([*lines, "pkg-1.0.dist-info/RECORD,,"]) + "\n"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, content in files.items():
+            zf.writestr(name, content)
+        zf.writestr("pkg-1.0.dist-info/RECORD", record)
+    return path
+
+
+class TestCheckWheelRecord:
+    FILES: ClassVar[dict[str, bytes]] = {
+        "pkg/__init__.py": b"x = 1\n",
+        "pkg/data.bin": bytes(range(256)) * 64,
+        "pkg-1.0.dist-info/METADATA": b"Metadata-Version: 2.1\n",
+    }
+
+    def test_valid(self, tmp_path):
+        wheel = _make_wheel(tmp_path / "pkg-1.0-py3-none-any.whl", self.FILES)
+        assert check_wheel_record(str(wheel)) == []
+
+    def test_valid_single_thread(self, tmp_path):
+        wheel = _make_wheel(tmp_path / "pkg-1.0-py3-none-any.whl", self.FILES)
+        assert check_wheel_record(str(wheel), jobs=1) == []
+
+    def test_hash_mismatch(self, tmp_path):
+        wheel = tmp_path / "pkg-1.0-py3-none-any.whl"
+        record = f"pkg/__init__.py,{_record_hash(b'other')},6\npkg-1.0.dist-info/RECORD,,\n"
+        _make_wheel(wheel, {"pkg/__init__.py": b"x = 1\n"}, record=record)
+        errors = check_wheel_record(str(wheel))
+        assert errors == ["wheel: RECORD hash mismatch for 'pkg/__init__.py'"]
+
+    def test_size_mismatch(self, tmp_path):
+        wheel = tmp_path / "pkg-1.0-py3-none-any.whl"
+        record = f"pkg/__init__.py,{_record_hash(b'x = 1' + bytes([10]))},99\npkg-1.0.dist-info/RECORD,,\n"
+        _make_wheel(wheel, {"pkg/__init__.py": b"x = 1\n"}, record=record)
+        errors = check_wheel_record(str(wheel))
+        assert len(errors) == 1
+        assert "size mismatch" in errors[0]
+
+    def test_unlisted_and_missing(self, tmp_path):
+        wheel = tmp_path / "pkg-1.0-py3-none-any.whl"
+        record = f"pkg/gone.py,{_record_hash(b'')},0\npkg-1.0.dist-info/RECORD,,\n"
+        _make_wheel(wheel, {"pkg/__init__.py": b""}, record=record)
+        errors = check_wheel_record(str(wheel))
+        assert "wheel: 'pkg/__init__.py' is not listed in RECORD" in errors
+        assert "wheel: RECORD lists 'pkg/gone.py' which is not in the wheel" in errors
+
+    def test_missing_hash(self, tmp_path):
+        wheel = tmp_path / "pkg-1.0-py3-none-any.whl"
+        _make_wheel(wheel, {"pkg/__init__.py": b""}, record="pkg/__init__.py,,\npkg-1.0.dist-info/RECORD,,\n")
+        assert check_wheel_record(str(wheel)) == ["wheel: RECORD has no hash for 'pkg/__init__.py'"]
+
+    def test_no_record(self, tmp_path):
+        wheel = tmp_path / "pkg-1.0-py3-none-any.whl"
+        with zipfile.ZipFile(wheel, "w") as zf:
+            zf.writestr("pkg/__init__.py", "")
+        errors = check_wheel_record(str(wheel))
+        assert len(errors) == 1
+        assert "RECORD" in errors[0]
+
+    @pytest.mark.parametrize(
+        "record",
+        [b"pkg/__init__.py,sha256=\xff\xfe,6\n", b'pkg/__init__.py,"sha256=abc,6\n'],
+        ids=["not-utf8", "bad-csv"],
+    )
+    def test_corrupt_record(self, tmp_path, record):
+        wheel = tmp_path / "pkg-1.0-py3-none-any.whl"
+        with zipfile.ZipFile(wheel, "w") as zf:
+            zf.writestr("pkg/__init__.py", "x = 1\n")
+            zf.writestr("pkg-1.0.dist-info/RECORD", record)
+        errors = check_wheel_record(str(wheel))
+        assert len(errors) == 1
+        assert errors[0].startswith("wheel: pkg-1.0.dist-info/RECORD is not valid UTF-8 CSV:")
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_corrupt_member(self, tmp_path, compression):
+        wheel = tmp_path / "pkg-1.0-py3-none-any.whl"
+        content = b"corrupt me " * 100
+        record = f"pkg/data.txt,{_record_hash(content)},{len(content)}\npkg-1.0.dist-info/RECORD,,\n"
+        with zipfile.ZipFile(wheel, "w", compression) as zf:
+            zf.writestr("pkg/data.txt", content)
+            zf.writestr("pkg-1.0.dist-info/RECORD", record)
+        with zipfile.ZipFile(wheel) as zf:
+            info = zf.getinfo("pkg/data.txt")
+        data = bytearray(wheel.read_bytes())
+        # Flip a byte in the middle of the member's data.
+        data[info.header_offset + 30 + len(info.filename) + info.compress_size // 2] ^= 0xFF
+        wheel.write_bytes(bytes(data))
+
+        errors = check_wheel_record(str(wheel), jobs=2)
+        assert len(errors) == 1
+        assert errors[0].startswith("wheel: cannot read 'pkg/data.txt':")
+
+
+class TestZipReader:
+    def test_matches_zipfile(self, tmp_path):
+        archive = tmp_path / "pkg-1.0-py3-none-any.whl"
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("pkg/__init__.py", "x = 1\n" * 1000)
+            zf.writestr("pkg/random.bin", os.urandom(5000))
+            zf.writestr("pkg/stored.txt", "stored", compress_type=zipfile.ZIP_STORED)
+            zf.writestr("pkg/empty.txt", "")
+        with zipfile.ZipFile(archive) as zf, closing(ZipReader(str(archive))) as reader:
+            assert reader.names() == zf.namelist()
+            for name in zf.namelist():
+                assert reader.read(name) == zf.read(name)
+                assert all(len(chunk) <= 100 for chunk in reader.iter_chunks(name, 100))
+
+    def test_prepended_data_and_zip64(self, tmp_path):
+        plain = tmp_path / "plain.zip"
+        with (
+            patch.object(zipfile, "ZIP64_LIMIT", 4),
+            patch.object(zipfile, "ZIP_FILECOUNT_LIMIT", 2),
+            zipfile.ZipFile(plain, "w", zipfile.ZIP_DEFLATED) as zf,
+        ):
+            for i in range(3):
+                zf.writestr(f"mod{i}.py", f"value = {i}\n")
+        archive = tmp_path / "stub.zip"
+        archive.write_bytes(b"#!stub\n" * 10 + plain.read_bytes())
+        with closing(ZipReader(str(archive))) as reader:
+            assert [reader.read(f"mod{i}.py") for i in range(3)] == [f"value = {i}\n".encode() for i in range(3)]
+
+    def test_missing_member(self, tmp_path):
+        archive = _make_wheel(tmp_path / "pkg-1.0-py3-none-any.whl", {})
+        with closing(ZipReader(str(archive))) as reader, pytest.raises(CheckDistError, match="No member named"):
+            reader.read("nope")
+
+
+# ── build_dists ───────────────────────────────────────────────────────
+
+
+class _FakeBuild:
+    """Stand-in for ``subprocess.run`` recording ``python -m build`` calls."""
+
+    def __init__(self, *, fail: tuple[str, ...] = (), barrier=None):
+        self.fail = fail
+        self.barrier = barrier
+        self.calls: list[tuple[str, ...]] = []
+
+    def __call__(self, cmd, **kwargs):
+        targets = tuple(a for a in cmd if a in ("--sdist", "--wheel"))
+        self.calls.append(targets)
+        if self.barrier is not None and len(targets) == 1:
+            # Both single-target builds must be in flight at the same time.
+            self.barrier.wait(timeout=5)
+        failed = any(t in self.fail for t in targets)
+        return subprocess.CompletedProcess(cmd, 1 if failed else 0, stdout="", stderr=f"{targets} failed" if failed else "")
+
+
+class TestBuildDists:
+    def test_combined_success(self):
+        fake = _FakeBuild()
+        with patch("subprocess.run", fake):
+            assert build_dists("src", "out") == []
+        assert fake.calls == [("--sdist", "--wheel")]
+
+    def test_no_isolation_flag(self):
+        seen = []
+        with patch("subprocess.run", lambda cmd, **kw: seen.append(cmd) or subprocess.CompletedProcess(cmd, 0)):
+            build_dists("src", "out", no_isolation=True)
+        cmd = seen[0]
+        assert cmd[cmd.index("--outdir") + 1] == "out"
+        assert "--no-isolation" in cmd
+        assert cmd[-1] == "src"
+
+    @staticmethod
+    def _project(tmp_path, backend):
+        (tmp_path / "pyproject.toml").write_text(f'[build-system]\nrequires = []\nbuild-backend = "{backend}"\n')
+        return str(tmp_path)
+
+    def test_fallback_runs_targets_concurrently(self, tmp_path):
+        import threading
+
+        fake = _FakeBuild(fail=("--wheel",), barrier=threading.Barrier(2))
+        with patch("subprocess.run", fake):
+            warnings = build_dists(self._project(tmp_path, "hatchling.build"), "out")
+        assert fake.calls[0] == ("--sdist", "--wheel")
+        assert sorted(fake.calls[1:]) == [("--sdist",), ("--wheel",)]
+        assert len(warnings) == 1
+        assert warnings[0].startswith("Warning: wheel build failed")
+
+    def test_parallel_skips_combined(self, tmp_path):
+        import threading
+
+        fake = _FakeBuild(barrier=threading.Barrier(2))
+        with patch("subprocess.run", fake):
+            assert build_dists(self._project(tmp_path, "hatchling.build"), "out", parallel=True) == []
+        assert sorted(fake.calls) == [("--sdist",), ("--wheel",)]
+
+    @pytest.mark.parametrize("backend", ["setuptools.build_meta", None])
+    def test_setuptools_builds_one_at_a_time(self, tmp_path, backend):
+        import threading
+        import time
+
+        if backend is None:
+            (tmp_path / "setup.py").write_text("")
+            source_dir = str(tmp_path)
+        else:
+            source_dir = self._project(tmp_path, backend)
+        running = []
+        overlapped = threading.Event()
+        fake = _FakeBuild()
+
+        def run(cmd, **kwargs):
+            # setuptools writes *.egg-info and build/ into the shared tree.
+            running.append(cmd)
+            if len(running) > 1:
+                overlapped.set()
+            time.sleep(0.05)
+            running.remove(cmd)
+            return fake(cmd, **kwargs)
+
+        with patch("subprocess.run", run):
+            assert build_dists(source_dir, "out", parallel=True) == []
+        assert fake.calls == [("--sdist",), ("--wheel",)]
+        assert not overlapped.is_set()
+
+    def test_all_failed(self):
+        fake = _FakeBuild(fail=("--sdist", "--wheel"))
+        with patch("subprocess.run", fake), pytest.raises(CheckDistError, match="Build failed"):
+            build_dists("src", "out")
+
+    def test_parallel_all_failed(self):
+        fake = _FakeBuild(fail=("--sdist", "--wheel"))
+        with patch("subprocess.run", fake), pytest.raises(CheckDistError, match="failed"):
+            build_dists("src", "out", parallel=True)
+
+
+# ── In-process build frontend ─────────────────────────────────────────
+
+_IN_TREE_BACKEND = """\
+import io
+import os
+import sys
+import tarfile
+import zipfile
+
+
+def build_sdist(sdist_directory, config_settings=None):
+    print("building sdist")
+    name = "pkg-1.0.tar.gz"
+    with tarfile.open(os.path.join(sdist_directory, name), "w:gz") as tf:
+        info = tarfile.TarInfo("pkg-1.0/pkg/__init__.py")
+        tf.addfile(info, io.BytesIO(b""))
+    return name
+
+
+def build_wheel(wheel_directory, config_settings=None, metadata_directory=None):
+    if os.environ.get("FAIL_WHEEL"):
+        print("no compiler found", file=sys.stderr)
+        raise RuntimeError("wheel build failed")
+    name = "pkg-1.0-py3-none-any.whl"
+    with zipfile.ZipFile(os.path.join(wheel_directory, name), "w") as zf:
+        zf.writestr("pkg/__init__.py", "")
+    return name
+"""
+
+
+def _make_backend_project(tmp_path: Path) -> Path:
+    proj = tmp_path / "backend-proj"
+    proj.mkdir()
+    (proj / "backend.py").write_text(_IN_TREE_BACKEND)
+    (proj / "pyproject.toml").write_text('[build-system]\nrequires = []\nbuild-backend = "backend"\nbackend-path = ["."]\n')
+    return proj
+
+
+class TestBuildDistsInProcess:
+    def test_builds_both(self, tmp_path):
+        proj = _make_backend_project(tmp_path)
+        out = tmp_path / "out"
+        out.mkdir()
+        lines = []
+        assert build_dists_in_process(str(proj), str(out), no_isolation=True, on_output=lines.append) == []
+        assert sorted(os.listdir(out)) == ["pkg-1.0-py3-none-any.whl", "pkg-1.0.tar.gz"]
+        assert "building sdist\n" in lines
+
+    def test_reports_failed_hook(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("FAIL_WHEEL", "1")
+        proj = _make_backend_project(tmp_path)
+        out = tmp_path / "out"
+        out.mkdir()
+        warnings = build_dists_in_process(str(proj), str(out), no_isolation=True)
+        assert len(warnings) == 1
+        assert "wheel build failed in hook 'build_wheel'" in warnings[0]
+        assert "no compiler found" in warnings[0]
+        assert os.listdir(out) == ["pkg-1.0.tar.gz"]
+
+    def test_missing_backend(self, tmp_path):
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        (proj / "pyproject.toml").write_text('[build-system]\nrequires = []\nbuild-backend = "no_such_backend"\n')
+        with pytest.raises(CheckDistError, match="get_requires_for_build_sdist"):
+            build_dists_in_process(str(proj), str(tmp_path), no_isolation=True)
+
+    @pytest.mark.parametrize(("version", "found"), [((22, 2), "pip 22.2"), (None, "not installed")])
+    def test_isolated_build_needs_pip_python(self, tmp_path, version, found):
+        proj = _make_backend_project(tmp_path)
+        with (
+            patch("check_dist._frontend._host_pip_version", return_value=version),
+            patch("check_dist._frontend.create_venv") as create_venv,
+            pytest.raises(CheckDistError, match=f"needs pip >= 22.3 \\({found}\\)"),
+        ):
+            build_dists_in_process(str(proj), str(tmp_path))
+        create_venv.assert_not_called()
+        # Without isolation nothing is installed, so pip does not matter.
+        with patch("check_dist._frontend._host_pip_version", return_value=version):
+            assert build_dists_in_process(str(proj), str(tmp_path), no_isolation=True) == []
+
+    @pytest.mark.slow
+    def test_isolated_env(self, tmp_path):
+        proj = _make_backend_project(tmp_path)
+        out = tmp_path / "out"
+        out.mkdir()
+        assert build_dists_in_process(str(proj), str(out)) == []
+        assert len(os.listdir(out)) == 2
+
+
+class TestEnvPool:
+    def test_normalize_requires(self):
+        assert normalize_requires(["Hatchling >= 1.20", "hatchling>=1.20", "zope.interface"]) == ["hatchling>=1.20", "zope-interface"]
+
+    def test_key_ignores_order_and_spelling(self):
+        assert env_key(["setuptools", "Wheel"]) == env_key(["wheel ", "setuptools"])
+        assert env_key(["setuptools"]) != env_key(["setuptools>=70"])
+
+    def test_reuses_environment(self, tmp_path):
+        pool = EnvPool(str(tmp_path))
+        with pool.acquire([], _Runner(None)) as first:
+            pass
+        ready = tmp_path / env_key([]) / ".check-dist-ready"
+        created = ready.stat().st_ino
+        with pool.acquire([], _Runner(None)) as second:
+            assert second.python == first.python
+        assert ready.stat().st_ino == created
+
+    def test_evicts_stale_environments(self, tmp_path):
+        pool = EnvPool(str(tmp_path), max_age=3600)
+        stale = tmp_path / "stale"
+        stale.mkdir()
+        (stale / ".check-dist-ready").touch()
+        os.utime(stale / ".check-dist-ready", (0, 0))
+        fresh = tmp_path / "fresh"
+        fresh.mkdir()
+        (fresh / ".check-dist-ready").touch()
+        pool.evict()
+        assert not stale.exists()
+        assert fresh.exists()
+
+    def test_locked_environment_not_evicted(self, tmp_path):
+        pool = EnvPool(str(tmp_path), max_age=0)
+        busy = tmp_path / "busy"
+        busy.mkdir()
+        os.utime(busy, (0, 0))
+        with _file_lock(str(busy) + ".lock"):
+            pool.evict()
+        assert busy.exists()
+
+    def test_evicts_orphaned_lock_files(self, tmp_path):
+        pool = EnvPool(str(tmp_path), max_age=3600)
+        stale = tmp_path / "stale"
+        stale.mkdir()
+        os.utime(stale, (0, 0))
+        (tmp_path / "stale.lock").touch()
+        orphan = tmp_path / "orphan.lock"
+        orphan.touch()
+        os.utime(orphan, (0, 0))
+        fresh = tmp_path / "fresh.lock"
+        fresh.touch()
+        pool.evict()
+        assert sorted(os.listdir(tmp_path)) == ["fresh.lock"]
+
+    def test_eviction_rechecks_age_under_lock(self, tmp_path):
+        from contextlib import contextmanager
+
+        pool = EnvPool(str(tmp_path), max_age=3600)
+        env_dir = tmp_path / "env"
+        env_dir.mkdir()
+        (env_dir / ".check-dist-ready").touch()
+        os.utime(env_dir / ".check-dist-ready", (0, 0))
+
+        @contextmanager
+        def used_meanwhile(path, **kwargs):
+            # Another job picks up the environment just before the lock.
+            (env_dir / ".check-dist-ready").touch()
+            with _file_lock(path, **kwargs) as locked:
+                yield locked
+
+        with patch("check_dist._frontend._file_lock", used_meanwhile):
+            pool.evict()
+        assert env_dir.exists()
+
+    def test_lock_follows_removed_file(self, tmp_path):
+        import threading
+
+        path = str(tmp_path / "env.lock")
+        acquired = threading.Event()
+
+        def wait_for_lock():
+            with _file_lock(path):
+                assert os.path.exists(path)
+                acquired.set()
+
+        with _file_lock(path):
+            waiter = threading.Thread(target=wait_for_lock)
+            waiter.start()
+            assert not acquired.wait(0.2)
+            os.remove(path)
+        waiter.join(5)
+        assert acquired.is_set()
+
+    def test_windows_blocking_lock_failure_raises(self, tmp_path, monkeypatch):
+        import types
+
+        def locking(fd, mode, nbytes):
+            if mode != msvcrt.LK_UNLCK:
+                raise OSError("deadlock avoided")
+
+        msvcrt = types.SimpleNamespace(LK_LOCK=1, LK_NBLCK=2, LK_UNLCK=0, locking=locking)
+        monkeypatch.setitem(sys.modules, "msvcrt", msvcrt)
+        monkeypatch.setattr(sys, "platform", "win32")
+        path = str(tmp_path / "env.lock")
+        with _file_lock(path, blocking=False) as locked:
+            assert not locked
+        with pytest.raises(CheckDistError, match="Timed out waiting for lock"), _file_lock(path):
+            pass
+
+    def test_build_requirements_do_not_leak_into_pool(self, tmp_path):
+        pool = EnvPool(str(tmp_path))
+        installed = []
+        with (
+            patch.object(BuildEnv, "install", lambda env, requirements, runner: installed.append((env.python, list(requirements)))),
+            pool.acquire(["hatchling"], _Runner(None)) as base,
+        ):
+            with base.extended(["Hatchling"], _Runner(None), distribution="wheel", hook="install") as same:
+                assert same is base
+            with base.extended(["wheel"], _Runner(None), distribution="wheel", hook="install") as extended:
+                assert extended.python != base.python
+        assert installed == [(base.python, ["hatchling"]), (extended.python, ["hatchling", "wheel"])]
+        assert (tmp_path / env_key(["hatchling", "wheel"]) / ".check-dist-ready").exists()
+
+    def test_find_links_installs_offline(self, tmp_path):
+        commands = []
+        env = BuildEnv("envpython", isolated=True, find_links=[str(tmp_path)])
+        env.install(["hatchling"], commands.append)
+        assert commands[0][-4:] == ["--no-index", "--find-links", str(tmp_path), "hatchling"]
+
+    def test_build_in_pooled_env(self, tmp_path):
+        proj = _make_backend_project(tmp_path)
+        out = tmp_path / "out"
+        out.mkdir()
+        assert build_dists_in_process(str(proj), str(out), reuse_env=True) == []
+        assert sorted(os.listdir(out)) == ["pkg-1.0-py3-none-any.whl", "pkg-1.0.tar.gz"]
+
+
 # ── find_dist_files ───────────────────────────────────────────────────
 
 
@@ -868,6 +1876,70 @@ class TestFindDistFiles:
         assert wheel is None
 
 
+class TestWheelhouse:
+    GOOD: ClassVar[dict[str, bytes]] = {"mypkg/__init__.py": b"x = 1\n", "pkg-1.0.dist-info/METADATA": b"Metadata-Version: 2.1\n"}
+
+    def test_find_all_dist_files(self, tmp_path):
+        for name in ("pkg-1.0-cp312-none-any.whl", "pkg-1.0-cp311-none-any.whl", "pkg-1.0.tar.gz", "notes.txt"):
+            (tmp_path / name).touch()
+        sdists, wheels = find_all_dist_files(str(tmp_path))
+        assert [os.path.basename(p) for p in sdists] == ["pkg-1.0.tar.gz"]
+        assert [os.path.basename(p) for p in wheels] == ["pkg-1.0-cp311-none-any.whl", "pkg-1.0-cp312-none-any.whl"]
+        assert find_all_dist_files(str(tmp_path / "missing")) == ([], [])
+
+    def test_checks_every_wheel(self, tmp_path):
+        proj = _make_project(tmp_path)
+        wheelhouse = tmp_path / "wheelhouse"
+        wheelhouse.mkdir()
+        _make_wheel(wheelhouse / "pkg-1.0-cp311-none-any.whl", self.GOOD)
+        # Same file listing as cp311, but RECORD does not match the contents.
+        _make_wheel(wheelhouse / "pkg-1.0-cp312-none-any.whl", self.GOOD, record="mypkg/__init__.py,sha256=bad,6\n")
+        _make_wheel(wheelhouse / "pkg-1.0-cp313-none-any.whl", {"other/__init__.py": b""})
+
+        success, messages = check_dist(str(proj), pre_built=str(wheelhouse))
+        combined = "\n".join(messages)
+        assert not success
+        assert "wheel (pkg-1.0-cp311-none-any.whl) – 3 file(s):" in combined
+        assert "wheel (pkg-1.0-cp312-none-any.whl) – same files as pkg-1.0-cp311-none-any.whl" in combined
+        assert "wheel pkg-1.0-cp313-none-any.whl: required pattern 'mypkg' not found" in combined
+        assert combined.count("required pattern 'mypkg' not found") == 1
+        assert "wheel pkg-1.0-cp312-none-any.whl: RECORD hash mismatch for 'mypkg/__init__.py'" in combined
+        assert "wheel pkg-1.0-cp311-none-any.whl: RECORD" not in combined
+
+    def test_cross_platform_wheelhouse(self, tmp_path):
+        proj = _make_project(tmp_path)
+        pp = proj / "pyproject.toml"
+        pp.write_text(
+            pp.read_text().replace('[tool.check-dist.wheel]\npresent = ["mypkg"]', '[tool.check-dist.wheel]\npresent = ["mypkg", "mypkg/*.so"]')
+        )
+        wheelhouse = tmp_path / "wheelhouse"
+        wheelhouse.mkdir()
+        linux = {"mypkg/__init__.py": b"", "mypkg/_ext.so": b"\x7fELF"}
+        windows = {"mypkg/__init__.py": b"", "mypkg/_ext.pyd": b"MZ"}
+        _make_wheel(wheelhouse / "pkg-1.0-cp312-cp312-manylinux_2_17_x86_64.whl", linux)
+        _make_wheel(wheelhouse / "pkg-1.0-cp312-cp312-macosx_11_0_arm64.whl", linux)
+        _make_wheel(wheelhouse / "pkg-1.0-cp312-cp312-win_amd64.whl", windows)
+
+        # Only the missing sdist is reported.
+        result = check_dist(str(proj), pre_built=str(wheelhouse))
+        assert [f.check for f in result.findings] == ["distributions"], "\n".join(result.messages)
+
+        # The same listings fail when every wheel is checked for one platform.
+        result = check_dist(str(proj), pre_built=str(wheelhouse), platform="win32")
+        combined = "\n".join(result.messages)
+        assert "'mypkg/_ext.so' uses extension '.so' which is incorrect for win32 (expected '.pyd')" in combined
+        assert "required pattern 'mypkg/*.so' not found (translated to 'mypkg/*.pyd' for win32)" in combined
+        assert "win_amd64.whl" not in combined.split("error(s) found:")[1]
+
+        # A Windows wheel with Linux extensions is caught on any host.
+        _make_wheel(wheelhouse / "pkg-1.0-cp312-cp312-win_amd64.whl", linux)
+        result = check_dist(str(proj), pre_built=str(wheelhouse))
+        assert {(f.check, f.dist_type, f.platform) for f in result.findings if f.check != "distributions"} == {
+            ("platform-extension", "wheel pkg-1.0-cp312-cp312-win_amd64.whl", "win32"),
+            ("present", "wheel pkg-1.0-cp312-cp312-win_amd64.whl", "win32"),
+        }
+
+
 class TestFindPreBuilt:
     def test_finds_in_dist(self, tmp_path):
         dist_dir = tmp_path / "dist"
@@ -901,6 +1973,27 @@ class TestFindPreBuilt:
 # ── get_vcs_files ─────────────────────────────────────────────────────
 
 
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(["git", "-c", "protocol.file.allow=always", *args], cwd=str(repo), capture_output=True, text=True, check=True).stdout
+
+
+def _ls_files(path: Path) -> list[str]:
+    return sorted(f for f in _git(path, "ls-files", "-z", "--recurse-submodules").split("\0") if f)
+
+
+def _make_index_repo(tmp_path: Path, count: int = 60) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir(parents=True)
+    _git(repo, "init")
+    for i in range(count):
+        path = repo / f"pkg{i % 3}" / ("sub" if i % 2 else "") / f"módulo_{i:03d}_{'x' * (i * 3)}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"x = {i}\n")
+    (repo / "top.txt").write_text("top\n")
+    _git(repo, "add", ".")
+    return repo
+
+
 class TestGetVcsFiles:
     def test_in_git_repo(self, tmp_path):
         """Integration test: create a real tiny git repo."""
@@ -914,6 +2007,188 @@ class TestGetVcsFiles:
         files = get_vcs_files(str(tmp_path))
         assert "hello.py" in files
 
+    def test_subdirectory(self, tmp_path):
+        repo = _make_index_repo(tmp_path)
+        assert get_vcs_files(str(repo / "pkg1")) == _ls_files(repo / "pkg1")
+
+    def test_pathspecs(self, tmp_path):
+        repo = _make_index_repo(tmp_path)
+        files = get_vcs_files(str(repo), ["pkg1/sub", "top.txt", "missing"])
+        assert files == [f for f in _ls_files(repo) if f.startswith("pkg1/sub/") or f == "top.txt"]
+        assert get_vcs_files(str(repo), []) == []
+
+    def test_literal_pathspecs(self, tmp_path):
+        repo = _make_index_repo(tmp_path, count=3)
+        (repo / "pkg[0]").mkdir()
+        (repo / "pkg[0]" / "x.py").write_text("")
+        _git(repo, "add", ".")
+        assert get_vcs_files(str(repo), ["pkg[0]"]) == ["pkg[0]/x.py"]
+
+    def test_submodules(self, tmp_path):
+        inner = _make_index_repo(tmp_path / "inner", count=3)
+        _git(inner, "-c", "user.name=T", "-c", "user.email=t@t", "commit", "-qm", "init")
+        outer = _make_index_repo(tmp_path / "outer", count=3)
+        _git(outer, "submodule", "add", "-q", str(inner), "vendored")
+        files = get_vcs_files(str(outer))
+        assert "vendored/top.txt" in files
+        assert files == _ls_files(outer)
+
+    def test_not_a_repository(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+        with pytest.raises(CheckDistError):
+            get_vcs_files(str(tmp_path))
+
+
+# ── Build cache ───────────────────────────────────────────────────────
+
+
+class TestBuildCache:
+    def test_cache_root_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CHECK_DIST_CACHE_DIR", str(tmp_path / "explicit"))
+        assert cache_root() == tmp_path / "explicit"
+        monkeypatch.delenv("CHECK_DIST_CACHE_DIR")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        assert cache_root() == tmp_path / "xdg" / "check-dist"
+
+    def test_key_tracks_inputs(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text('[build-system]\nrequires = ["hatchling"]\n')
+        (tmp_path / "mod.py").write_text("x = 1\n")
+        files = ["mod.py", "pyproject.toml"]
+        key = build_cache_key(str(tmp_path), files)
+        assert key == build_cache_key(str(tmp_path), files)
+        assert key != build_cache_key(str(tmp_path), files, no_isolation=True)
+
+        (tmp_path / "mod.py").write_text("x = 2\n")
+        assert key != build_cache_key(str(tmp_path), files)
+
+    def test_key_tracks_untracked_files(self, tmp_path):
+        (tmp_path / "mod.py").write_text("x = 1\n")
+        key = build_cache_key(str(tmp_path), ["mod.py"])
+        (tmp_path / "stray.txt").write_text("a\n")
+        stray = build_cache_key(str(tmp_path), ["mod.py"], untracked_files=["stray.txt"])
+        assert stray != key
+        (tmp_path / "stray.txt").write_text("b\n")
+        assert build_cache_key(str(tmp_path), ["mod.py"], untracked_files=["stray.txt"]) != stray
+
+    def test_untracked_file_invalidates_cached_build(self, tmp_path):
+        proj = _make_project(tmp_path)
+        (proj / ".gitignore").write_text("ignored.txt\n")
+        subprocess.run(["git", "add", ".gitignore"], cwd=str(proj), check=True)
+        subprocess.run(["git", "commit", "-qm", "ignore"], cwd=str(proj), check=True)
+        builds = []
+
+        def build(source_dir, output_dir, **options):
+            # Like hatchling: pack tracked and untracked, non-ignored files.
+            builds.append(source_dir)
+            listed = subprocess.run(
+                ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"], cwd=source_dir, capture_output=True, text=True, check=True
+            )
+            with tarfile.open(os.path.join(output_dir, "mypkg-0.0.1.tar.gz"), "w:gz") as tf:
+                for name in filter(None, listed.stdout.split("\0")):
+                    tf.add(os.path.join(source_dir, name), arcname=f"mypkg-0.0.1/{name}")
+            _make_wheel(Path(output_dir) / "mypkg-0.0.1-py3-none-any.whl", {"mypkg/__init__.py": b""})
+            return []
+
+        with patch("check_dist._core._build", side_effect=build):
+            assert check_dist(str(proj)).success
+            assert check_dist(str(proj)).success
+            assert len(builds) == 1
+            (proj / "ignored.txt").write_text("ignored\n")
+            assert check_dist(str(proj)).success
+            assert len(builds) == 1
+
+            (proj / "stray.txt").write_text("stray\n")
+            result = check_dist(str(proj))
+        assert len(builds) == 2
+        assert not result.success
+        assert [(f.check, list(f.paths)) for f in result.findings] == [("untracked", ["stray.txt"])]
+
+    def test_key_covers_only_scoped_files(self, tmp_path):
+        proj = _make_project(tmp_path)
+        builds = []
+
+        def build(source_dir, output_dir, **options):
+            builds.append(source_dir)
+            return _fake_build(source_dir, output_dir)
+
+        with patch("check_dist._core._build", side_effect=build), patch("check_dist._core.get_vcs_files", wraps=get_vcs_files) as ls_files:
+            assert check_dist(str(proj)).success
+            # Packages are ["mypkg"]: the key lists just that and the top-level files.
+            assert ls_files.call_args_list[0].args[1] == ["README.md", "mypkg", "pyproject.toml"]
+            (proj / "docs").mkdir()
+            (proj / "docs" / "index.md").write_text("outside the build\n")
+            _git(proj, "add", "docs")
+            check_dist(str(proj))
+            assert len(builds) == 1
+
+            _edit(proj / "mypkg" / "__init__.py", '__version__ = "0.0.1"\nx = 1\n')
+            check_dist(str(proj))
+            assert len(builds) == 2
+
+    def test_key_tracks_commit_and_tags(self, tmp_path):
+        proj = _make_project(tmp_path)
+        builds = []
+
+        def build(source_dir, output_dir, **options):
+            builds.append(source_dir)
+            return _fake_build(source_dir, output_dir)
+
+        with patch("check_dist._core._build", side_effect=build):
+            check_dist(str(proj))
+            check_dist(str(proj))
+            assert len(builds) == 1
+            # hatch-vcs and setuptools-scm derive the version from these.
+            _git(proj, "tag", "v1.0")
+            check_dist(str(proj))
+            assert len(builds) == 2
+            _git(proj, "commit", "-q", "--allow-empty", "-m", "next")
+            check_dist(str(proj))
+            assert len(builds) == 3
+
+    def test_key_tracks_requires(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text('[build-system]\nrequires = ["hatchling"]\n')
+        key = build_cache_key(str(tmp_path), [])
+        (tmp_path / "pyproject.toml").write_text('[build-system]\nrequires = ["hatchling>=1.20"]\n')
+        assert key != build_cache_key(str(tmp_path), [])
+
+    def test_put_and_get(self, tmp_path):
+        dist = tmp_path / "dist"
+        dist.mkdir()
+        (dist / "pkg-1.0.tar.gz").write_bytes(b"sdist")
+        (dist / "pkg-1.0-py3-none-any.whl").write_bytes(b"wheel")
+        (dist / "build.log").write_text("ignored")
+        cache = BuildCache(tmp_path / "cache")
+
+        assert cache.get("abc") is None
+        entry = cache.put("abc", str(dist))
+        assert cache.get("abc") == entry
+        assert sorted(os.listdir(entry)) == ["pkg-1.0-py3-none-any.whl", "pkg-1.0.tar.gz"]
+
+    def test_lru_eviction(self, tmp_path):
+        dist = tmp_path / "dist"
+        dist.mkdir()
+        (dist / "pkg-1.0.tar.gz").write_bytes(b"x" * 100)
+        cache = BuildCache(tmp_path / "cache")
+        for i, key in enumerate(["old", "used", "new"]):
+            cache.put(key, str(dist))
+            os.utime(cache.root / key, (1000 + i, 1000 + i))
+        # Touch "old" so it becomes most recently used, then overflow.
+        os.utime(cache.root / "old", (2000, 2000))
+        cache.max_bytes = 250
+        cache.evict()
+        assert cache.get("old") is not None
+        assert cache.get("new") is not None
+        assert cache.get("used") is None
+
+    def test_concurrent_put_keeps_first(self, tmp_path):
+        dist = tmp_path / "dist"
+        dist.mkdir()
+        (dist / "pkg-1.0.tar.gz").write_bytes(b"sdist")
+        cache = BuildCache(tmp_path / "cache")
+        first = cache.put("abc", str(dist))
+        assert cache.put("abc", str(dist)) == first
+        assert [p.name for p in cache.root.iterdir()] == ["abc"]
+
 
 # ── Integration: check_dist ──────────────────────────────────────────
 
@@ -992,6 +2267,26 @@ class TestCheckDistIntegration:
         assert not success, combined
         assert "CHANGELOG.md" in combined
 
+    @pytest.mark.slow
+    def test_second_run_uses_cache(self, tmp_path):
+        proj = _make_project(tmp_path)
+        success, messages = check_dist(str(proj))
+        assert success, "\n".join(messages)
+        assert "Building distributions..." in messages
+
+        success, messages = check_dist(str(proj))
+        assert success, "\n".join(messages)
+        assert any(m.startswith("Using cached distributions") for m in messages)
+
+        success, messages = check_dist(str(proj), use_cache=False)
+        assert "Building distributions..." in messages
+
+    @pytest.mark.slow
+    def test_in_process_build(self, tmp_path):
+        proj = _make_project(tmp_path)
+        success, messages = check_dist(str(proj), no_isolation=True, in_process_build=True, use_cache=False)
+        assert success, "\n".join(messages)
+
     @pytest.mark.slow
     def test_verbose_lists_files(self, tmp_path):
         proj = _make_project(tmp_path)
@@ -1001,6 +2296,494 @@ class TestCheckDistIntegration:
         assert "mypkg/__init__.py" in combined
 
 
+# ── Batch mode ────────────────────────────────────────────────────────
+
+
+def _make_monorepo(tmp_path: Path, names: tuple[str, ...] = ("a", "b")) -> Path:
+    """Create one git repository holding a project per name under packages/."""
+    root = tmp_path / "mono"
+    for name in names:
+        proj = _make_project(tmp_path / name)
+        shutil.rmtree(proj / ".git")
+        shutil.copytree(proj, root / "packages" / name)
+    subprocess.run(["git", "init", str(root)], capture_output=True, check=True)
+    subprocess.run(["git", "add", "."], cwd=str(root), capture_output=True, check=True)
+    return root
+
+
+class TestBatch:
+    def test_subtree(self):
+        files = ["a/x.py", "a0.py", "a/b/y.py", "ab/z.py", "top.py"]
+        assert _subtree(sorted(files), "a") == ["b/y.py", "x.py"]
+        assert _subtree(sorted(files), "") == sorted(files)
+        assert _subtree(sorted(files), "missing") == []
+
+    def test_one_vcs_listing_per_repository(self, tmp_path):
+        root = _make_monorepo(tmp_path)
+        dirs = [str(root / "packages" / "a"), str(root / "packages" / "b")]
+        seen = []
+
+        def fake_check_dist(source_dir, *, vcs_files, **options):
+            seen.append(vcs_files)
+            return True, []
+
+        with patch("check_dist._batch.get_vcs_files", wraps=get_vcs_files) as ls_files, patch("check_dist._batch.check_dist", fake_check_dist):
+            results = check_dist_many(dirs, jobs=1)
+        assert ls_files.call_count == 1
+        assert seen == [get_vcs_files(d) for d in dirs]
+        assert [status for _, status, _ in results] == [PASSED, PASSED]
+
+    def test_error_is_reported_per_project(self, tmp_path):
+        def fake_check_dist(source_dir, **options):
+            if source_dir.endswith("bad"):
+                raise CheckDistError("Build failed")
+            return False, ["ERROR: missing"]
+
+        with patch("check_dist._batch.check_dist", fake_check_dist):
+            results = check_dist_many([str(tmp_path / "ok"), str(tmp_path / "bad")], jobs=1)
+        assert [status for _, status, _ in results] == [FAILED, ERRORED]
+        report = format_batch_report(results)
+        assert "2 project(s): 0 passed, 1 failed, 1 error(s)" in report
+        assert f"  ERROR {tmp_path / 'bad'}" in report
+
+    def test_unexpected_error_is_reported_per_project(self, tmp_path):
+        def fake_check_dist(source_dir, **options):
+            if source_dir.endswith("bad"):
+                raise ValueError("unexpected")
+            return True, []
+
+        with patch("check_dist._batch.check_dist", fake_check_dist):
+            results = check_dist_many([str(tmp_path / "bad"), str(tmp_path / "ok")], jobs=1)
+        assert results == [(str(tmp_path / "bad"), ERRORED, ["Error: ValueError: unexpected"]), (str(tmp_path / "ok"), PASSED, [])]
+
+    def test_worker_failure_is_reported_per_project(self, tmp_path):
+        dirs = [str(tmp_path / "a"), str(tmp_path / "b")]
+        # Options that cannot be sent to the workers fail every project
+        # without losing the batch.
+        results = check_dist_many(dirs, jobs=2, on_message=lambda message: None)
+        assert [(d, status) for d, status, _ in results] == [(dirs[0], ERRORED), (dirs[1], ERRORED)]
+        assert all(messages[0].startswith("Error: ") for _, _, messages in results)
+
+    @pytest.mark.slow
+    def test_process_pool(self, tmp_path):
+        root = _make_monorepo(tmp_path)
+        dirs = [str(root / "packages" / "a"), str(root / "packages" / "b")]
+        results = check_dist_many(dirs, jobs=2, no_isolation=True, use_cache=False)
+        assert [(d, status) for d, status, _ in results] == [(dirs[0], PASSED), (dirs[1], PASSED)], results
+
+    def test_cli_requires_batch_for_many_dirs(self, tmp_path):
+        result = subprocess.run([sys.executable, "-m", "check_dist._cli", "a", "b"], capture_output=True, text=True, check=False)
+        assert result.returncode == 2
+        assert "--batch" in result.stderr
+
+
+# ── Watch mode ────────────────────────────────────────────────────────
+
+
+def _fake_build(source_dir, output_dir, **options):
+    """Stand-in for a real build: package the project's tracked files."""
+    with tarfile.open(os.path.join(output_dir, "mypkg-0.0.1.tar.gz"), "w:gz") as tf:
+        for name in ("mypkg/__init__.py", "pyproject.toml", "README.md"):
+            tf.add(os.path.join(source_dir, name), arcname=f"mypkg-0.0.1/{name}")
+    _make_wheel(Path(output_dir) / "mypkg-0.0.1-py3-none-any.whl", {"mypkg/__init__.py": Path(source_dir, "mypkg/__init__.py").read_bytes()})
+    return []
+
+
+def _edit(path: Path, text: str) -> None:
+    path.write_text(text)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+class TestWatcher:
+    def test_config_change_reuses_build(self, tmp_path):
+        proj = _make_project(tmp_path)
+        watcher = Watcher(str(proj), rebuild=True)
+        try:
+            with patch("check_dist._watch._build", side_effect=_fake_build):
+                success, messages = watcher.poll()
+                assert success, "\n".join(messages)
+                assert watcher.poll() is None
+
+                pyproject = proj / "pyproject.toml"
+                _edit(pyproject, pyproject.read_text().replace('present = ["mypkg"]', 'present = ["mypkg", "mypkg/py.typed"]'))
+                success, messages = watcher.poll()
+                assert not success
+                assert "  ERROR: wheel: required pattern 'mypkg/py.typed' not found" in messages
+                assert watcher.builds == 1
+
+                # A stat-only rewrite of the git index does not rebuild.
+                subprocess.run(["git", "update-index", "--really-refresh"], cwd=str(proj), capture_output=True, check=False)
+                os.utime(proj / ".git" / "index")
+                watcher.poll()
+                assert watcher.builds == 1
+
+                _edit(proj / "mypkg" / "__init__.py", '__version__ = "0.0.2"\n')
+                watcher.poll()
+                assert watcher.builds == 2
+        finally:
+            watcher.close()
+
+    def test_untracked_file_rebuilds(self, tmp_path):
+        proj = _make_project(tmp_path)
+        (proj / ".gitignore").write_text("*.log\n")
+        watcher = Watcher(str(proj), rebuild=True)
+        try:
+            with patch("check_dist._watch._build", side_effect=_fake_build):
+                watcher.poll()
+                assert watcher.builds == 1
+
+                # Ignored files do not count, even though the directory changed.
+                (proj / "mypkg" / "debug.log").write_text("")
+                os.utime(proj / "mypkg", ns=(0, (proj / "mypkg").stat().st_mtime_ns + 10**9))
+                watcher.poll()
+                assert watcher.builds == 1
+
+                (proj / "mypkg" / "new.py").write_text("")
+                os.utime(proj / "mypkg", ns=(0, (proj / "mypkg").stat().st_mtime_ns + 10**9))
+                watcher.poll()
+                assert watcher.builds == 2
+
+                # Untracked files are watched like tracked ones.
+                _edit(proj / "mypkg" / "new.py", "x = 1\n")
+                watcher.poll()
+                assert watcher.builds == 3
+        finally:
+            watcher.close()
+
+    def test_scan_interval_scales_with_scan_cost(self, tmp_path):
+        proj = _make_project(tmp_path)
+        watcher = Watcher(str(proj), pre_built=str(_pre_built(tmp_path, proj)))
+        watcher.poll()
+        assert watcher.scan_interval == 0.25
+        watcher._scan_seconds = 0.1
+        assert watcher.scan_interval == pytest.approx(2.0)
+
+    def test_quick_poll_checks_only_inputs(self, tmp_path):
+        proj = _make_project(tmp_path)
+        watcher = Watcher(str(proj), pre_built=str(_pre_built(tmp_path, proj)))
+        watcher.poll()
+
+        # Tree edits wait for the next full scan...
+        _edit(proj / "mypkg" / "__init__.py", "x = 2\n")
+        with patch("check_dist._watch._stat", wraps=_watch_stat) as stat:
+            assert watcher.poll(full=False) is None
+        assert stat.call_count == 5  # four input files and the git index
+
+        # ...but configuration edits show up straight away.
+        pyproject = proj / "pyproject.toml"
+        _edit(pyproject, pyproject.read_text().replace('present = ["mypkg"]', 'present = ["mypkg", "mypkg/py.typed"]'))
+        success, messages = watcher.poll(full=False)
+        assert not success
+        assert "  ERROR: wheel: required pattern 'mypkg/py.typed' not found" in messages
+
+    def test_pre_built_relists_changed_archives_only(self, tmp_path):
+        proj = _make_project(tmp_path)
+        wheelhouse = tmp_path / "wheelhouse"
+        wheelhouse.mkdir()
+        wheel = _make_wheel(wheelhouse / "mypkg-0.0.1-py3-none-any.whl", {"mypkg/__init__.py": b""})
+        watcher = Watcher(str(proj), pre_built=str(wheelhouse))
+        with patch("check_dist._zip.read_central_directory", wraps=read_central_directory) as read:
+            watcher.poll()
+            listed = read.call_count
+            _edit(proj / "pyproject.toml", (proj / "pyproject.toml").read_text() + "\n")
+            watcher.poll()
+            assert read.call_count == listed
+
+            _make_wheel(wheel, {"mypkg/__init__.py": b"", "mypkg/extra.py": b""})
+            os.utime(wheel, ns=(0, wheel.stat().st_mtime_ns + 10**9))
+            _, messages = watcher.poll()
+            assert read.call_count == listed + 1
+            assert "\nwheel (mypkg-0.0.1-py3-none-any.whl) – 3 file(s):" in messages
+
+
+# ── Incremental state ─────────────────────────────────────────────────
+
+
+def _pre_built(tmp_path: Path, proj: Path) -> Path:
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    _fake_build(str(proj), str(dist))
+    return dist
+
+
+class TestCheckState:
+    def test_second_run_reads_nothing(self, tmp_path):
+        proj = _make_project(tmp_path)
+        dist = _pre_built(tmp_path, proj)
+        first = check_dist(str(proj), pre_built=str(dist))
+        assert first[0], "\n".join(first[1])
+        with (
+            patch("check_dist._zip.read_central_directory") as read_wheel,
+            patch("check_dist._core.list_sdist_files") as read_sdist,
+            patch("check_dist._core.get_vcs_files") as ls_files,
+        ):
+            assert check_dist(str(proj), pre_built=str(dist)) == first
+        assert read_wheel.call_count == read_sdist.call_count == ls_files.call_count == 0
+
+    def test_config_change_rechecks_cached_listings(self, tmp_path):
+        proj = _make_project(tmp_path)
+        dist = _pre_built(tmp_path, proj)
+        check_dist(str(proj), pre_built=str(dist))
+        pyproject = proj / "pyproject.toml"
+        pyproject.write_text(pyproject.read_text().replace('present = ["mypkg"]', 'present = ["mypkg", "mypkg/py.typed"]'))
+        with patch("check_dist._zip.read_central_directory") as read_wheel, patch("check_dist._core.list_sdist_files") as read_sdist:
+            success, messages = check_dist(str(proj), pre_built=str(dist))
+        assert not success
+        assert "  ERROR: wheel: required pattern 'mypkg/py.typed' not found" in messages
+        assert read_wheel.call_count == read_sdist.call_count == 0
+
+    def test_index_change_relists_vcs(self, tmp_path):
+        proj = _make_project(tmp_path)
+        dist = _pre_built(tmp_path, proj)
+        assert check_dist(str(proj), pre_built=str(dist))[0]
+        (proj / "mypkg" / "extra.py").write_text("")
+        _git(proj, "add", "mypkg/extra.py")
+        success, messages = check_dist(str(proj), pre_built=str(dist))
+        assert not success
+        assert any("mypkg/extra.py" in m for m in messages), messages
+
+    def test_unreadable_state_starts_over(self, tmp_path):
+        proj = _make_project(tmp_path)
+        dist = _pre_built(tmp_path, proj)
+        state = CheckState(str(proj))
+        state.path.parent.mkdir(parents=True)
+        state.path.write_text("{not json")
+        assert check_dist(str(proj), pre_built=str(dist))[0]
+        assert CheckState(str(proj)).memo.previous
+
+    def test_only_used_entries_are_saved(self, tmp_path):
+        state = CheckState(str(tmp_path), root=tmp_path / "state")
+        state.memo[("list", "a", 1, 2, 3)] = ["x"]
+        state.memo[("vcs", "index", 1, 2, 3, "src", ("a", "b"))] = ["a/x"]
+        state.save()
+
+        state = CheckState(str(tmp_path), root=tmp_path / "state")
+        assert state.memo.get(("vcs", "index", 1, 2, 3, "src", ("a", "b"))) == ["a/x"]
+        state.save()
+        assert list(CheckState(str(tmp_path), root=tmp_path / "state").memo.previous) == [("vcs", "index", 1, 2, 3, "src", ("a", "b"))]
+
+
+# ── Timings ───────────────────────────────────────────────────────────
+
+
+class TestTimings:
+    def test_phases_are_recorded(self, tmp_path):
+        proj = _make_project(tmp_path)
+        dist = _pre_built(tmp_path, proj)
+        result = check_dist(str(proj), pre_built=str(dist))
+        success, messages = result
+        assert success and result.success
+        assert messages is result.messages
+        names = [phase.name for phase in result.timings.phases]
+        assert names[:2] == ["config", "discover"]
+        assert names[-1] == "total"
+        for name in ("list mypkg-0.0.1.tar.gz", "vcs listing", "check_sdist_vs_vcs (sdist)", "check_absent (wheel)", "check_wheel_record (wheel)"):
+            assert name in names
+        total = result.timings.phases[-1]
+        assert all(0 <= phase.wall <= total.wall for phase in result.timings.phases)
+
+        # Results reused from the previous run are not timed again.
+        names = [phase.name for phase in check_dist(str(proj), pre_built=str(dist)).timings.phases]
+        assert not [name for name in names if name.startswith(("list ", "check_"))]
+
+    def test_result_pickles(self):
+        timings = Timings()
+        with timings.phase("build"):
+            pass
+        result = pickle.loads(pickle.dumps(CheckDistResult(False, ["ERROR: x"], timings)))
+        assert result == (False, ["ERROR: x"])
+        assert [phase.name for phase in result.timings.phases] == ["build"]
+
+    def test_format(self):
+        timings = Timings()
+        timings.phases.extend([Phase("build", 12.5, 0.25), Phase("check_present (sdist)", 0.001, 0.001)])
+        assert timings.format() == [
+            "\nTimings                       wall        cpu",
+            "  build                    12.500s     0.250s",
+            "  check_present (sdist)     0.001s     0.001s",
+        ]
+
+    def test_cli_flag(self, tmp_path):
+        proj = _make_project(tmp_path)
+        dist = _pre_built(tmp_path, proj)
+        result = subprocess.run(
+            [sys.executable, "-m", "check_dist._cli", "--timings", "--pre-built", str(dist), str(proj)], capture_output=True, text=True, check=False
+        )
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "\nTimings " in result.stdout
+        assert "  total " in result.stdout
+
+
+# ── Structured results ────────────────────────────────────────────────
+
+
+class TestFindings:
+    def test_renders_like_check_functions(self):
+        files = ["pkg/a.py", "pkg/b.py", "pkg/c.txt"]
+        finding = Finding(ABSENT, "sdist", pattern="*.py", paths=["pkg/a.py", "pkg/b.py"])
+        assert check_absent(files, ["*.py"], "sdist") == [str(finding)]
+        assert str(Finding(PRESENT, "wheel", pattern="x.so", translated="x.pyd")) == (
+            f"wheel: required pattern 'x.so' not found (translated to 'x.pyd' for {sys.platform})"
+        )
+
+    def test_format_truncates_paths(self):
+        finding = Finding(ABSENT, "sdist", pattern="*.py", paths=[f"m{i}.py" for i in range(5)])
+        assert finding.format(2) == "sdist: unwanted pattern '*.py' matched: m0.py, m1.py, ... and 3 more"
+        assert finding.format(5) == str(finding)
+
+    def test_check_dist_results(self, tmp_path):
+        proj = _make_project(tmp_path)
+        dist = _pre_built(tmp_path, proj)
+        pyproject = proj / "pyproject.toml"
+        pyproject.write_text(pyproject.read_text().replace('absent = [".github"]', 'absent = ["*.md"]'))
+        result = check_dist(str(proj), pre_built=str(dist), max_paths=0)
+        assert not result.success
+        assert [(f.check, f.dist_type, f.pattern, list(f.paths)) for f in result.findings] == [
+            (ABSENT, "sdist", "*.md", ["README.md"]),
+        ]
+        assert "  ERROR: sdist: unwanted pattern '*.md' matched: ... and 1 more" in result.messages
+        assert {(r.check, r.dist_type) for r in result.results if r.passed} >= {(PRESENT, "sdist"), (PRESENT, "wheel")}
+
+    def test_results_survive_state_and_pickle(self, tmp_path):
+        results = [CheckResult(ABSENT, "sdist", [Finding(ABSENT, "sdist", pattern="*.py", paths=["a.py"])]), CheckResult(PRESENT, "wheel")]
+        state = CheckState(str(tmp_path), root=tmp_path / "state")
+        state.memo[("sdist-checks", "a", 1, 2, 3)] = results
+        state.save()
+        assert CheckState(str(tmp_path), root=tmp_path / "state").memo.get(("sdist-checks", "a", 1, 2, 3)) == results
+        assert pickle.loads(pickle.dumps(CheckDistResult(False, [], results=results))).results == results
+
+    def test_write_json(self):
+        import json
+
+        results = [CheckResult(ABSENT, "sdist", [Finding(ABSENT, "sdist", pattern="*.py", paths=["a.py", 'b"c.py'])]), CheckResult(PRESENT, "wheel")]
+        stream = io.StringIO()
+        write_json(False, results, stream)
+        assert json.loads(stream.getvalue()) == {"success": False, "results": [r.to_json() for r in results]}
+
+    def test_cli_json(self, tmp_path):
+        import json
+
+        proj = _make_project(tmp_path)
+        dist = _pre_built(tmp_path, proj)
+        result = subprocess.run(
+            [sys.executable, "-m", "check_dist._cli", "--format", "json", "--timings", "--pre-built", str(dist), str(proj)],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert result.returncode == 0, result.stdout + result.stderr
+        report = json.loads(result.stdout)
+        assert report["success"] is True
+        assert all(not r["findings"] for r in report["results"])
+        assert report["timings"][-1]["name"] == "total"
+
+
+# ── Progress events ───────────────────────────────────────────────────
+
+
+class TestEvents:
+    def test_timings_report_phases(self):
+        events = []
+        timings = Timings(events.append)
+        with timings.phase("a"):
+            pass
+        assert events[0] == Event(PHASE_START, "a")
+        assert events[1] == Event(PHASE_END, "a", timings.phases[0])
+
+    def test_on_message_streams_messages(self, tmp_path):
+        proj = _make_project(tmp_path)
+        dist = _pre_built(tmp_path, proj)
+        expected = check_dist(str(proj), pre_built=str(dist), verbose=True, use_cache=False).messages
+        streamed = []
+        result = check_dist(str(proj), pre_built=str(dist), verbose=True, use_cache=False, on_message=streamed.append)
+        assert result.success
+        assert result.messages == []
+        assert streamed == expected
+
+    def test_on_event(self, tmp_path):
+        proj = _make_project(tmp_path)
+        dist = _pre_built(tmp_path, proj)
+        pyproject = proj / "pyproject.toml"
+        pyproject.write_text(pyproject.read_text().replace('absent = [".github"]', 'absent = ["*.md"]'))
+        events = []
+        result = check_dist(str(proj), pre_built=str(dist), use_cache=False, on_event=events.append)
+        assert not result.success
+
+        assert [e.data for e in events if e.kind == FINDING] == result.findings
+        listed = {e.name: e.data for e in events if e.kind == LISTED}
+        assert sorted(listed) == sorted(os.listdir(dist))
+        assert all("mypkg/__init__.py" in files for files in listed.values())
+        # Every phase timed during the run was announced, and started before it ended.
+        started = [e.name for e in events if e.kind == PHASE_START]
+        ended = [e.data for e in events if e.kind == PHASE_END]
+        assert ended == [p for p in result.timings.phases if p.name != "total"]
+        assert sorted(started) == sorted(p.name for p in ended)
+        position = {(e.kind, e.name): i for i, e in enumerate(events)}
+        assert all(position[(PHASE_START, name)] < position[(PHASE_END, name)] for name in started)
+        assert pickle.loads(pickle.dumps(result)).findings == result.findings
+
+    def test_cli_prints_before_the_build_finishes(self, tmp_path, capsys):
+        from check_dist._cli import main
+
+        proj = _make_project(tmp_path)
+        printed = []
+
+        def build(*args, **kwargs):
+            printed.append(capsys.readouterr().out)
+            return _fake_build(*args[:2])
+
+        with patch("check_dist._core._build", side_effect=build), pytest.raises(SystemExit) as exc:
+            main([str(proj), "--rebuild", "--no-cache"])
+        assert exc.value.code == 0
+        assert printed == ["Building distributions...\n"]
+        assert "All checks passed!" in capsys.readouterr().out
+
+
+# ── Import time ───────────────────────────────────────────────────────
+
+# Modules only some code paths need; importing check_dist must not load them.
+_LAZY_MODULES = (
+    "concurrent.futures",
+    "hashlib",
+    "multiprocessing",
+    "subprocess",
+    "tarfile",
+    "tempfile",
+    "tomllib",
+    "venv",
+    "yaml",
+    "zipfile",
+)
+# Cumulative import time of check_dist with warm bytecode, in microseconds.
+_IMPORT_BUDGET_US = 50_000
+
+
+def _import_times(tmp_path: Path) -> dict[str, int]:
+    """Return the cumulative ``-X importtime`` of each module imported by ``import check_dist``."""
+    env = {**os.environ, "PYTHONPYCACHEPREFIX": str(tmp_path / "pycache")}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import check_dist"], capture_output=True, text=True, env=env, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime:
+    def test_heavy_modules_are_lazy(self, tmp_path):
+        imported = _import_times(tmp_path)
+        assert [m for m in _LAZY_MODULES if m in imported] == []
+
+    def test_within_budget(self, tmp_path):
+        _import_times(tmp_path)  # compile the bytecode once
+        best = min(_import_times(tmp_path)["check_dist"] for _ in range(3))
+        assert best < _IMPORT_BUDGET_US, f"import check_dist took {best / 1000:.1f} ms"
+
+
 # ── CLI smoke test ────────────────────────────────────────────────────
 
 